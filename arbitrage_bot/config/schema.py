@@ -20,6 +20,16 @@ class NotificationLevel(Enum):
     OFF = "off"
 
 
+# Notification categories with a per-category override on NotificationSettings
+NOTIFICATION_CATEGORIES = (
+    "startup", "warning", "scan_opportunity", "execution", "fill", "hedge",
+    "risk", "pnl_update", "strategy_msg", "show_snapshot",
+)
+
+# Marker in enabled_categories() meaning "categories without an override are on"
+WILDCARD_CATEGORY = "*"
+
+
 @dataclass
 class NotificationSettings:
     """Granular notification control."""
@@ -56,6 +66,19 @@ class NotificationSettings:
         level = self.get_level(category)
         return level == NotificationLevel.ON
     
+    def enabled_categories(self) -> frozenset:
+        """
+        Snapshot of categories that should notify.
+        
+        Includes WILDCARD_CATEGORY when default_level is ON, so callers can
+        resolve categories outside NOTIFICATION_CATEGORIES without
+        re-reading the settings.
+        """
+        enabled = {c for c in NOTIFICATION_CATEGORIES if self.should_notify(c)}
+        if self.default_level == NotificationLevel.ON:
+            enabled.add(WILDCARD_CATEGORY)
+        return frozenset(enabled)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -76,11 +99,7 @@ class NotificationSettings:
     def from_dict(cls, data: dict) -> "NotificationSettings":
         """Create from dictionary."""
         kwargs = {}
-        for field_name in [
-            "default_level", "startup", "warning", "scan_opportunity",
-            "execution", "fill", "hedge", "risk", "pnl_update",
-            "strategy_msg", "show_snapshot"
-        ]:
+        for field_name in ("default_level",) + NOTIFICATION_CATEGORIES:
             if field_name in data:
                 value = data[field_name]
                 if isinstance(value, str):
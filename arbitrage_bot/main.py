@@ -274,6 +274,7 @@ class TelegramControlledArbitrageBot:
             "on_mode_change": self._on_mode_change,
             "on_freeze": self._on_freeze,
             "on_unfreeze": self._on_unfreeze,
+            "on_reload_config": self._on_reload_config,
         }
     
     async def _on_bot_start(self, data):
@@ -314,6 +315,21 @@ class TelegramControlledArbitrageBot:
         target = data.get("target")
         logger.info(f"Unfreeze applied: {scope} {target}")
     
+    async def _on_reload_config(self, data):
+        """Callback when config reload is requested."""
+        config = TelegramConfigLoader.load_from_file(self.telegram_config_path, token=self.config.token)
+        if not config:
+            # Missing or invalid file: keep running on the current config
+            logger.error(f"Config reload from {self.telegram_config_path} failed, keeping current config")
+            await self.notifier.notify_warning("Config reload failed - keeping current config")
+            return
+        
+        self.config = config
+        # Updated in place: the handlers share this gate
+        self.auth_gate.set_authorized_users(config.authorized_users)
+        self.notifier.reload_settings(config.notification_settings)
+        logger.info("Telegram config reloaded")
+    
     async def process_message(self, text: str, user_id: str) -> str:
         """
         Process an incoming Telegram message.
@@ -13,7 +13,12 @@ from typing import Optional, List
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-from ..config.schema import NotificationSettings, NotificationLevel
+from ..config.schema import (
+    NOTIFICATION_CATEGORIES,
+    WILDCARD_CATEGORY,
+    NotificationSettings,
+    NotificationLevel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,10 +74,10 @@ class TelegramChannel(NotificationChannel):
                 topic_id=self.topic_id,
                 text=message,
             )
-            logger.debug(f"Notification sent: {category}")
+            logger.debug("Notification sent: %s", category)
             return True
         except Exception as e:
-            logger.error(f"Error sending notification: {e}")
+            logger.error("Error sending notification: %s", e)
             return False
 
 
@@ -85,7 +90,7 @@ class LogChannel(NotificationChannel):
     
     async def send(self, message: str, category: str) -> bool:
         """Log notification."""
-        self.logger.info(f"[{category}] {message}")
+        self.logger.info("[%s] %s", category, message)
         return True
 
 
@@ -113,6 +118,31 @@ class Notifier:
         self.channels = channels or [LogChannel()]
         self.sent_count = 0
         self.suppressed_count = 0
+        self._enabled_cats: frozenset = self._compute_enabled()
+    
+    def _compute_enabled(self) -> frozenset:
+        """Snapshot the categories currently allowed by settings."""
+        return self.settings.enabled_categories()
+    
+    def reload_settings(self, settings: Optional[NotificationSettings] = None):
+        """
+        Recompute the enabled-category snapshot.
+        
+        Must be called after settings change (e.g. /reload_config).
+        
+        Args:
+            settings: New settings to adopt; keeps current settings if None
+        """
+        if settings is not None:
+            self.settings = settings
+        self._enabled_cats = self._compute_enabled()
+    
+    def _is_enabled(self, category: str) -> bool:
+        """Check a category against the enabled snapshot."""
+        enabled = self._enabled_cats
+        if category in enabled:
+            return True
+        return WILDCARD_CATEGORY in enabled and category not in NOTIFICATION_CATEGORIES
     
     async def notify(
         self,
@@ -132,7 +162,7 @@ class Notifier:
             True if sent to any channel
         """
         # Check if notification is enabled
-        if not force and not self.settings.should_notify(category):
+        if not force and not self._is_enabled(category):
             self.suppressed_count += 1
             return False
         
@@ -143,7 +173,7 @@ class Notifier:
                 result = await channel.send(message, category)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Error in channel notification: {e}")
+                logger.error("Error in channel notification: %s", e)
                 results.append(False)
         
         success = any(results)
@@ -10,16 +10,16 @@ Prevents abuse and ensures safe operation by limiting:
 import logging
 from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
 
-class CommandRisk(Enum):
-    """Risk level of a command."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
+class CommandRisk(IntEnum):
+    """Risk level of a command (ordered, compares as a plain int)."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
 
 
 # Command risk classification
@@ -63,6 +63,9 @@ COMMAND_RISK = {
     "confirm": CommandRisk.HIGH,
 }
 
+# Risk assumed for commands missing from COMMAND_RISK
+DEFAULT_RISK = CommandRisk.MEDIUM
+
 
 class RateLimiter:
     """Rate limit command execution."""
@@ -106,33 +109,29 @@ class RateLimiter:
             (is_allowed, reason_if_denied)
         """
         now = datetime.utcnow()
-        risk = COMMAND_RISK.get(command, CommandRisk.MEDIUM)
+        risk = COMMAND_RISK.get(command, DEFAULT_RISK)
         
         # Clean old history
         self._cleanup_old_history(now)
         
         # Check global rate
         if not self._check_global_rate(command, now):
-            msg = f"Global rate limit exceeded for {command}"
-            logger.warning(msg)
+            logger.warning("Global rate limit exceeded for %s", command)
             return False, "⏱️ Rate limit exceeded. Try again later."
         
         # Check per-user rate
         if not self._check_per_user_rate(user_id, now):
-            msg = f"Per-user rate limit exceeded for {user_id}"
-            logger.warning(msg)
+            logger.warning("Per-user rate limit exceeded for %s", user_id)
             return False, "⏱️ You're sending commands too fast. Try again later."
         
         # Check risk-specific rate
         if risk == CommandRisk.HIGH:
             if not self._check_high_risk_rate(user_id, now):
-                msg = f"High-risk rate limit exceeded for {user_id}"
-                logger.warning(msg)
+                logger.warning("High-risk rate limit exceeded for %s", user_id)
                 return False, "⏱️ This action is rate-limited. Try again later."
         elif risk == CommandRisk.MEDIUM:
             if not self._check_medium_risk_rate(user_id, now):
-                msg = f"Medium-risk rate limit exceeded for {user_id}"
-                logger.warning(msg)
+                logger.warning("Medium-risk rate limit exceeded for %s", user_id)
                 return False, "⏱️ This action is rate-limited. Try again later."
         
         # Record this command
@@ -145,50 +144,74 @@ class RateLimiter:
         if command not in self.global_history:
             return True
         
-        recent = [
-            ts for ts in self.global_history[command]
-            if now - ts < timedelta(minutes=1)
-        ]
+        window = timedelta(minutes=1)
+        limit = self.global_rate
+        if limit <= 0:
+            return False
+        count = 0
+        for ts in self.global_history[command]:
+            if now - ts < window:
+                count += 1
+                if count >= limit:
+                    return False
         
-        return len(recent) < self.global_rate
+        return True
     
     def _check_per_user_rate(self, user_id: str, now: datetime) -> bool:
         """Check per-user rate limit."""
         if user_id not in self.user_history:
             return True
         
-        recent = [
-            ts for cmd, ts in self.user_history[user_id]
-            if now - ts < timedelta(minutes=1)
-        ]
+        window = timedelta(minutes=1)
+        limit = self.per_user_rate
+        if limit <= 0:
+            return False
+        count = 0
+        for cmd, ts in self.user_history[user_id]:
+            if now - ts < window:
+                count += 1
+                if count >= limit:
+                    return False
         
-        return len(recent) < self.per_user_rate
+        return True
     
     def _check_high_risk_rate(self, user_id: str, now: datetime) -> bool:
         """Check high-risk command rate."""
         if user_id not in self.user_history:
             return True
         
-        recent_high_risk = [
-            ts for cmd, ts in self.user_history[user_id]
-            if now - ts < timedelta(minutes=1)
-            and COMMAND_RISK.get(cmd, CommandRisk.MEDIUM) == CommandRisk.HIGH
-        ]
-        
-        return len(recent_high_risk) < self.high_risk_rate
+        return self._count_risk_below(
+            user_id, now, CommandRisk.HIGH, self.high_risk_rate
+        )
     
     def _check_medium_risk_rate(self, user_id: str, now: datetime) -> bool:
         """Check medium-risk command rate."""
         if user_id not in self.user_history:
             return True
         
-        recent_medium_risk = [
-            cmd for cmd, ts in self.user_history[user_id]
-            if now - ts < timedelta(minutes=1)
-            and COMMAND_RISK.get(cmd, CommandRisk.MEDIUM) == CommandRisk.MEDIUM
-        ]
+        return self._count_risk_below(
+            user_id, now, CommandRisk.MEDIUM, self.medium_risk_rate
+        )
+    
+    def _count_risk_below(
+        self,
+        user_id: str,
+        now: datetime,
+        risk: CommandRisk,
+        limit: int,
+    ) -> bool:
+        """True if the user ran fewer than `limit` commands of `risk` in the last minute."""
+        if limit <= 0:
+            return False
+        window = timedelta(minutes=1)
+        count = 0
+        for cmd, ts in self.user_history[user_id]:
+            if now - ts < window and COMMAND_RISK.get(cmd, DEFAULT_RISK) == risk:
+                count += 1
+                if count >= limit:
+                    return False
         
-        return len(recent_medium_risk) < self.medium_risk_rate
+        return True
     
     def _record_command(self, command: str, user_id: str, now: datetime):
         """Record a command execution."""
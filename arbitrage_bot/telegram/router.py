@@ -11,9 +11,9 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedCommand:
-    """Result of parsing a command."""
+    """Result of parsing a command (immutable once parsed)."""
     command: str
     args: List[str]
     raw_text: str
@@ -91,7 +91,7 @@ class CommandParser:
             return []
         
         args = []
-        current = ""
+        current: List[str] = []  # chars of the token being built
         in_quotes = False
         
         for char in args_text:
@@ -99,13 +99,13 @@ class CommandParser:
                 in_quotes = not in_quotes
             elif char == " " and not in_quotes:
                 if current:
-                    args.append(current)
-                    current = ""
+                    args.append("".join(current))
+                    current = []
             else:
-                current += char
+                current.append(char)
         
         if current:
-            args.append(current)
+            args.append("".join(current))
         
         return args
 
@@ -139,7 +139,7 @@ class CommandRouter:
         if help_text:
             self.help_texts[command.lower()] = help_text
         
-        logger.debug(f"Registered command: {command}")
+        logger.debug("Registered command: %s", command)
         return self
     
     async def route(self, parsed_cmd: ParsedCommand) -> str:
@@ -167,7 +167,7 @@ class CommandRouter:
             response = await handler(parsed_cmd)
             return response or "✅"
         except Exception as e:
-            logger.error(f"Error in command handler for {command}: {e}", exc_info=True)
+            logger.error("Error in command handler for %s: %s", command, e, exc_info=True)
             return f"❌ Error executing command. Check logs."
     
     def _fuzzy_match(self, command: str) -> Optional[str]:
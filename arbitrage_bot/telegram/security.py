@@ -23,6 +23,10 @@ class AuthorizationGate:
         Args:
             authorized_users: List of authorized user IDs
         """
+        self.set_authorized_users(authorized_users)
+    
+    def set_authorized_users(self, authorized_users: list):
+        """Replace the authorized user IDs (e.g. after /reload_config)."""
         self.authorized_users = set(str(uid) for uid in authorized_users)
     
     def is_authorized(self, user_id: str) -> bool:
@@ -81,10 +85,11 @@ class ConfirmationManager:
             "expiry": datetime.utcnow() + timedelta(seconds=self.expiry_seconds),
         }
         
-        logger.debug(
-            f"Confirmation created",
-            extra={"request_id": request_id, "user_id": user_id}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Confirmation created",
+                extra={"request_id": request_id, "user_id": user_id}
+            )
         
         return request_id, code
     
@@ -123,7 +128,7 @@ class ConfirmationManager:
         del self.pending[request_id]
         
         logger.info(
-            f"Confirmation verified",
+            "Confirmation verified",
             extra={"request_id": request_id, "user_id": user_id, "action": action}
         )
         
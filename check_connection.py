@@ -1,35 +1,73 @@
-import requests
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import urllib3
 
+from src._http import SESSION
+
 # Disable warnings for SSL bypass if needed
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def check_connection():
-    url = "https://clob.polymarket.com/time"
-    print(f"Testing connection to: {url}")
-    
+URLS = [
+    "https://clob.polymarket.com/time",
+    "https://clob.polymarket.com/markets?limit=1",
+    "https://gamma-api.polymarket.com/markets?limit=1",
+]
+
+
+def probe(url, timeout=10):
+    """Request one endpoint and return its status (or the error) as a dict."""
     try:
-        # We try without verify=False first to see if SSL works (if VPN handles it)
-        # If that fails, we can add verify=False logic, but for now standard check.
-        # Actually, let's use verify=False to rule out SSL issues and focus on the HTTP 451/200 status.
-        resp = requests.get(url, verify=False, timeout=10)
-        
-        print(f"Status Code: {resp.status_code}")
-        
-        if resp.status_code == 200:
-            print("✅ Connection SUCCESSFUL! You can access Polymarket.")
-        elif resp.status_code == 451:
-            print("❌ Connection BLOCKED (Legal Reasons/Geoblock).")
-            print("The Hellenic Gaming Commission or your ISP is blocking this site.")
-            print("You need a VPN enabled to proceed.")
-        elif resp.status_code == 403:
-            print("❌ Connection FORBIDDEN (403). Possible Cloudflare block or IP ban.")
-        else:
-            print(f"⚠️ Unexpected Status: {resp.status_code}")
-            print(resp.text[:200])
-            
+        # verify=False rules out SSL issues so we can focus on the HTTP 451/200 status
+        resp = SESSION.get(url, verify=False, timeout=timeout)
+        return {"url": url, "status": resp.status_code, "body": resp.text[:200], "error": None}
     except Exception as e:
-        print(f"❌ Connection FAILED: {e}")
+        return {"url": url, "status": None, "body": "", "error": str(e)}
+
+
+def _print_result(result):
+    print(f"Testing connection to: {result['url']}")
+    if result["error"] is not None:
+        print(f"❌ Connection FAILED: {result['error']}")
+        return
+
+    status = result["status"]
+    print(f"Status Code: {status}")
+
+    if status == 200:
+        print("✅ Connection SUCCESSFUL! You can access Polymarket.")
+    elif status == 451:
+        print("❌ Connection BLOCKED (Legal Reasons/Geoblock).")
+        print("The Hellenic Gaming Commission or your ISP is blocking this site.")
+        print("You need a VPN enabled to proceed.")
+    elif status == 403:
+        print("❌ Connection FORBIDDEN (403). Possible Cloudflare block or IP ban.")
+    else:
+        print(f"⚠️ Unexpected Status: {status}")
+        print(result["body"])
+
+
+def check_connection(urls=URLS, as_json=False):
+    """Probe all endpoints concurrently; return True if every one answered 200."""
+    # Probes are I/O-bound, so threads overlap the round trips
+    with ThreadPoolExecutor(max_workers=len(urls) or 1) as pool:
+        results = list(pool.map(probe, urls))
+
+    if as_json:
+        print(json.dumps(results, indent=2))
+    else:
+        for i, result in enumerate(results):
+            if i:
+                print()
+            _print_result(result)
+
+    return all(r["status"] == 200 for r in results)
+
 
 if __name__ == "__main__":
-    check_connection()
+    parser = argparse.ArgumentParser(description="Check connectivity to Polymarket APIs")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+    sys.exit(0 if check_connection(as_json=args.json) else 1)
@@ -1,18 +1,60 @@
-import json
+import os
 import sys
+from collections import deque
+sys.path.insert(0, 'src')
+
+from predarb import fastjson
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+REPORT_PATH = 'reports/unified_report.json'
+# Iterations recorded since the report's last snapshot
+ITERATIONS_LOG_PATH = 'reports/unified_report.jsonl'
+# Below this size a whole-document parse is faster than streaming
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def iter_iterations(path, log_path=ITERATIONS_LOG_PATH):
+    """Yield iteration records.
+
+    Reads the JSON report, streaming large files when ijson is installed,
+    then any iterations still pending in the JSONL log.
+    """
+    if ijson is not None and os.path.getsize(path) >= STREAM_THRESHOLD_BYTES:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'iterations.item', use_float=True)
+    else:
+        with open(path, 'rb') as f:
+            data = fastjson.loads(f.read())
+        yield from data.get('iterations', [])
+    if os.path.exists(log_path):
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield fastjson.loads(line)
 
-with open('reports/unified_report.json') as f:
-    data = json.load(f)
 
 print("=" * 70)
 print("CONTINUOUS RUN ANALYSIS")
 print("=" * 70)
 
-iterations = data.get('iterations', [])
-print(f"\nTotal iterations: {len(iterations)}")
+# One pass: totals plus a bounded window of the most recent iterations
+total_iterations = 0
+sum_approved = sum_detected = 0
+last5 = deque(maxlen=5)
+for it in iter_iterations(REPORT_PATH):
+    total_iterations += 1
+    sum_approved += it['opportunities_approved']['count']
+    sum_detected += it['opportunities_detected']['count']
+    last5.append(it)
+
+print(f"\nTotal iterations: {total_iterations}")
 
-if len(iterations) > 0:
-    latest = iterations[-1]
+if total_iterations > 0:
+    latest = last5[-1]
     print(f"\nLatest iteration #{latest['iteration']}:")
     print(f"  Markets: {latest['markets']['count']}")
     print(f"  Detected: {latest['opportunities_detected']['count']}")
@@ -22,24 +64,22 @@ if len(iterations) > 0:
     print(f"\n{'=' * 70}")
     print("LAST 5 ITERATIONS:")
     print("=" * 70)
-    for it in iterations[-5:]:
+    for it in last5:
         det = it['opportunities_detected']['count']
         app = it['opportunities_approved']['count']
         rate = it['approval_rate_pct']
         print(f"  Iter #{it['iteration']:2d}: {det:3d} detected, {app:3d} approved ({rate:5.1f}%)")
     
     # Check if all zeros
-    all_approved = [it['opportunities_approved']['count'] for it in iterations]
-    if sum(all_approved) == 0:
-        print(f"\n❌ PROBLEM: Zero approvals across all {len(iterations)} iterations!")
+    if sum_approved == 0:
+        print(f"\n❌ PROBLEM: Zero approvals across all {total_iterations} iterations!")
         print("   This suggests:")
         print("   1. Markets don't meet quality thresholds")
         print("   2. Or mix ratio too low (only 10% injected stress markets)")
         print("   3. Or Polymarket API returning no/bad markets")
         
-        all_detected = [it['opportunities_detected']['count'] for it in iterations]
-        if sum(all_detected) > 0:
-            print(f"\n   Detection working: {sum(all_detected)} total opportunities found")
+        if sum_detected > 0:
+            print(f"\n   Detection working: {sum_detected} total opportunities found")
             print("   But ALL rejected by risk manager!")
         else:
             print(f"\n   No opportunities even detected - market fetching issue?")
@@ -48,7 +88,7 @@ if len(iterations) > 0:
 print(f"\n{'=' * 70}")
 print("MARKET MIX ANALYSIS:")
 print("=" * 70)
-if len(iterations) > 0:
+if total_iterations > 0:
     market_count = latest['markets']['count']
     # Original high_volume = 1000 markets, mix_ratio = 0.1 means ~100 injected
     # So 1100 total markets suggests correct mix
@@ -1,25 +1,70 @@
 import sys
 sys.path.insert(0, 'src')
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from predarb.config import load_config
 from predarb.stress_scenarios import HappyPathScenario
 from predarb.engine import Engine
 from predarb.broker import PaperBroker
 from predarb.risk import RiskManager
+from predarb.unified_reporter import DETECTED_OPPORTUNITIES, load_latest_opportunities
+
+# Verdict codes, in the order the risk checks apply
+APPROVED, EDGE_TOO_LOW, LIQUIDITY_TOO_LOW, ALLOCATION_EXCEEDED, MAX_POSITIONS = range(5)
+
+
+def _classify_numpy(edges, min_liq, costs, cap_per, edge_thr, liq_thr):
+    """Assign each opportunity the first static check it fails."""
+    return np.select(
+        [edges < edge_thr, min_liq < liq_thr, costs > cap_per],
+        [EDGE_TOO_LOW, LIQUIDITY_TOO_LOW, ALLOCATION_EXCEEDED],
+        default=APPROVED,
+    ).astype(np.int8)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def classify(edges, min_liq, costs, cap_per, edge_thr, liq_thr):
+        out = np.zeros(edges.shape[0], np.int8)
+        for i in prange(edges.shape[0]):
+            if edges[i] < edge_thr:
+                out[i] = EDGE_TOO_LOW
+            elif min_liq[i] < liq_thr:
+                out[i] = LIQUIDITY_TOO_LOW
+            elif costs[i] > cap_per:
+                out[i] = ALLOCATION_EXCEEDED
+        return out
+else:
+    classify = _classify_numpy
+
 
 config = load_config("config.yml")
 scenario = HappyPathScenario()
 
 # Get markets
 markets = scenario.fetch_markets()
-market_lookup = {m.id: m for m in markets}
 
 # Create broker and risk manager
 broker = PaperBroker(config.broker)
 risk = RiskManager(config.risk, broker)
 
-# Create engine and get opportunities
-engine = Engine(config, scenario)
-opps = engine.run_once()
+# Reuse the opportunities the bot last recorded (engine.save_detected_opportunities)
+# unless --rerun is given; re-running the engine costs a full detection pass.
+# A snapshot recorded against a different market set is ignored.
+opps = None
+if "--rerun" not in sys.argv:
+    opps = load_latest_opportunities(DETECTED_OPPORTUNITIES, [m.id for m in markets])
+    if opps is not None:
+        print(f"Loaded {len(opps)} opportunities from {DETECTED_OPPORTUNITIES} (use --rerun to recompute)")
+if opps is None:
+    engine = Engine(config, scenario)
+    opps = engine.run_once()
 
 print("=" * 70)
 print("REJECTION ANALYSIS")
@@ -31,60 +76,72 @@ print(f"  min_net_edge_threshold: {config.risk.min_net_edge_threshold}")
 print(f"  max_open_positions: {config.risk.max_open_positions}")
 print(f"  max_allocation_per_market: {config.risk.max_allocation_per_market}")
 
-# Test each opportunity
-approved = 0
-rejections = {
-    'edge_too_low': 0,
-    'liquidity_too_low': 0,
-    'max_positions': 0,
-    'allocation_exceeded': 0,
-    'approved': 0
-}
+# Flatten markets, actions and market links into parallel arrays once, so
+# every check below is a contiguous ndarray reduction or compare
+n_opps = len(opps)
+market_row = {m.id: i for i, m in enumerate(markets)}
+market_liq = np.array([m.liquidity for m in markets], dtype=np.float64)
 
+act_opp_idx, act_prices, act_amounts = [], [], []
+link_opp_idx, link_rows = [], []
 for i, opp in enumerate(opps):
-    # Check edge
-    if opp.net_edge < config.risk.min_net_edge_threshold:
-        rejections['edge_too_low'] += 1
-        if i < 3:
-            print(f"\n❌ Opp {i+1}: Edge too low ({opp.net_edge:.4f} < {config.risk.min_net_edge_threshold})")
-        continue
-    
-    # Check liquidity
-    has_low_liq = False
+    for a in opp.actions:
+        act_opp_idx.append(i)
+        act_prices.append(a.limit_price)
+        act_amounts.append(a.amount)
     for mid in opp.market_ids:
-        market = market_lookup.get(mid)
-        if market and market.liquidity < config.risk.min_liquidity_usd:
-            has_low_liq = True
-            if i < 3:
-                print(f"\n❌ Opp {i+1}: Liquidity too low ({market.liquidity} < {config.risk.min_liquidity_usd})")
-            break
-    if has_low_liq:
-        rejections['liquidity_too_low'] += 1
-        continue
-    
-    # Check positions
-    open_pos = sum(1 for qty in broker.positions.values() if qty != 0)
-    if open_pos >= config.risk.max_open_positions:
-        rejections['max_positions'] += 1
-        if i < 3:
-            print(f"\n❌ Opp {i+1}: Max positions ({open_pos} >= {config.risk.max_open_positions})")
-        continue
-    
-    # Check allocation
-    total_equity = broker.cash
-    est_cost = sum(a.limit_price * a.amount for a in opp.actions)
-    max_per_market = total_equity * config.risk.max_allocation_per_market
-    if est_cost > max_per_market:
-        rejections['allocation_exceeded'] += 1
-        if i < 3:
-            print(f"\n❌ Opp {i+1}: Allocation exceeded (${est_cost:.2f} > ${max_per_market:.2f})")
-        continue
-    
-    # Approved!
-    rejections['approved'] += 1
-    approved += 1
-    if i < 3:
-        print(f"\n✅ Opp {i+1}: APPROVED (edge={opp.net_edge:.4f}, cost=${est_cost:.2f})")
+        row = market_row.get(mid)
+        if row is not None:
+            link_opp_idx.append(i)
+            link_rows.append(row)
+act_opp_idx = np.array(act_opp_idx, dtype=np.intp)
+act_prices = np.array(act_prices, dtype=np.float64)
+act_amounts = np.array(act_amounts, dtype=np.float64)
+link_opp_idx = np.array(link_opp_idx, dtype=np.intp)
+link_rows = np.array(link_rows, dtype=np.intp)
+
+edges = np.fromiter((opp.net_edge for opp in opps), dtype=np.float64, count=n_opps)
+costs = np.zeros(n_opps, dtype=np.float64)
+np.add.at(costs, act_opp_idx, act_prices * act_amounts)
+# Lowest liquidity among each opportunity's known markets (inf if none known)
+min_liq = np.full(n_opps, np.inf, dtype=np.float64)
+np.minimum.at(min_liq, link_opp_idx, market_liq[link_rows])
+
+# Broker is not mutated by this analysis, so position count and cap are fixed
+open_pos = broker.open_position_count()
+max_per_market = broker.cash * config.risk.max_allocation_per_market
+
+verdicts = classify(
+    edges, min_liq, costs, max_per_market,
+    config.risk.min_net_edge_threshold, config.risk.min_liquidity_usd,
+)
+# The position cap sits between the liquidity and allocation checks and is
+# the same for every opp, so apply it after classifying
+if open_pos >= config.risk.max_open_positions:
+    verdicts[(verdicts == APPROVED) | (verdicts == ALLOCATION_EXCEEDED)] = MAX_POSITIONS
+
+counts = np.bincount(verdicts, minlength=5)
+rejections = {
+    'edge_too_low': int(counts[EDGE_TOO_LOW]),
+    'liquidity_too_low': int(counts[LIQUIDITY_TOO_LOW]),
+    'max_positions': int(counts[MAX_POSITIONS]),
+    'allocation_exceeded': int(counts[ALLOCATION_EXCEEDED]),
+    'approved': int(counts[APPROVED]),
+}
+approved = rejections['approved']
+
+for i in range(min(3, n_opps)):
+    verdict = verdicts[i]
+    if verdict == EDGE_TOO_LOW:
+        print(f"\n❌ Opp {i+1}: Edge too low ({edges[i]:.4f} < {config.risk.min_net_edge_threshold})")
+    elif verdict == LIQUIDITY_TOO_LOW:
+        print(f"\n❌ Opp {i+1}: Liquidity too low ({min_liq[i]} < {config.risk.min_liquidity_usd})")
+    elif verdict == MAX_POSITIONS:
+        print(f"\n❌ Opp {i+1}: Max positions ({open_pos} >= {config.risk.max_open_positions})")
+    elif verdict == ALLOCATION_EXCEEDED:
+        print(f"\n❌ Opp {i+1}: Allocation exceeded (${costs[i]:.2f} > ${max_per_market:.2f})")
+    else:
+        print(f"\n✅ Opp {i+1}: APPROVED (edge={edges[i]:.4f}, cost=${costs[i]:.2f})")
 
 print(f"\n{'=' * 70}")
 print("REJECTION REASONS:")
@@ -3,132 +3,128 @@ HANDS-ON EXAMPLE: Testing Cash Rebalancing Step-by-Step
 Run this to see exactly what happens during rebalancing!
 """
 
-print("=" * 80)
-print("TESTING REBALANCING - STEP BY STEP WALKTHROUGH")
-print("=" * 80)
-print()
-
-print("What You'll Learn:")
-print("  1. How to run a rebalancing test")
-print("  2. What happens when one side fails")
-print("  3. How the bot closes positions safely")
-print()
-
-print("-" * 80)
-print("STEP 1: Run the Rebalancing Test")
-print("-" * 80)
-print()
-print("Command:")
-print("  python -m predarb stress --scenario partial_fill")
-print()
-print("What this does:")
-print("  - Creates 10 markets")
-print("  - Each market has DEEP YES side ($80k+) and SHALLOW NO side ($500)")
-print("  - Bot tries to execute arbitrage on all of them")
-print("  - Most will FAIL on the NO side (not enough money)")
-print("  - Bot must HEDGE by selling the YES side")
-print()
-
-print("-" * 80)
-print("STEP 2: Watch the Output")
-print("-" * 80)
-print()
-print("You'll see something like:")
-print()
-print("  Iteration 1:")
-print("    Markets fetched: 10")
-print("    Opportunities detected: 8")
-print("    Risk approved: 6")
-print()
-print("  Executing opportunity partial_0...")
-print("    BUY YES: $1000 @ $0.42 --> SUCCESS")
-print("    BUY NO:  $1000 @ $0.55 --> FAILED (insufficient liquidity)")
-print("    Status: PARTIAL")
-print("    Hedging: Closing YES position...")
-print("    SELL YES: $1000 @ $0.42 --> SUCCESS")
-print("    Final exposure: $0")
-print()
-
-print("-" * 80)
-print("STEP 3: Check the Report")
-print("-" * 80)
-print()
-print("Command:")
-print('  python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"')
-print()
-print("You'll see:")
-print()
-print("  Iterations: 1")
-print("  Total Opportunities Found: 8")
-print("  Total Executed: 6")
-print()
-print("  EXECUTION BREAKDOWN:")
-print("    SUCCESS: 2 (both sides filled)")
-print("    PARTIAL: 4 (one side failed, hedged successfully)")
-print()
-print("  P&L SUMMARY:")
-print("    Realized P&L: $20.00 (from 2 successful trades)")
-print("    Hedging Costs: $5.00 (fees from closing positions)")
-print("    Net Profit: $15.00")
-print()
-
-print("-" * 80)
-print("STEP 4: Verify the Report File")
-print("-" * 80)
-print()
-print("Look at: reports/unified_report.json")
-print()
-print("Check for:")
-print()
-print('  "opportunity_executions": [')
-print('    {')
-print('      "id": "partial_0",')
-print('      "status": "partial",')
-print('      "intended_legs": [')
-print('        {"side": "BUY", "outcome": "yes", "amount": 1000},')
-print('        {"side": "BUY", "outcome": "no", "amount": 1000}')
-print('      ],')
-print('      "actual_executions": [')
-print('        {"side": "BUY", "outcome": "yes", "filled": 1000},')
-print('        {"side": "BUY", "outcome": "no", "filled": 0}  <-- FAILED!')
-print('      ],')
-print('      "hedge": {')
-print('        "hedged": true,')
-print('        "hedge_executions": [')
-print('          {"side": "SELL", "outcome": "yes", "amount": 1000}  <-- REBALANCED!')
-print('        ]')
-print('      }')
-print('    }')
-print('  ]')
-print()
-
-print("-" * 80)
-print("WHAT IF REBALANCING FAILS?")
-print("-" * 80)
-print()
-print("If you see exit code 6:")
-print("  python -m predarb stress --scenario partial_fill")
-print("  echo $LASTEXITCODE")
-print("  # Output: 6")
-print()
-print("This means:")
-print("  - Bot tried to hedge but FAILED")
-print("  - Left with residual exposure (risky!)")
-print("  - Need to fix the hedge logic")
-print()
-print("Check the report for:")
-print('  "residual_exposure": true,')
-print('  "failure_flags": ["residual_exposure"]')
-print()
-
-print("-" * 80)
-print("TESTING LARGER REBALANCING")
-print("-" * 80)
-print()
-print("Want to test with MORE markets and BIGGER trades?")
-print()
-print("Create custom_large_rebalance.json:")
-print("""
+import sys
+
+BANNER = """\
+================================================================================
+TESTING REBALANCING - STEP BY STEP WALKTHROUGH
+================================================================================
+
+What You'll Learn:
+  1. How to run a rebalancing test
+  2. What happens when one side fails
+  3. How the bot closes positions safely
+
+--------------------------------------------------------------------------------
+STEP 1: Run the Rebalancing Test
+--------------------------------------------------------------------------------
+
+Command:
+  python -m predarb stress --scenario partial_fill
+
+What this does:
+  - Creates 10 markets
+  - Each market has DEEP YES side ($80k+) and SHALLOW NO side ($500)
+  - Bot tries to execute arbitrage on all of them
+  - Most will FAIL on the NO side (not enough money)
+  - Bot must HEDGE by selling the YES side
+
+--------------------------------------------------------------------------------
+STEP 2: Watch the Output
+--------------------------------------------------------------------------------
+
+You'll see something like:
+
+  Iteration 1:
+    Markets fetched: 10
+    Opportunities detected: 8
+    Risk approved: 6
+
+  Executing opportunity partial_0...
+    BUY YES: $1000 @ $0.42 --> SUCCESS
+    BUY NO:  $1000 @ $0.55 --> FAILED (insufficient liquidity)
+    Status: PARTIAL
+    Hedging: Closing YES position...
+    SELL YES: $1000 @ $0.42 --> SUCCESS
+    Final exposure: $0
+
+--------------------------------------------------------------------------------
+STEP 3: Check the Report
+--------------------------------------------------------------------------------
+
+Command:
+  python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"
+
+You'll see:
+
+  Iterations: 1
+  Total Opportunities Found: 8
+  Total Executed: 6
+
+  EXECUTION BREAKDOWN:
+    SUCCESS: 2 (both sides filled)
+    PARTIAL: 4 (one side failed, hedged successfully)
+
+  P&L SUMMARY:
+    Realized P&L: $20.00 (from 2 successful trades)
+    Hedging Costs: $5.00 (fees from closing positions)
+    Net Profit: $15.00
+
+--------------------------------------------------------------------------------
+STEP 4: Verify the Report File
+--------------------------------------------------------------------------------
+
+Look at: reports/unified_report.json
+
+Check for:
+
+  "opportunity_executions": [
+    {
+      "id": "partial_0",
+      "status": "partial",
+      "intended_legs": [
+        {"side": "BUY", "outcome": "yes", "amount": 1000},
+        {"side": "BUY", "outcome": "no", "amount": 1000}
+      ],
+      "actual_executions": [
+        {"side": "BUY", "outcome": "yes", "filled": 1000},
+        {"side": "BUY", "outcome": "no", "filled": 0}  <-- FAILED!
+      ],
+      "hedge": {
+        "hedged": true,
+        "hedge_executions": [
+          {"side": "SELL", "outcome": "yes", "amount": 1000}  <-- REBALANCED!
+        ]
+      }
+    }
+  ]
+
+--------------------------------------------------------------------------------
+WHAT IF REBALANCING FAILS?
+--------------------------------------------------------------------------------
+
+If you see exit code 6:
+  python -m predarb stress --scenario partial_fill
+  echo $LASTEXITCODE
+  # Output: 6
+
+This means:
+  - Bot tried to hedge but FAILED
+  - Left with residual exposure (risky!)
+  - Need to fix the hedge logic
+
+Check the report for:
+  "residual_exposure": true,
+  "failure_flags": ["residual_exposure"]
+
+--------------------------------------------------------------------------------
+TESTING LARGER REBALANCING
+--------------------------------------------------------------------------------
+
+Want to test with MORE markets and BIGGER trades?
+
+Create custom_large_rebalance.json:
+
 [
   {
     "id": "big_1",
@@ -155,37 +151,42 @@ print("""
     "resolution_source": "test"
   }
 ]
-""")
-print()
-print("Run it:")
-print("  python -m predarb stress --inject file:custom_large_rebalance.json")
-print()
-print("This tests:")
-print("  - Large cash amounts ($500k+ liquidity)")
-print("  - Multiple failed legs")
-print("  - Hedging big positions")
-print()
-
-print("=" * 80)
-print("QUICK REFERENCE")
-print("=" * 80)
-print()
-print("Test rebalancing:")
-print("  python -m predarb stress --scenario partial_fill")
-print()
-print("Test performance:")
-print("  python -m predarb stress --scenario high_volume")
-print()
-print("Test cash management:")
-print("  python -m predarb stress --scenario many_risk_rejections")
-print()
-print("Test all scenarios:")
-print("  pytest tests/test_stress_scenarios.py -v")
-print()
-print("Check results:")
-print('  python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"')
-print()
-print("=" * 80)
-print()
-print("TIP: Start with 'partial_fill' - it's the best rebalancing test!")
-print()
+
+
+Run it:
+  python -m predarb stress --inject file:custom_large_rebalance.json
+
+This tests:
+  - Large cash amounts ($500k+ liquidity)
+  - Multiple failed legs
+  - Hedging big positions
+
+================================================================================
+QUICK REFERENCE
+================================================================================
+
+Test rebalancing:
+  python -m predarb stress --scenario partial_fill
+
+Test performance:
+  python -m predarb stress --scenario high_volume
+
+Test cash management:
+  python -m predarb stress --scenario many_risk_rejections
+
+Test all scenarios:
+  pytest tests/test_stress_scenarios.py -v
+
+Check results:
+  python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"
+
+================================================================================
+
+TIP: Start with 'partial_fill' - it's the best rebalancing test!
+
+"""
+
+
+if __name__ == "__main__":
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
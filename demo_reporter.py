@@ -10,34 +10,40 @@ Shows how the reporter:
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from predarb.models import Market, Opportunity, Outcome
+from predarb import fastjson
+from predarb.models import Market, Opportunity, Outcome, TradeAction
 from predarb.reporter import LiveReporter
 
 
+# Every demo market has the same two outcomes; build them once
+_OUTCOMES = (
+    Outcome(id="yes", label="Yes", price=0.5),
+    Outcome(id="no", label="No", price=0.5),
+)
+
+
+@lru_cache(maxsize=None)
 def create_market(market_id: str, liquidity: float = 1000.0) -> Market:
-    """Create test market."""
-    outcomes = [
-        Outcome(id="yes", label="Yes", price=0.5),
-        Outcome(id="no", label="No", price=0.5),
-    ]
+    """Create test market (cached: the reporter only reads markets)."""
     return Market(
         id=market_id,
         question=f"Test {market_id}?",
-        outcomes=outcomes,
+        outcomes=list(_OUTCOMES),
         liquidity=liquidity,
         volume=500.0,
     )
 
 
+@lru_cache(maxsize=None)
 def create_opportunity(opp_id: str, market_id: str) -> Opportunity:
-    """Create test opportunity."""
-    from predarb.models import TradeAction
-    
+    """Create test opportunity (cached like create_market)."""
     actions = [TradeAction(
         market_id=market_id,
         outcome_id="yes",
@@ -56,24 +62,27 @@ def create_opportunity(opp_id: str, market_id: str) -> Opportunity:
     )
 
 
+def _emit(parts: List[str]) -> None:
+    """Write one section of demo output with a single stdout call."""
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
+
+
 def demo():
     """Run demo showing reporter behavior."""
-    print("\n" + "=" * 70)
-    print("LIVE INCREMENTAL REPORTING DEMO")
-    print("=" * 70 + "\n")
-    
     # Create reporter (reports to ./reports)
     reporter = LiveReporter()
     
-    print(f"📁 Reports directory: {reporter.reports_dir}")
-    print(f"📄 State file: {reporter.state_file}")
-    print(f"📊 CSV file: {reporter.summary_csv}\n")
+    _emit([
+        "\n" + "=" * 70,
+        "LIVE INCREMENTAL REPORTING DEMO",
+        "=" * 70 + "\n",
+        f"📁 Reports directory: {reporter.reports_dir}",
+        f"📄 State file: {reporter.state_file}",
+        f"📊 CSV file: {reporter.summary_csv}\n",
+    ])
     
     # Scenario 1: First run - should write
-    print("─" * 70)
-    print("ITERATION 1: First run with 2 markets, 1 opportunity")
-    print("─" * 70)
-    
     markets_1 = [create_market("m1"), create_market("m2")]
     opps_1 = [create_opportunity("o1", "m1")]
     
@@ -84,15 +93,16 @@ def demo():
         approved_opportunities=opps_1,
     )
     
-    print(f"✓ Reported: {wrote}")
-    print(f"  → Markets: 2 | Detected: 1 | Approved: 1")
-    print(f"  → State hashes saved to disk")
+    _emit([
+        "─" * 70,
+        "ITERATION 1: First run with 2 markets, 1 opportunity",
+        "─" * 70,
+        f"✓ Reported: {wrote}",
+        "  → Markets: 2 | Detected: 1 | Approved: 1",
+        "  → State hashes saved to disk",
+    ])
     
     # Scenario 2: Same data - should skip
-    print("\n" + "─" * 70)
-    print("ITERATION 2: Same markets and opportunities")
-    print("─" * 70)
-    
     wrote = reporter.report(
         iteration=2,
         all_markets=markets_1,
@@ -100,14 +110,15 @@ def demo():
         approved_opportunities=opps_1,
     )
     
-    print(f"✗ Reported: {wrote} (skipped - no change)")
-    print(f"  → CSV remains 2 lines (header + 1 data row)")
+    _emit([
+        "\n" + "─" * 70,
+        "ITERATION 2: Same markets and opportunities",
+        "─" * 70,
+        f"✗ Reported: {wrote} (skipped - no change)",
+        "  → CSV remains 2 lines (header + 1 data row)",
+    ])
     
     # Scenario 3: New market - should write
-    print("\n" + "─" * 70)
-    print("ITERATION 3: Added new market m3")
-    print("─" * 70)
-    
     markets_2 = [create_market("m1"), create_market("m2"), create_market("m3")]
     
     wrote = reporter.report(
@@ -117,15 +128,16 @@ def demo():
         approved_opportunities=opps_1,
     )
     
-    print(f"✓ Reported: {wrote}")
-    print(f"  → Markets: 3 | Detected: 1 | Approved: 1")
-    print(f"  → Market hash changed → wrote new row")
+    _emit([
+        "\n" + "─" * 70,
+        "ITERATION 3: Added new market m3",
+        "─" * 70,
+        f"✓ Reported: {wrote}",
+        "  → Markets: 3 | Detected: 1 | Approved: 1",
+        "  → Market hash changed → wrote new row",
+    ])
     
     # Scenario 4: New opportunity - should write
-    print("\n" + "─" * 70)
-    print("ITERATION 4: Added new opportunity o2")
-    print("─" * 70)
-    
     opps_2 = [create_opportunity("o1", "m1"), create_opportunity("o2", "m2")]
     
     wrote = reporter.report(
@@ -135,15 +147,16 @@ def demo():
         approved_opportunities=opps_2,
     )
     
-    print(f"✓ Reported: {wrote}")
-    print(f"  → Markets: 3 | Detected: 2 | Approved: 2")
-    print(f"  → Opportunity hash changed → wrote new row")
+    _emit([
+        "\n" + "─" * 70,
+        "ITERATION 4: Added new opportunity o2",
+        "─" * 70,
+        f"✓ Reported: {wrote}",
+        "  → Markets: 3 | Detected: 2 | Approved: 2",
+        "  → Opportunity hash changed → wrote new row",
+    ])
     
     # Scenario 5: Removed opportunity - should write
-    print("\n" + "─" * 70)
-    print("ITERATION 5: Removed opportunity o2")
-    print("─" * 70)
-    
     wrote = reporter.report(
         iteration=5,
         all_markets=markets_2,
@@ -151,44 +164,59 @@ def demo():
         approved_opportunities=[create_opportunity("o1", "m1")],
     )
     
-    print(f"✓ Reported: {wrote}")
-    print(f"  → Markets: 3 | Detected: 1 | Approved: 1")
-    print(f"  → Opportunity hash changed → wrote new row")
+    _emit([
+        "\n" + "─" * 70,
+        "ITERATION 5: Removed opportunity o2",
+        "─" * 70,
+        f"✓ Reported: {wrote}",
+        "  → Markets: 3 | Detected: 1 | Approved: 1",
+        "  → Opportunity hash changed → wrote new row",
+    ])
     
     # Show final CSV contents
-    print("\n" + "=" * 70)
-    print("FINAL CSV CONTENTS")
-    print("=" * 70 + "\n")
+    parts = [
+        "\n" + "=" * 70,
+        "FINAL CSV CONTENTS",
+        "=" * 70 + "\n",
+    ]
     
     if reporter.summary_csv.exists():
         csv_content = reporter.summary_csv.read_text()
         lines = csv_content.strip().split("\n")
         
-        print(f"Total rows: {len(lines)} (1 header + {len(lines) - 1} data rows)\n")
+        parts.append(f"Total rows: {len(lines)} (1 header + {len(lines) - 1} data rows)\n")
         
         for i, line in enumerate(lines):
             if i == 0:
-                print("HEADER:")
-                print(f"  {line}\n")
+                parts.append("HEADER:")
+                parts.append(f"  {line}\n")
             else:
-                parts = line.split(",")
-                print(f"ROW {i}: Iteration={parts[1]}, Markets={parts[2]}, Detected={parts[3]}, Approved={parts[4]}")
+                fields = line.split(",")
+                parts.append(
+                    f"ROW {i}: Iteration={fields[1]}, Markets={fields[2]}, "
+                    f"Detected={fields[3]}, Approved={fields[4]}"
+                )
+    _emit(parts)
     
     # Show state file
-    print("\n" + "=" * 70)
-    print("STATE FILE (for restart-safety)")
-    print("=" * 70 + "\n")
+    parts = [
+        "\n" + "=" * 70,
+        "STATE FILE (for restart-safety)",
+        "=" * 70 + "\n",
+    ]
     
     if reporter.state_file.exists():
-        import json
-        state = json.loads(reporter.state_file.read_text())
-        print(f"market_ids_hash: {state['market_ids_hash'][:16]}...")
-        print(f"approved_opp_ids_hash: {state['approved_opp_ids_hash'][:16]}...")
-        print(f"last_updated: {state['last_updated']}")
-    
-    print("\n" + "=" * 70)
-    print("✓ DEMO COMPLETE")
-    print("=" * 70 + "\n")
+        state = fastjson.loads(reporter.state_file.read_bytes())
+        parts.append(f"market_ids_hash: {state['market_ids_hash'][:16]}...")
+        parts.append(f"approved_opp_ids_hash: {state['approved_opp_ids_hash'][:16]}...")
+        parts.append(f"last_updated: {state['last_updated']}")
+    
+    parts.extend([
+        "\n" + "=" * 70,
+        "✓ DEMO COMPLETE",
+        "=" * 70 + "\n",
+    ])
+    _emit(parts)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 Demo script for semantic clustering scenario.
 Shows how the scenario tests semantic similarity and all filters.
 """
+import re
 import sys
 from pathlib import Path
 
@@ -10,6 +11,35 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from predarb.stress_scenarios import get_scenario
 
+# Market id prefixes of the groups shown below
+PREFIXES = (
+    "btc_dup_",
+    "election_dup_",
+    "wide_spread_",
+    "low_volume_",
+    "low_liq_",
+    "expiring_",
+    "no_source_",
+    "good_arb_",
+    "distinct_",
+)
+
+
+# One anchored alternation, so each id is matched by a single C-level scan
+PREFIX_RE = re.compile("|".join(map(re.escape, PREFIXES)))
+
+
+def bucket_by_prefix(markets):
+    """Group markets by id prefix in one pass; unmatched markets are dropped."""
+    buckets = {prefix: [] for prefix in PREFIXES}
+    match = PREFIX_RE.match
+    for m in markets:
+        mo = match(m.id)
+        if mo:
+            buckets[mo.group()].append(m)
+    return buckets
+
+
 def main():
     print("=" * 80)
     print("SEMANTIC CLUSTERING SCENARIO DEMO")
@@ -23,10 +53,12 @@ def main():
     print(f"Total markets generated: {len(markets)}")
     print()
     
+    buckets = bucket_by_prefix(markets)
+    
     # Group 1: BTC semantic duplicates
     print("GROUP 1: Bitcoin Semantic Duplicates (5 markets)")
     print("-" * 80)
-    btc_markets = [m for m in markets if m.id.startswith("btc_dup_")]
+    btc_markets = buckets["btc_dup_"]
     for market in btc_markets:
         print(f"  {market.id}: {market.question}")
         print(f"    → Liquidity: ${market.liquidity:,.0f}, Volume: ${market.volume:,.0f}")
@@ -35,7 +67,7 @@ def main():
     # Group 2: Election semantic duplicates
     print("GROUP 2: Election Semantic Duplicates (4 markets)")
     print("-" * 80)
-    election_markets = [m for m in markets if m.id.startswith("election_dup_")]
+    election_markets = buckets["election_dup_"]
     for market in election_markets:
         print(f"  {market.id}: {market.question}")
         print(f"    → Liquidity: ${market.liquidity:,.0f}, Volume: ${market.volume:,.0f}")
@@ -46,7 +78,7 @@ def main():
     print("-" * 80)
     
     # Wide spread
-    wide_spread = [m for m in markets if m.id.startswith("wide_spread_")]
+    wide_spread = buckets["wide_spread_"]
     print(f"\n  Wide Spread ({len(wide_spread)} markets):")
     for market in wide_spread:
         total_price = sum(o.price for o in market.outcomes)
@@ -54,19 +86,19 @@ def main():
         print(f"    {market.id}: Spread = {spread:.1%} (violates typical 3% max)")
     
     # Low volume
-    low_volume = [m for m in markets if m.id.startswith("low_volume_")]
+    low_volume = buckets["low_volume_"]
     print(f"\n  Low Volume ({len(low_volume)} markets):")
     for market in low_volume:
         print(f"    {market.id}: Volume = ${market.volume:,.0f} (below typical $10k min)")
     
     # Low liquidity
-    low_liq = [m for m in markets if m.id.startswith("low_liq_")]
+    low_liq = buckets["low_liq_"]
     print(f"\n  Low Liquidity ({len(low_liq)} markets):")
     for market in low_liq:
         print(f"    {market.id}: Liquidity = ${market.liquidity:,.0f} (below typical $25k min)")
     
     # Expiring soon
-    expiring = [m for m in markets if m.id.startswith("expiring_")]
+    expiring = buckets["expiring_"]
     print(f"\n  Expiring Soon ({len(expiring)} markets):")
     from datetime import datetime
     now = datetime.utcnow()
@@ -75,7 +107,7 @@ def main():
         print(f"    {market.id}: Expires in {days} days (below typical 7 day min)")
     
     # Missing resolution source
-    no_source = [m for m in markets if m.id.startswith("no_source_")]
+    no_source = buckets["no_source_"]
     print(f"\n  No Resolution Source ({len(no_source)} markets):")
     for market in no_source:
         print(f"    {market.id}: resolution_source = '{market.resolution_source}' (empty)")
@@ -85,7 +117,7 @@ def main():
     # Group 4: Good arbitrage opportunities
     print("GROUP 4: Good Arbitrage Opportunities (3 markets)")
     print("-" * 80)
-    good_arb = [m for m in markets if m.id.startswith("good_arb_")]
+    good_arb = buckets["good_arb_"]
     for market in good_arb:
         total_price = sum(o.price for o in market.outcomes)
         edge = 1.0 - total_price
@@ -95,7 +127,7 @@ def main():
     # Group 5: Distinct entities (should NOT cluster)
     print("GROUP 5: Distinct Entities (3 markets - should NOT cluster together)")
     print("-" * 80)
-    distinct = [m for m in markets if m.id.startswith("distinct_")]
+    distinct = buckets["distinct_"]
     for market in distinct:
         print(f"  {market.id}: {market.question}")
     print()
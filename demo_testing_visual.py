@@ -3,14 +3,16 @@ Simple visual guide to testing the arbitrage bot cycle.
 Shows what happens in each test scenario.
 """
 
-print("=" * 80)
-print("TESTING THE ARBITRAGE BOT - VISUAL GUIDE")
-print("=" * 80)
-print()
-
-print("SCENARIO 1: HAPPY PATH (Everything Works!)")
-print("-" * 80)
-print("""
+import sys
+
+RULE = "=" * 80
+THIN = "-" * 80
+
+# (title, description) for each scenario, in display order
+SCENARIOS = [
+    (
+        "HAPPY PATH (Everything Works!)",
+        """\
 Step 1: Fetch Markets --> 15 markets with good arbitrage
 Step 2: Detect        --> Found 15 opportunities!
 Step 3: Validate      --> All 15 pass risk checks
@@ -18,12 +20,11 @@ Step 4: Execute       --> Buy YES at $0.42, Buy NO at $0.54
 Step 5: Settle        --> Both sides filled!
 Step 6: Report        --> Profit: $0.04 per trade
 
-RESULT: SUCCESS - Made $60 profit on 15 trades
-""")
-
-print("SCENARIO 2: PARTIAL FILL (Rebalancing Test)")
-print("-" * 80)
-print("""
+RESULT: SUCCESS - Made $60 profit on 15 trades""",
+    ),
+    (
+        "PARTIAL FILL (Rebalancing Test)",
+        """\
 Market Setup:
   YES side: $80,000 liquidity (DEEP)
   NO side:  $500 liquidity (SHALLOW)
@@ -35,12 +36,11 @@ Step 3: Bot REBALANCES:
         - Closes out to avoid risk
 Step 4: Net result: $0 exposure
 
-RESULT: PARTIAL - Hedged successfully, no money lost
-""")
-
-print("SCENARIO 3: HIGH VOLUME (Performance Test)")
-print("-" * 80)
-print("""
+RESULT: PARTIAL - Hedged successfully, no money lost""",
+    ),
+    (
+        "HIGH VOLUME (Performance Test)",
+        """\
 1000 Markets:
   - 990 markets: No arbitrage (noise)
   - 10 markets: Real opportunities
@@ -50,12 +50,11 @@ Bot must:
   - Find the 10 needles in the haystack
   - Execute only the good ones
 
-RESULT: Tests if bot can handle lots of data
-""")
-
-print("SCENARIO 4: RISK REJECTIONS (Cash Management)")
-print("-" * 80)
-print("""
+RESULT: Tests if bot can handle lots of data""",
+    ),
+    (
+        "RISK REJECTIONS (Cash Management)",
+        """\
 40 Markets:
   - 20 markets: Too little liquidity (can't fill order)
   - 15 markets: Edge too small (profit < fees)
@@ -63,12 +62,11 @@ print("""
 
 Bot must say NO to 35 markets and YES to 5 markets
 
-RESULT: Tests smart filtering and risk management
-""")
-
-print("SCENARIO 5: FEE/SLIPPAGE (Cost Calculation)")
-print("-" * 80)
-print("""
+RESULT: Tests smart filtering and risk management""",
+    ),
+    (
+        "FEE/SLIPPAGE (Cost Calculation)",
+        """\
 20 Markets with tiny edges (1-2% profit):
 
 Market 1:
@@ -81,12 +79,11 @@ Market 2:
   Fees: 1%
   Net: 0.5% - 1% = -0.5% --> REJECT IT!
 
-RESULT: Tests if bot calculates real profit after costs
-""")
-
-print("SCENARIO 6: SEMANTIC CLUSTERING (Duplicate Detection)")
-print("-" * 80)
-print("""
+RESULT: Tests if bot calculates real profit after costs""",
+    ),
+    (
+        "SEMANTIC CLUSTERING (Duplicate Detection)",
+        """\
 Same Event, Different Words:
   Market 1: "Will Bitcoin exceed $100k?"
   Market 2: "Will BTC surpass $100,000?"
@@ -100,24 +97,34 @@ Different Events:
 
 Bot should keep these SEPARATE
 
-RESULT: Tests semantic similarity detection
-""")
-
-print()
-print("=" * 80)
-print("COMMANDS TO TRY:")
-print("=" * 80)
-print()
-print("# Test rebalancing (what you asked about!):")
-print("python -m predarb stress --scenario partial_fill")
-print()
-print("# Test large cash management:")
-print("python -m predarb stress --scenario high_volume")
-print()
-print("# Run all tests:")
-print("pytest tests/test_stress_scenarios.py -v")
-print()
-print("# See what happened:")
-print('python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"')
-print()
-print("=" * 80)
+RESULT: Tests semantic similarity detection""",
+    ),
+]
+
+COMMANDS = """\
+# Test rebalancing (what you asked about!):
+python -m predarb stress --scenario partial_fill
+
+# Test large cash management:
+python -m predarb stress --scenario high_volume
+
+# Run all tests:
+pytest tests/test_stress_scenarios.py -v
+
+# See what happened:
+python -c "from src.report_summary import generate_reports_summary; print(generate_reports_summary())"
+"""
+
+
+def render() -> str:
+    """Build the whole guide as one string."""
+    parts = [RULE, "TESTING THE ARBITRAGE BOT - VISUAL GUIDE", RULE, ""]
+    for i, (title, body) in enumerate(SCENARIOS, 1):
+        parts += [f"SCENARIO {i}: {title}", THIN, "", body, ""]
+    parts += ["", RULE, "COMMANDS TO TRY:", RULE, "", COMMANDS, RULE]
+    return "\n".join(parts) + "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.write(render())
+    sys.stdout.flush()
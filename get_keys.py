@@ -1,18 +1,49 @@
 import os
-import requests
-import urllib3
-from eth_account import Account
-from py_clob_client.client import ClobClient
-from py_clob_client.constants import POLYGON
+from contextlib import contextmanager
 
-# BYPASS SSL VERIFICATION (Likely due to corporate proxy/Zscaler)
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-# Monkey patch requests to ignore verify=True
-_original_request = requests.Session.request
-def _insecure_request(self, method, url, *args, **kwargs):
-    kwargs['verify'] = False
-    return _original_request(self, method, url, *args, **kwargs)
-requests.Session.request = _insecure_request
+# requests, eth_account and py_clob_client are slow to import, so they are
+# loaded in main() only once the chosen path needs them.
+
+
+class _SessionRequests:
+    """Stand-in for the requests module whose request() uses one session.
+    
+    Everything else (exceptions, Response, ...) comes from the real module.
+    """
+    
+    def __init__(self, session, requests_module):
+        self.request = session.request
+        self._requests = requests_module
+    
+    def __getattr__(self, name):
+        return getattr(self._requests, name)
+
+
+@contextmanager
+def _route_clob_through_session():
+    """Send py_clob_client's HTTP calls through one pooled session.
+    
+    ClobClient takes no session: its helpers call requests.request(), which
+    builds a throwaway Session per call. SSL verification is skipped only
+    when SSL_BYPASS=1 (e.g. behind a corporate proxy such as Zscaler). The
+    helpers get their own requests module back on exit.
+    """
+    from py_clob_client.http_helpers import helpers as clob_http
+
+    from src._http import create_session
+
+    session = create_session()
+    if os.environ.get("SSL_BYPASS") == "1":
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        session.verify = False
+    original = clob_http.requests
+    clob_http.requests = _SessionRequests(session, original)
+    try:
+        yield
+    finally:
+        clob_http.requests = original
+        session.close()
 
 def main():
     print("--- Polymarket Key Generator ---")
@@ -23,6 +54,8 @@ def main():
     choice = input("\nEnter choice (1 or 2): ").strip()
     
     if choice == '1':
+        from eth_account import Account
+
         # Generate new account
         acct = Account.create()
         private_key = acct.key.hex()
@@ -47,18 +80,21 @@ def main():
 
     print("\nDeriving API Credentials...")
     try:
-        # Initialize ClobClient to derive keys
-        # We don't need to connect to host to derive keys usually, 
-        # but the library structure might require instantation.
-        # We use a dummy host if needed, but clob.polymarket.com is fine.
-        client = ClobClient(
-            host="https://clob.polymarket.com",
-            key=private_key,
-            chain_id=137 # Polygon
-        )
-        
-        # create_or_derive_api_creds returns py_clob_client.clob_types.ApiCreds
-        creds = client.create_or_derive_api_creds()
+        from py_clob_client.client import ClobClient
+
+        with _route_clob_through_session():
+            # Initialize ClobClient to derive keys
+            # We don't need to connect to host to derive keys usually, 
+            # but the library structure might require instantation.
+            # We use a dummy host if needed, but clob.polymarket.com is fine.
+            client = ClobClient(
+                host="https://clob.polymarket.com",
+                key=private_key,
+                chain_id=137 # Polygon
+            )
+            
+            # create_or_derive_api_creds returns py_clob_client.clob_types.ApiCreds
+            creds = client.create_or_derive_api_creds()
         
         print("\n--- COPY TO YOUR .env FILE ---")
         print(f"POLYMARKET_PRIVATE_KEY={private_key}")
@@ -71,6 +107,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] Could not derive keys: {e}")
         print("Make sure py-clob-client is installed and the private key is valid.")
+        print("Behind an SSL-intercepting proxy, rerun with SSL_BYPASS=1.")
 
 if __name__ == "__main__":
     main()
@@ -5,15 +5,18 @@ Comprehensive stress test runner for ALL arbitrage types.
 Runs the complete test suite covering every arbitrage detection type
 across both venues (Polymarket + Kalshi) with expected results validation.
 """
+import functools
+import io
 import sys
-import json
 from pathlib import Path
-from typing import Dict, List, Any
-from collections import Counter
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from predarb import fastjson
 from predarb.config import load_config
 from predarb.engine import Engine
 from predarb.dual_injection import DualInjectionClient
@@ -21,6 +24,34 @@ from predarb.cross_venue_scenarios import get_cross_venue_scenario
 from predarb.models import Opportunity
 
 
+# Bucket index per exchange tag; untagged markets (None or "") go last
+_EXCHANGE_BUCKETS = {"polymarket": 0, "kalshi": 1, None: 2, "": 2}
+
+
+def partition_by_exchange(markets: List) -> Tuple[List, List, List]:
+    """Split markets into (polymarket, kalshi, untagged) in a single pass.
+    
+    Markets tagged with any other exchange are in none of the lists.
+    """
+    buckets: Tuple[List, List, List] = ([], [], [])
+    for m in markets:
+        index = _EXCHANGE_BUCKETS.get(getattr(m, 'exchange', None))
+        if index is not None:
+            buckets[index].append(m)
+    return buckets
+
+
+def _flush_output(method):
+    """Write a validator method's buffered output to stdout once it returns."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush()
+    return wrapper
+
+
 class ScenarioValidator:
     """Validates scenario results against expected outcomes."""
     
@@ -40,6 +71,14 @@ class ScenarioValidator:
         },
     }
     
+    # (type, min_count, description, index) per expected type; index matches
+    # the type's position in EXPECTED_OPPORTUNITIES and the bincount slot
+    _EXPECTED_LIST: Tuple[Tuple[str, int, str, int], ...] = tuple(
+        (opp_type, spec["min_count"], spec["description"], i)
+        for i, (opp_type, spec) in enumerate(EXPECTED_OPPORTUNITIES.items())
+    )
+    _EXPECTED_KEYS = frozenset(EXPECTED_OPPORTUNITIES)
+    
     # Note: DUPLICATE detector is disabled in config.yml due to short-selling prevention policy
     # This is intentional and correct for production use
     
@@ -60,6 +99,10 @@ class ScenarioValidator:
     
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
+        # Report lines are collected here and written with one stdout call
+        self._buf = io.StringIO()
+        # (poly, kalshi) from the first determinism run, reused by the stress test
+        self.scenario = None
         self.results = {
             "passed": 0,
             "failed": 0,
@@ -67,72 +110,90 @@ class ScenarioValidator:
             "tests": [],
         }
     
+    @_flush_output
     def validate_detected_opportunities(
         self,
         detected: List[Opportunity],
         approved: List[Opportunity],
     ) -> Dict[str, Any]:
         """Validate detected and approved opportunities."""
-        print("\n" + "=" * 80)
-        print("VALIDATING DETECTED OPPORTUNITIES")
-        print("=" * 80)
+        self._out("\n" + "=" * 80)
+        self._out("VALIDATING DETECTED OPPORTUNITIES")
+        self._out("=" * 80)
         
-        # Count by type
-        detected_counts = Counter(o.type for o in detected)
-        approved_counts = Counter(o.type for o in approved)
+        # Count by type: map each type to a small int once, then tally with bincount
+        n_det = len(detected)
+        n_app = len(approved)
+        type_index = {t: i for t, _, _, i in self._EXPECTED_LIST}
+        det_ids = np.fromiter(
+            (type_index.setdefault(o.type, len(type_index)) for o in detected),
+            dtype=np.intp, count=n_det,
+        )
+        app_ids = np.fromiter(
+            (type_index.setdefault(o.type, len(type_index)) for o in approved),
+            dtype=np.intp, count=n_app,
+        )
+        # Plain int lists: indexing them avoids a NumPy scalar and int() per read
+        det_counts = np.bincount(det_ids, minlength=len(type_index)).tolist()
+        app_counts = np.bincount(app_ids, minlength=len(type_index)).tolist()
         
-        print(f"\nTotal detected: {len(detected)}")
-        print(f"Total approved: {len(approved)}")
-        print(f"Approval rate: {len(approved)/len(detected)*100:.1f}%\n" if detected else "\nNo opportunities detected.\n")
+        self._out(f"\nTotal detected: {n_det}")
+        self._out(f"Total approved: {n_app}")
+        if n_det:
+            self._out(f"Approval rate: {n_app / n_det * 100:.1f}%\n")
+        else:
+            self._out("\nNo opportunities detected.\n")
         
         # Validate each expected opportunity type
-        for opp_type, expectations in self.EXPECTED_OPPORTUNITIES.items():
-            detected_count = detected_counts.get(opp_type, 0)
-            approved_count = approved_counts.get(opp_type, 0)
-            min_expected = expectations["min_count"]
-            description = expectations["description"]
+        for opp_type, min_expected, description, idx in self._EXPECTED_LIST:
+            detected_count = det_counts[idx]
+            approved_count = app_counts[idx]
             
-            print(f"{opp_type}:")
-            print(f"  Description: {description}")
-            print(f"  Detected: {detected_count} (expected >= {min_expected})")
-            print(f"  Approved: {approved_count}")
+            self._out(f"{opp_type}:")
+            self._out(f"  Description: {description}")
+            self._out(f"  Detected: {detected_count} (expected >= {min_expected})")
+            self._out(f"  Approved: {approved_count}")
             
             # Test: detected count meets minimum
             test_name = f"{opp_type}_detection"
             if detected_count >= min_expected:
-                print(f"  ✓ PASS: Detection count meets expectations")
+                self._out(f"  ✓ PASS: Detection count meets expectations")
                 self._record_pass(test_name, f"Detected {detected_count} >= {min_expected}")
             else:
-                print(f"  ✗ FAIL: Expected >= {min_expected}, got {detected_count}")
+                self._out(f"  ✗ FAIL: Expected >= {min_expected}, got {detected_count}")
                 self._record_fail(test_name, f"Expected >= {min_expected}, got {detected_count}")
             
             # Test: some opportunities were approved (if any detected)
             if detected_count > 0:
                 approval_test = f"{opp_type}_approval"
                 if approved_count > 0:
-                    print(f"  ✓ PASS: Some opportunities approved ({approved_count}/{detected_count})")
+                    self._out(f"  ✓ PASS: Some opportunities approved ({approved_count}/{detected_count})")
                     self._record_pass(approval_test, f"{approved_count} approved")
                 else:
-                    print(f"  ⚠ WARNING: No opportunities approved (all filtered out)")
+                    self._out(f"  ⚠ WARNING: No opportunities approved (all filtered out)")
                     self._record_warning(approval_test, "All opportunities rejected by risk filters")
             
-            print()
+            self._out()
         
         # Check for unexpected opportunity types
-        unexpected_types = set(detected_counts.keys()) - set(self.EXPECTED_OPPORTUNITIES.keys())
+        unexpected_types = [
+            t for t, i in type_index.items()
+            if t not in self._EXPECTED_KEYS and det_counts[i]
+        ]
         if unexpected_types:
-            print("Unexpected opportunity types detected:")
+            self._out("Unexpected opportunity types detected:")
             for utype in unexpected_types:
-                print(f"  - {utype}: {detected_counts[utype]}")
-            print()
+                self._out(f"  - {utype}: {det_counts[type_index[utype]]}")
+            self._out()
         
         return {
-            "detected": len(detected),
-            "approved": len(approved),
-            "by_type": dict(detected_counts),
-            "approved_by_type": dict(approved_counts),
+            "detected": n_det,
+            "approved": n_app,
+            "by_type": {t: det_counts[i] for t, i in type_index.items() if det_counts[i]},
+            "approved_by_type": {t: app_counts[i] for t, i in type_index.items() if app_counts[i]},
         }
     
+    @_flush_output
     def validate_market_counts(
         self,
         poly_count: int,
@@ -140,124 +201,148 @@ class ScenarioValidator:
         total_count: int,
     ) -> bool:
         """Validate market counts from both venues."""
-        print("\n" + "=" * 80)
-        print("VALIDATING MARKET COUNTS")
-        print("=" * 80)
+        self._out("\n" + "=" * 80)
+        self._out("VALIDATING MARKET COUNTS")
+        self._out("=" * 80)
         
-        print(f"\nPolymarket markets: {poly_count}")
-        print(f"Kalshi markets: {kalshi_count}")
-        print(f"Total markets: {total_count}")
+        self._out(f"\nPolymarket markets: {poly_count}")
+        self._out(f"Kalshi markets: {kalshi_count}")
+        self._out(f"Total markets: {total_count}")
         
         # Test: market counts add up
         if poly_count + kalshi_count == total_count:
-            print("✓ PASS: Market counts add up correctly")
+            self._out("✓ PASS: Market counts add up correctly")
             self._record_pass("market_count_sum", f"{poly_count} + {kalshi_count} = {total_count}")
             return True
         else:
-            print(f"✗ FAIL: {poly_count} + {kalshi_count} != {total_count}")
+            self._out(f"✗ FAIL: {poly_count} + {kalshi_count} != {total_count}")
             self._record_fail("market_count_sum", "Market counts don't add up")
             return False
     
-    def validate_exchange_tags(self, markets: List) -> bool:
-        """Validate that all markets have proper exchange tags."""
-        print("\n" + "=" * 80)
-        print("VALIDATING EXCHANGE TAGS")
-        print("=" * 80)
+    @_flush_output
+    def validate_exchange_tags(self, poly_markets: List, kalshi_markets: List, untagged: List) -> bool:
+        """Validate that all markets have proper exchange tags.
         
-        untagged = [m for m in markets if not getattr(m, 'exchange', None)]
-        poly_markets = [m for m in markets if getattr(m, 'exchange', None) == "polymarket"]
-        kalshi_markets = [m for m in markets if getattr(m, 'exchange', None) == "kalshi"]
+        Takes the lists produced by partition_by_exchange().
+        """
+        self._out("\n" + "=" * 80)
+        self._out("VALIDATING EXCHANGE TAGS")
+        self._out("=" * 80)
         
-        print(f"\nPolymarket-tagged: {len(poly_markets)}")
-        print(f"Kalshi-tagged: {len(kalshi_markets)}")
-        print(f"Untagged: {len(untagged)}")
+        self._out(f"\nPolymarket-tagged: {len(poly_markets)}")
+        self._out(f"Kalshi-tagged: {len(kalshi_markets)}")
+        self._out(f"Untagged: {len(untagged)}")
         
         if untagged:
-            print("\n✗ FAIL: Found markets without exchange tags:")
+            self._out("\n✗ FAIL: Found markets without exchange tags:")
             for m in untagged[:5]:  # Show first 5
-                print(f"  - {m.id}")
+                self._out(f"  - {m.id}")
             self._record_fail("exchange_tags", f"{len(untagged)} markets without exchange tags")
             return False
         else:
-            print("\n✓ PASS: All markets properly tagged")
+            self._out("\n✓ PASS: All markets properly tagged")
             self._record_pass("exchange_tags", "All markets have exchange tags")
             return True
     
+    @_flush_output
     def validate_determinism(self, seed: int = 42) -> bool:
         """Validate that same seed produces same results."""
-        print("\n" + "=" * 80)
-        print("VALIDATING DETERMINISM")
-        print("=" * 80)
+        self._out("\n" + "=" * 80)
+        self._out("VALIDATING DETERMINISM")
+        self._out("=" * 80)
         
-        print(f"\nGenerating scenario twice with seed={seed}...")
+        self._out(f"\nGenerating scenario twice with seed={seed}...")
         
         poly1, kalshi1 = get_cross_venue_scenario(seed=seed)
         poly2, kalshi2 = get_cross_venue_scenario(seed=seed)
         
         # Check counts match
         if len(poly1) != len(poly2) or len(kalshi1) != len(kalshi2):
-            print(f"✗ FAIL: Market counts don't match")
-            print(f"  Run 1: {len(poly1)} poly, {len(kalshi1)} kalshi")
-            print(f"  Run 2: {len(poly2)} poly, {len(kalshi2)} kalshi")
+            self._out(f"✗ FAIL: Market counts don't match")
+            self._out(f"  Run 1: {len(poly1)} poly, {len(kalshi1)} kalshi")
+            self._out(f"  Run 2: {len(poly2)} poly, {len(kalshi2)} kalshi")
             self._record_fail("determinism", "Market counts differ between runs")
             return False
         
-        # Check market IDs match
-        poly1_ids = sorted([m.id for m in poly1])
-        poly2_ids = sorted([m.id for m in poly2])
-        kalshi1_ids = sorted([m.id for m in kalshi1])
-        kalshi2_ids = sorted([m.id for m in kalshi2])
-        
-        if poly1_ids != poly2_ids or kalshi1_ids != kalshi2_ids:
-            print(f"✗ FAIL: Market IDs don't match between runs")
+        # Check market IDs match, in order: the generator emits markets in a
+        # fixed order per seed, and the price check below compares by position
+        if ([m.id for m in poly1] != [m.id for m in poly2]
+                or [m.id for m in kalshi1] != [m.id for m in kalshi2]):
+            self._out(f"✗ FAIL: Market IDs don't match between runs")
             self._record_fail("determinism", "Market IDs differ between runs")
             return False
         
-        # Check prices match (within tolerance)
-        for m1, m2 in zip(poly1, poly2):
-            for o1, o2 in zip(m1.outcomes, m2.outcomes):
-                if abs(o1.price - o2.price) > 1e-6:
-                    print(f"✗ FAIL: Prices don't match for {m1.id}")
-                    print(f"  {o1.id}: {o1.price} vs {o2.price}")
-                    self._record_fail("determinism", f"Prices differ for {m1.id}")
-                    return False
+        # Check prices match (within tolerance), flattened to one array per run
+        p1 = np.array([o.price for m in poly1 for o in m.outcomes], dtype=np.float64)
+        p2 = np.array([o.price for m in poly2 for o in m.outcomes], dtype=np.float64)
+        if p1.shape != p2.shape:
+            self._out(f"✗ FAIL: Outcome counts don't match between runs")
+            self._record_fail("determinism", "Outcome counts differ between runs")
+            return False
+        # argmax on a bool array stops at the first True, so one scan both
+        # detects a mismatch and locates it
+        mismatch = np.abs(p1 - p2) > 1e-6
+        i = int(np.argmax(mismatch)) if mismatch.size else 0
+        if mismatch.size and mismatch[i]:
+            # Parallel (market, outcome) ids name the first differing price
+            owners = [(m.id, o.id) for m in poly1 for o in m.outcomes]
+            market_id, outcome_id = owners[i]
+            self._out(f"✗ FAIL: Prices don't match for {market_id}")
+            self._out(f"  {outcome_id}: {p1[i]} vs {p2[i]}")
+            self._record_fail("determinism", f"Prices differ for {market_id}")
+            return False
         
-        print("✓ PASS: Same seed produces identical results")
+        self._out("✓ PASS: Same seed produces identical results")
         self._record_pass("determinism", "Seed produces consistent results")
+        self.scenario = (poly1, kalshi1)
         return True
     
+    @_flush_output
     def print_summary(self) -> int:
         """Print validation summary and return exit code."""
-        print("\n" + "=" * 80)
-        print("VALIDATION SUMMARY")
-        print("=" * 80)
+        self._out("\n" + "=" * 80, force=True)
+        self._out("VALIDATION SUMMARY", force=True)
+        self._out("=" * 80, force=True)
         
-        print(f"\n✓ Passed: {self.results['passed']}")
-        print(f"✗ Failed: {self.results['failed']}")
-        print(f"⚠ Warnings: {self.results['warnings']}")
+        self._out(f"\n✓ Passed: {self.results['passed']}", force=True)
+        self._out(f"✗ Failed: {self.results['failed']}", force=True)
+        self._out(f"⚠ Warnings: {self.results['warnings']}", force=True)
         
         total = self.results['passed'] + self.results['failed'] + self.results['warnings']
         if total > 0:
             pass_rate = self.results['passed'] / total * 100
-            print(f"\nPass rate: {pass_rate:.1f}%")
+            self._out(f"\nPass rate: {pass_rate:.1f}%", force=True)
         
         if self.verbose and self.results['failed'] > 0:
-            print("\nFailed tests:")
+            self._out("\nFailed tests:", force=True)
             for test in self.results['tests']:
                 if test['status'] == 'FAIL':
-                    print(f"  - {test['name']}: {test['message']}")
+                    self._out(f"  - {test['name']}: {test['message']}", force=True)
         
         # Return exit code
         if self.results['failed'] > 0:
-            print("\n❌ VALIDATION FAILED")
+            self._out("\n❌ VALIDATION FAILED", force=True)
             return 1
         elif self.results['warnings'] > 0:
-            print("\n⚠ VALIDATION PASSED WITH WARNINGS")
+            self._out("\n⚠ VALIDATION PASSED WITH WARNINGS", force=True)
             return 0
         else:
-            print("\n✅ ALL VALIDATIONS PASSED")
+            self._out("\n✅ ALL VALIDATIONS PASSED", force=True)
             return 0
     
+    def _out(self, line: str = "", force: bool = False):
+        """Buffer one line of report output; dropped when not verbose unless forced."""
+        if self.verbose or force:
+            self._buf.write(line)
+            self._buf.write("\n")
+    
+    def _flush(self):
+        """Write buffered output to stdout in a single call and reset the buffer."""
+        if self._buf.tell():
+            sys.stdout.write(self._buf.getvalue())
+            self._buf.seek(0)
+            self._buf.truncate()
+    
     def _record_pass(self, test_name: str, message: str):
         self.results['passed'] += 1
         self.results['tests'].append({
@@ -311,7 +396,8 @@ def run_comprehensive_stress_test(seed: int = 42, verbose: bool = True) -> int:
     print("GENERATING CROSS-VENUE SCENARIO")
     print("=" * 80)
     
-    poly_markets, kalshi_markets = get_cross_venue_scenario(seed=seed)
+    # Determinism was just verified, so the first run is the scenario for this seed
+    poly_markets, kalshi_markets = validator.scenario
     
     print(f"\n✓ Generated {len(poly_markets)} Polymarket markets")
     print(f"✓ Generated {len(kalshi_markets)} Kalshi markets")
@@ -370,11 +456,10 @@ def run_comprehensive_stress_test(seed: int = 42, verbose: bool = True) -> int:
     print(f"✓ Approved {len(approved_opps)} opportunities")
     
     # Step 7: Validate results
-    poly_count = len([m for m in all_markets if getattr(m, 'exchange', None) == "polymarket"])
-    kalshi_count = len([m for m in all_markets if getattr(m, 'exchange', None) == "kalshi"])
+    poly_tagged, kalshi_tagged, untagged = partition_by_exchange(all_markets)
     
-    validator.validate_market_counts(poly_count, kalshi_count, len(all_markets))
-    validator.validate_exchange_tags(all_markets)
+    validator.validate_market_counts(len(poly_tagged), len(kalshi_tagged), len(all_markets))
+    validator.validate_exchange_tags(poly_tagged, kalshi_tagged, untagged)
     validator.validate_detected_opportunities(detected_opps, approved_opps)
     
     # Step 8: Check unified report
@@ -383,12 +468,18 @@ def run_comprehensive_stress_test(seed: int = 42, verbose: bool = True) -> int:
     print("=" * 80)
     
     report_path = Path("reports/unified_report.json")
+    log_path = report_path.with_suffix(".jsonl")
     if report_path.exists():
-        with open(report_path, 'r') as f:
-            report = json.load(f)
+        with open(report_path, 'rb') as f:
+            report = fastjson.loads(f.read())
+        iteration_count = len(report.get('iterations', []))
+        # The log holds iterations recorded since the last snapshot
+        if log_path.exists():
+            with open(log_path, 'rb') as f:
+                iteration_count += sum(1 for line in f if line.strip())
         
         print(f"\n✓ Unified report exists")
-        print(f"✓ Sessions: {len(report.get('sessions', []))}")
+        print(f"✓ Iterations: {iteration_count}")
         print(f"✓ Report path: {report_path}")
     else:
         print(f"\n⚠ WARNING: Unified report not found at {report_path}")
@@ -14,9 +14,10 @@ Usage:
 import sys
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -26,6 +27,8 @@ from predarb.polymarket_client import PolymarketClient
 from predarb.injection import InjectionSource
 from predarb.engine import Engine
 from predarb.config import load_config
+from predarb.console import BackgroundConsole
+from predarb.refresh import AdaptiveRefresh
 
 
 class MixedMarketProvider:
@@ -35,53 +38,79 @@ class MixedMarketProvider:
     Uses existing injection system and Polymarket client.
     """
     
-    def __init__(self, polymarket_client, injected_provider, mix_ratio: float = 0.1):
+    def __init__(self, polymarket_client, injected_provider, mix_ratio: float = 0.1,
+                 console: Optional[BackgroundConsole] = None):
         """
         Args:
             polymarket_client: Real PolymarketClient
             injected_provider: Scenario/file/inline provider
             mix_ratio: Ratio of injected to real markets (0.1 = 10% injected)
+            console: Background console for status lines (prints directly if None)
         """
         self.polymarket_client = polymarket_client
         self.injected_provider = injected_provider
         self.mix_ratio = mix_ratio
         self.call_count = 0
+        self._print = console.print if console is not None else print
+        # One worker per source, reused across iterations
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._prefixes: List[str] = []
+    
+    def _id_prefixes(self, count: int) -> List[str]:
+        """Return at least count "INJECTED_NNN_" prefixes, each formatted once per run."""
+        prefixes = self._prefixes
+        if len(prefixes) < count:
+            prefixes.extend(f"INJECTED_{i:03d}_" for i in range(len(prefixes), count))
+        return prefixes
     
     def fetch_markets(self) -> List[Market]:
         """Fetch and combine real + injected markets."""
         self.call_count += 1
         
+        # The two sources are independent, so fetch them concurrently: the
+        # iteration waits for the slower one instead of their sum
+        real_future = self._executor.submit(self.polymarket_client.fetch_markets)
+        # The injected share can't exceed the ratio of a full Polymarket page,
+        # so only that many injected markets need to be built
+        page_limit = getattr(self.polymarket_client, "MARKETS_PAGE_LIMIT", None)
+        injected_limit = max(1, int(page_limit * self.mix_ratio)) if page_limit else None
+        injected_future = self._executor.submit(self.injected_provider.fetch_markets, injected_limit)
+        
         # Get real markets from Polymarket
         real_markets = []
         try:
-            real_markets = self.polymarket_client.fetch_markets()
-            print(f"[{self.call_count}] ✓ Fetched {len(real_markets)} real Polymarket markets")
+            real_markets = real_future.result()
+            self._print(f"[{self.call_count}] ✓ Fetched {len(real_markets)} real Polymarket markets")
         except Exception as e:
-            print(f"[{self.call_count}] ⚠ Failed to fetch real markets: {e}")
+            self._print(f"[{self.call_count}] ⚠ Failed to fetch real markets: {e}")
         
         # Get injected markets from scenario
         injected_markets = []
         try:
-            all_injected = self.injected_provider.fetch_markets()
+            all_injected = injected_future.result()
             # Limit based on mix ratio
             if real_markets:
                 num_injected = max(1, int(len(real_markets) * self.mix_ratio))
             else:
+                # No real markets: inject the full scenario
+                if injected_limit is not None:
+                    all_injected = self.injected_provider.fetch_markets()
                 num_injected = len(all_injected)
             
             injected_markets = all_injected[:num_injected]
             
-            # Prefix IDs to avoid conflicts with real markets
-            for i, market in enumerate(injected_markets):
-                market.id = f"INJECTED_{i:03d}_{market.id}"
+            # Prefix IDs to avoid conflicts with real markets. Providers build
+            # fresh Market objects per call, so renaming in place is safe
+            for prefix, market in zip(self._id_prefixes(len(injected_markets)), injected_markets):
+                market.id = prefix + market.id
             
-            print(f"[{self.call_count}] ✓ Added {len(injected_markets)} injected markets (ratio={self.mix_ratio:.1%})")
+            self._print(f"[{self.call_count}] ✓ Added {len(injected_markets)} injected markets (ratio={self.mix_ratio:.1%})")
         except Exception as e:
-            print(f"[{self.call_count}] ⚠ Failed to fetch injected markets: {e}")
+            self._print(f"[{self.call_count}] ⚠ Failed to fetch injected markets: {e}")
         
         # Combine markets
         combined = real_markets + injected_markets
-        print(f"[{self.call_count}] → Total: {len(combined)} markets (real={len(real_markets)}, injected={len(injected_markets)})\n")
+        self._print(f"[{self.call_count}] → Total: {len(combined)} markets (real={len(real_markets)}, injected={len(injected_markets)})\n")
         
         return combined
 
@@ -157,12 +186,17 @@ Examples:
     print(f"[Setup] Creating injected provider: scenario={args.scenario}, seed={args.seed}")
     injected_provider = InjectionSource.from_spec(f"scenario:{args.scenario}", seed=args.seed)
     
+    # Per-iteration status goes through a background writer so the loop
+    # never blocks on stdout
+    console = BackgroundConsole()
+    
     # Create mixed provider
     print(f"[Setup] Creating mixed provider: mix_ratio={args.mix_ratio:.1%}")
     mixed_provider = MixedMarketProvider(
         polymarket_client=polymarket_client,
         injected_provider=injected_provider,
-        mix_ratio=args.mix_ratio
+        mix_ratio=args.mix_ratio,
+        console=console,
     )
     
     # Build engine (uses existing UnifiedReporter + LiveReporter)
@@ -172,7 +206,10 @@ Examples:
     # Calculate timing
     start_time = datetime.now()
     end_time = start_time + timedelta(days=args.days)
-    refresh_seconds = config.engine.refresh_seconds
+    # The loop checks its deadline on the monotonic clock; end_time is for display
+    end_monotonic = time.monotonic() + args.days * 86400
+    refresher = AdaptiveRefresh.from_config(config.engine)
+    refresh_seconds = refresher.seconds
     
     print("\n" + "="*70)
     print("STARTING CONTINUOUS RUN")
@@ -182,23 +219,37 @@ Examples:
     print(f"Duration:      {args.days} days ({args.days * 24:.1f} hours)")
     print(f"Scenario:      {args.scenario}")
     print(f"Mix ratio:     {args.mix_ratio:.1%} injected")
-    print(f"Refresh:       {refresh_seconds}s")
+    if config.engine.adaptive_refresh:
+        print(f"Refresh:       adaptive {refresher.minimum}-{refresher.maximum}s (start {refresh_seconds}s)")
+    else:
+        print(f"Refresh:       {refresh_seconds}s")
     print(f"Reports:       reports/unified_report.json")
     print(f"               reports/live_summary.csv")
     print("="*70)
     print()
     
     # Run continuously
+    console.attach_logging()
     iteration = 0
     try:
-        while datetime.now() < end_time:
+        while True:
+            iteration_start = time.monotonic()
+            if iteration_start >= end_monotonic:
+                break
             iteration += 1
-            time_left = end_time - datetime.now()
-            hours_left = time_left.total_seconds() / 3600
+            seconds_left = end_monotonic - iteration_start
+            hours_left = seconds_left / 3600
             
-            print(f"{'='*70}")
-            print(f"ITERATION {iteration} | Time left: {hours_left:.2f}h ({time_left})")
-            print(f"{'='*70}")
+            console.print(f"{'='*70}")
+            # Interpolated by the console thread, off the iteration's clock
+            console.print(
+                "ITERATION %d | Time left: %.2fh (%s)",
+                iteration, hours_left, timedelta(seconds=int(seconds_left)),
+            )
+            if config.polymarket.markets_ttl_seconds > 0:
+                stats = polymarket_client.get_cache_stats()
+                console.print(f"Market cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_ratio']:.0%})")
+            console.print(f"{'='*70}")
             
             # Run one iteration (uses existing reporters)
             engine.run_once()
@@ -210,19 +261,25 @@ Examples:
                 detected_opportunities=engine._last_detected,
                 approved_opportunities=engine._last_approved,
             )
+            refresh_seconds = refresher.update(len(engine._last_detected))
             
-            # Sleep if more time left
-            if datetime.now() < end_time:
-                print(f"\n[Sleep] Waiting {refresh_seconds}s before next iteration...\n")
-                time.sleep(refresh_seconds)
+            # Sleep out the rest of the refresh interval if more time left, so
+            # the fetch and detection time counts toward it instead of adding to it
+            now = time.monotonic()
+            if now < end_monotonic:
+                sleep_time = max(0.0, refresh_seconds - (now - iteration_start))
+                console.print(f"\n[Sleep] Waiting {sleep_time:.1f}s before next iteration...\n")
+                time.sleep(sleep_time)
     
     except KeyboardInterrupt:
+        console.flush()
         print("\n")
         print("="*70)
         print("⏹ STOPPED BY USER (Ctrl+C)")
         print("="*70)
     
     except Exception as e:
+        console.flush()
         print("\n")
         print("="*70)
         print(f"❌ ERROR: {e}")
@@ -232,6 +289,11 @@ Examples:
         sys.exit(1)
     
     finally:
+        console.close()
+        
+        # Persist report changes held back between snapshots
+        engine.reporter.flush()
+        
         # Final summary
         end_actual = datetime.now()
         duration = end_actual - start_time
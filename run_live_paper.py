@@ -25,20 +25,36 @@ import argparse
 import logging
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from predarb.config import load_config
+from predarb.console import BackgroundConsole
 from predarb.engine import Engine
+from predarb.market_client_base import RealTimeDataSource
 from predarb.models import Market
+from predarb.refresh import AdaptiveRefresh
 
 logger = logging.getLogger(__name__)
 
 
+# (DetectorConfig flag, banner label); add a row when adding a detector
+DETECTOR_LABELS = (
+    ("enable_parity", "Parity"),
+    ("enable_ladder", "Ladder"),
+    ("enable_exclusive_sum", "ExclusiveSum"),
+    ("enable_consistency", "Consistency"),
+    ("enable_duplicate", "Duplicate (REQUIRES SHORT SELLING)"),
+    ("enable_timelag", "TimeLag"),
+)
+
+
 class LivePaperTradingRunner:
     """
     Manages live paper trading session with real-time data only.
@@ -68,10 +84,14 @@ class LivePaperTradingRunner:
         # Override config with runtime parameters
         self.config.broker.initial_cash = initial_capital
         
-        # Calculate iterations from duration and refresh rate
-        refresh_seconds = self.config.engine.refresh_seconds
+        # Calculate iterations from duration and refresh rate. An adaptive
+        # interval can run as fast as its minimum, so bound by that and let
+        # the duration limit end the run
+        self.refresher = AdaptiveRefresh.from_config(self.config.engine)
+        refresh_seconds = self.refresher.minimum
         total_seconds = duration_hours * 3600
         self.config.engine.iterations = int(total_seconds / refresh_seconds)
+        self.iterations_run = 0
         
         # Initialize engine
         self.engine = Engine(self.config)
@@ -85,15 +105,22 @@ class LivePaperTradingRunner:
         self.rejection_reasons: Dict[str, int] = {}
         self.max_drawdown = 0.0
         self.peak_balance = initial_capital
+        # Per-iteration output is written by a background thread
+        self.console = BackgroundConsole()
+        self.enabled_detectors = ", ".join(
+            label
+            for flag, label in DETECTOR_LABELS
+            if getattr(self.config.detectors, flag)
+        )
         
     def validate_live_data_only(self):
         """
         Verify that we're using real-time data only (no injection).
         """
-        # Check that no clients are injection providers
+        # Only clients marked as real-time exchange sources are allowed
         for client in self.engine.clients:
-            class_name = client.__class__.__name__
-            if "Injection" in class_name or "Static" in class_name or "Fake" in class_name:
+            if not isinstance(client, RealTimeDataSource):
+                class_name = client.__class__.__name__
                 raise RuntimeError(
                     f"VALIDATION FAILED: Client {class_name} appears to be using "
                     f"injected/fake data. Live paper trading requires ONLY real-time "
@@ -133,23 +160,22 @@ class LivePaperTradingRunner:
         # Calculate unrealized PnL (requires market data)
         unrealized_pnl = 0.0
         if self.engine._last_markets:
-            market_lookup = {m.id: m for m in self.engine._last_markets}
-            unrealized_pnl = broker._unrealized_pnl(market_lookup)
+            unrealized_pnl = broker._unrealized_pnl(self.engine._last_markets_by_id)
         
         total_equity = broker.cash + unrealized_pnl
         realized_pnl = broker.cash - self.initial_capital
         
-        print(f"\n{'='*70}")
-        print(f"Iteration {iteration}/{self.config.engine.iterations}")
-        print(f"{'='*70}")
-        print(f"Cash Available:    ${broker.cash:,.2f}")
-        print(f"Unrealized PnL:    ${unrealized_pnl:,.2f}")
-        print(f"Total Equity:      ${total_equity:,.2f}")
-        print(f"Realized PnL:      ${realized_pnl:,.2f}")
-        print(f"Active Positions:  {len([v for v in broker.positions.values() if v != 0])}")
-        print(f"Total Trades:      {len(broker.trades)}")
-        print(f"Max Drawdown:      {self.max_drawdown:.2%}")
-        print(f"{'='*70}")
+        self.console.print(f"\n{'='*70}")
+        self.console.print(f"Iteration {iteration}/{self.config.engine.iterations}")
+        self.console.print(f"{'='*70}")
+        self.console.print(f"Cash Available:    ${broker.cash:,.2f}")
+        self.console.print(f"Unrealized PnL:    ${unrealized_pnl:,.2f}")
+        self.console.print(f"Total Equity:      ${total_equity:,.2f}")
+        self.console.print(f"Realized PnL:      ${realized_pnl:,.2f}")
+        self.console.print(f"Active Positions:  {len([v for v in broker.positions.values() if v != 0])}")
+        self.console.print(f"Total Trades:      {len(broker.trades)}")
+        self.console.print(f"Max Drawdown:      {self.max_drawdown:.2%}")
+        self.console.print(f"{'='*70}")
     
     def run(self):
         """
@@ -175,7 +201,10 @@ class LivePaperTradingRunner:
         print(f"Starting Capital:  ${self.initial_capital:,.2f} USDC")
         print(f"Duration:          {self.duration_hours} hours")
         print(f"Iterations:        {self.config.engine.iterations}")
-        print(f"Refresh Rate:      {self.config.engine.refresh_seconds}s")
+        if self.config.engine.adaptive_refresh:
+            print(f"Refresh Rate:      adaptive {self.refresher.minimum}-{self.refresher.maximum}s")
+        else:
+            print(f"Refresh Rate:      {self.config.engine.refresh_seconds}s")
         print(f"Stop Loss:         {self.config.risk.kill_switch_drawdown:.1%} drawdown")
         print(f"Max Per Trade:     ${self.config.broker.initial_cash * self.config.risk.max_allocation_per_market:,.2f}")
         print(f"Fee:               {self.config.broker.fee_bps} bps")
@@ -189,39 +218,26 @@ class LivePaperTradingRunner:
             print(f"\n❌ {e}")
             sys.exit(1)
         
-        # Print enabled detectors
-        enabled_detectors = []
-        if self.config.detectors.enable_parity:
-            enabled_detectors.append("Parity")
-        if self.config.detectors.enable_ladder:
-            enabled_detectors.append("Ladder")
-        if self.config.detectors.enable_exclusive_sum:
-            enabled_detectors.append("ExclusiveSum")
-        if self.config.detectors.enable_consistency:
-            enabled_detectors.append("Consistency")
-        if self.config.detectors.enable_duplicate:
-            enabled_detectors.append("Duplicate (REQUIRES SHORT SELLING)")
-        if self.config.detectors.enable_timelag:
-            enabled_detectors.append("TimeLag")
-        
-        print(f"\nEnabled Detectors: {', '.join(enabled_detectors)}")
+        print(f"\nEnabled Detectors: {self.enabled_detectors}")
         print(f"Report Output:     {self.config.engine.report_path}")
         print("\n" + "="*80)
         print("STARTING TRADING SESSION")
         print("="*80 + "\n")
         
         self.start_time = datetime.now()
-        end_target = self.start_time + timedelta(hours=self.duration_hours)
+        # Deadline on the monotonic clock: one read per iteration, immune to clock changes
+        end_monotonic = time.monotonic() + self.duration_hours * 3600
+        self.console.attach_logging()
         
         try:
             for i in range(1, self.config.engine.iterations + 1):
-                iteration_start = time.time()
+                iteration_start = time.monotonic()
                 
                 # Check if we've hit time limit
-                now = datetime.now()
-                if now >= end_target:
-                    print(f"\n⏰ Duration limit reached: {self.duration_hours} hours")
+                if iteration_start >= end_monotonic:
+                    self.console.print(f"\n⏰ Duration limit reached: {self.duration_hours} hours")
                     break
+                self.iterations_run = i
                 
                 # Print wallet state every 10 iterations or on first iteration
                 if i == 1 or i % 10 == 0:
@@ -235,6 +251,7 @@ class LivePaperTradingRunner:
                     
                     # Track opportunity metrics
                     detected = len(self.engine._last_detected)
+                    self.refresher.update(detected)
                     approved = len(approved_opps)
                     rejected = detected - approved
                     
@@ -243,7 +260,7 @@ class LivePaperTradingRunner:
                     self.total_opportunities_rejected += rejected
                     
                     if detected > 0:
-                        print(f"  → Detected: {detected} opportunities, Approved: {approved}, Rejected: {rejected}")
+                        self.console.print(f"  → Detected: {detected} opportunities, Approved: {approved}, Rejected: {rejected}")
                     
                     # Report iteration to unified reporter
                     self.engine.reporter.report_iteration(
@@ -255,23 +272,25 @@ class LivePaperTradingRunner:
                     
                 except Exception as e:
                     logger.error(f"Iteration {i} failed: {e}", exc_info=True)
-                    print(f"  ❌ Error: {e}")
+                    self.console.print(f"  ❌ Error: {e}")
                 
                 # Check stop conditions
                 should_stop, reason = self.check_stop_conditions()
                 if should_stop:
-                    print(f"\n🛑 STOP CONDITION MET: {reason}")
+                    self.console.print(f"\n🛑 STOP CONDITION MET: {reason}")
                     break
                 
                 # Sleep until next iteration
-                elapsed = time.time() - iteration_start
-                sleep_time = max(0, self.config.engine.refresh_seconds - elapsed)
+                elapsed = time.monotonic() - iteration_start
+                sleep_time = max(0, self.refresher.seconds - elapsed)
                 if sleep_time > 0:
                     time.sleep(sleep_time)
                 
         except KeyboardInterrupt:
-            print("\n\n⚠️  Interrupted by user")
+            self.console.print("\n\n⚠️  Interrupted by user")
         finally:
+            self.console.close()
+            self.engine.reporter.flush()
             self.end_time = datetime.now()
             self.print_final_report()
     
@@ -283,28 +302,35 @@ class LivePaperTradingRunner:
         # Calculate final PnL
         unrealized_pnl = 0.0
         if self.engine._last_markets:
-            market_lookup = {m.id: m for m in self.engine._last_markets}
-            unrealized_pnl = broker._unrealized_pnl(market_lookup)
+            unrealized_pnl = broker._unrealized_pnl(self.engine._last_markets_by_id)
         
         final_equity = broker.cash + unrealized_pnl
         total_pnl = final_equity - self.initial_capital
         total_pnl_pct = (total_pnl / self.initial_capital) * 100
         
-        # Trade statistics
+        # Trade statistics: one pass over trades reads every field into a row,
+        # then each statistic is a NumPy reduction over a column
         trades = broker.trades
-        num_buys = len([t for t in trades if t.side == "BUY"])
-        num_sells = len([t for t in trades if t.side == "SELL"])
-        total_fees = sum(t.fees for t in trades)
-        total_slippage = sum(t.slippage for t in trades)
+        n = len(trades)
+        side_codes = {"BUY": 1.0, "SELL": -1.0}
+        rows = np.array(
+            [(t.fees, t.slippage, t.realized_pnl, side_codes.get(t.side, 0.0)) for t in trades],
+            dtype=np.float64,
+        ).reshape(n, 4)
+        fees, slippage, pnl, side = rows.T
+        num_buys = int(np.count_nonzero(side > 0))
+        num_sells = int(np.count_nonzero(side < 0))
+        total_fees = float(fees.sum())
+        total_slippage = float(slippage.sum())
         
         # Win rate calculation (simplified - count profitable closed positions)
-        win_count = len([t for t in trades if t.realized_pnl > 0])
-        loss_count = len([t for t in trades if t.realized_pnl < 0])
+        win_count = int(np.count_nonzero(pnl > 0))
+        loss_count = int(np.count_nonzero(pnl < 0))
         win_rate = (win_count / (win_count + loss_count) * 100) if (win_count + loss_count) > 0 else 0
         
         # Biggest win/loss
-        biggest_win = max([t.realized_pnl for t in trades], default=0)
-        biggest_loss = min([t.realized_pnl for t in trades], default=0)
+        biggest_win = float(pnl.max()) if n else 0
+        biggest_loss = float(pnl.min()) if n else 0
         
         # Active positions
         active_positions = {k: v for k, v in broker.positions.items() if v != 0}
@@ -318,7 +344,7 @@ class LivePaperTradingRunner:
         print(f"Start Time:        {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"End Time:          {self.end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Duration:          {duration} ({duration.total_seconds()/3600:.2f} hours)")
-        print(f"Iterations:        {self.config.engine.iterations} planned")
+        print(f"Iterations:        {self.iterations_run} run ({self.config.engine.iterations} planned)")
         
         print("\n💰 WALLET PERFORMANCE")
         print("-" * 80)
@@ -353,8 +379,8 @@ class LivePaperTradingRunner:
         print("-" * 80)
         if active_positions:
             print(f"Count:             {len(active_positions)}")
-            for key, qty in active_positions.items():
-                print(f"  {key}: {qty:.4f} shares")
+            for (market_id, outcome_id), qty in active_positions.items():
+                print(f"  {market_id}:{outcome_id}: {qty:.4f} shares")
         else:
             print("No active positions (all closed)")
         
@@ -12,8 +12,11 @@ Environment Variables:
 
 import argparse
 import logging
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import List, NamedTuple, Optional
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -22,10 +25,103 @@ from predarb.config import AppConfig, load_config
 from predarb.engine import Engine
 from predarb.notifiers.telegram import TelegramNotifierReal
 from predarb.testing import FakePolymarketClient
+from predarb.unified_reporter import UnifiedReporter
 
 logger = logging.getLogger(__name__)
 
 
+class SimResult(NamedTuple):
+    """Outcome of one simulation run."""
+
+    seed: int
+    initial_cash: float
+    cash: float
+    trades: int
+    report_path: str
+
+
+def run_simulation(
+    config_path: str,
+    days: int,
+    markets: int,
+    seed: int,
+    notifier=None,
+    reports_dir: Optional[str] = None,
+    telegram_from_config: bool = True,
+) -> SimResult:
+    """Run one simulation and return its result.
+
+    Module-level and built only from picklable arguments so it can run in a
+    worker process. With reports_dir set, the run writes its reports there
+    instead of the shared reports/ directory, so parallel runs do not
+    overwrite each other. telegram_from_config=False stops the engine from
+    building its own Telegram notifier from config.
+    """
+    config = load_config(config_path)
+    if not telegram_from_config:
+        config.telegram.enabled = False
+    if reports_dir is not None:
+        config.engine.report_path = str(Path(reports_dir) / Path(config.engine.report_path).name)
+
+    fake_client = FakePolymarketClient(num_markets=markets, days=days, seed=seed)
+    logger.info(f"Created FakePolymarketClient: {markets} markets, {days} days, seed {seed}")
+
+    engine = Engine(config, fake_client, notifier=notifier)
+    if reports_dir is not None:
+        engine.reporter = UnifiedReporter(
+            reports_dir=Path(reports_dir),
+            snapshot_interval=config.engine.report_snapshot_seconds,
+            save_detected_opportunities=config.engine.save_detected_opportunities,
+        )
+
+    # Configure for simulation
+    engine.config.engine.iterations = days * 24 * 60  # One iteration per minute
+    logger.info(f"Running {engine.config.engine.iterations} iterations ({days} days @ 1 min/iteration)")
+    engine.run()
+
+    return SimResult(
+        seed=seed,
+        initial_cash=engine.config.broker.initial_cash,
+        cash=engine.broker.cash,
+        trades=len(engine.broker.trades),
+        report_path=str(engine.report_path),
+    )
+
+
+def _run_worker(config_path: str, days: int, markets: int, seed: int, verbose: bool) -> SimResult:
+    """Worker-process entry point: the parent sends the only Telegram summary."""
+    setup_logging(verbose)
+    return run_simulation(
+        config_path,
+        days,
+        markets,
+        seed,
+        reports_dir=f"reports/sim_seed_{seed}",
+        telegram_from_config=False,
+    )
+
+
+def run_many(args: argparse.Namespace, seeds: List[int]) -> List[SimResult]:
+    """Run one simulation per seed, up to args.parallel at a time."""
+    results: List[SimResult] = []
+    workers = min(args.parallel, len(seeds))
+    # spawn gives every worker a fresh interpreter, independent of parent state
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {
+            pool.submit(_run_worker, args.config, args.days, args.markets, seed, args.verbose): seed
+            for seed in seeds
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            logger.info(
+                f"Seed {result.seed}: {result.trades} trades, "
+                f"net PnL ${result.cash - result.initial_cash:+.2f}"
+            )
+            results.append(result)
+    return sorted(results, key=lambda r: r.seed)
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -89,6 +185,18 @@ Examples:
         action="store_true",
         help="Enable verbose logging",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of simulations to run at once in separate processes (default: 1)",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        nargs="+",
+        help="Seeds to simulate, one run each (default: --parallel seeds from --seed up)",
+    )
     parser.add_argument(
         "--no-telegram",
         action="store_true",
@@ -103,31 +211,21 @@ Examples:
     logger.info("=" * 80)
     logger.info(f"Days: {args.days}")
     logger.info(f"Trade Size: ${args.trade_size}")
-    logger.info(f"Seed: {args.seed}")
+    seeds = args.seeds or [args.seed + i for i in range(max(args.parallel, 1))]
+    logger.info(f"Seeds: {', '.join(str(seed) for seed in seeds)}")
     logger.info(f"Markets: {args.markets}")
     logger.info(f"Config: {args.config}")
     logger.info(f"Telegram Enabled: {not args.no_telegram}")
     logger.info("=" * 80)
 
+    notifier = None
     try:
         # Load configuration
         if not Path(args.config).exists():
             logger.error(f"Config file not found: {args.config}")
             sys.exit(1)
 
-        config = load_config(args.config)
-        logger.info(f"Loaded config from {args.config}")
-
-        # Create fake Polymarket client
-        fake_client = FakePolymarketClient(
-            num_markets=args.markets,
-            days=args.days,
-            seed=args.seed,
-        )
-        logger.info(f"Created FakePolymarketClient: {args.markets} markets, {args.days} days")
-
         # Create notifier
-        notifier = None
         if not args.no_telegram:
             try:
                 notifier = TelegramNotifierReal()
@@ -137,7 +235,7 @@ Examples:
                     f"📈 Arbitrage bot simulation started\n"
                     f"Days: {args.days}\n"
                     f"Markets: {args.markets}\n"
-                    f"Seed: {args.seed}"
+                    f"Seeds: {', '.join(str(seed) for seed in seeds)}"
                 )
             except ValueError as e:
                 logger.error(f"Failed to initialize Telegram: {e}")
@@ -146,39 +244,44 @@ Examples:
         else:
             logger.info("Telegram disabled (--no-telegram flag)")
 
-        # Create and run engine
-        engine = Engine(config, fake_client, notifier)
-        logger.info("Initialized Engine with FakePolymarketClient")
-
-        # Configure for simulation
-        engine.config.engine.iterations = args.days * 24 * 60  # One iteration per minute
-        logger.info(f"Running {engine.config.engine.iterations} iterations ({args.days} days @ 1 min/iteration)")
-
-        # Run simulation
+        # Run simulation(s)
         logger.info("Starting simulation...")
-        engine.run()
+        if len(seeds) == 1:
+            results = [run_simulation(args.config, args.days, args.markets, seeds[0], notifier=notifier)]
+        else:
+            results = run_many(args, seeds)
+
+        initial_cash = sum(r.initial_cash for r in results)
+        final_cash = sum(r.cash for r in results)
+        trades = sum(r.trades for r in results)
 
         logger.info("=" * 80)
         logger.info("SIMULATION COMPLETE")
         logger.info("=" * 80)
-        logger.info(f"Cash remaining: ${engine.broker.cash:.2f}")
-        logger.info(f"Trades executed: {len(engine.broker.trades)}")
-        logger.info(f"Report written to: {engine.report_path}")
+        logger.info(f"Cash remaining: ${final_cash:.2f}")
+        logger.info(f"Trades executed: {trades}")
+        for result in results:
+            logger.info(f"Report written to: {result.report_path}")
 
         # Send final summary via Telegram
         if notifier:
-            final_pnl = engine.broker.cash - engine.config.broker.initial_cash
+            final_pnl = final_cash - initial_cash
             notifier.send(
                 f"✅ Simulation complete\n"
-                f"Trades executed: {len(engine.broker.trades)}\n"
-                f"Initial cash: ${engine.config.broker.initial_cash:.2f}\n"
-                f"Final cash: ${engine.broker.cash:.2f}\n"
+                f"Runs: {len(results)}\n"
+                f"Trades executed: {trades}\n"
+                f"Initial cash: ${initial_cash:.2f}\n"
+                f"Final cash: ${final_cash:.2f}\n"
                 f"Net PnL: ${final_pnl:+.2f}"
             )
 
     except Exception as e:
         logger.exception(f"Simulation failed: {e}")
         sys.exit(1)
+    finally:
+        # Messages are posted by a background thread; deliver the backlog
+        if notifier:
+            notifier.flush()
 
 
 if __name__ == "__main__":
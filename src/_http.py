@@ -0,0 +1,84 @@
+"""
+Shared HTTP session for Polymarket REST calls.
+
+One pooled requests.Session keeps TCP/TLS connections to the same host
+alive between calls instead of opening a new connection per request.
+When httpx is installed with HTTP/2 support, create_http2_client() offers a
+drop-in alternative that multiplexes concurrent requests over one connection.
+"""
+import logging
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "polymarket-arb-bot/1.0"
+# (connect, read) seconds: fail fast on an unreachable host, allow a slow body
+REQUEST_TIMEOUT = (3.05, 10)
+# Status retries shared by the requests session and the httpx client
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_connections: int = 8, pool_maxsize: int = 32) -> requests.Session:
+    """Build a session with connection pooling and retries on 429 and transient 5xx.
+
+    Retries back off exponentially and honour a 429's Retry-After header.
+    """
+    retry = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF, status_forcelist=list(RETRY_STATUSES))
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def retry_delay(resp: Any, attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1 of a retryable response.
+
+    Honours a numeric Retry-After header, otherwise backs off exponentially
+    like the requests session's urllib3 Retry.
+    """
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF * (2 ** attempt)
+
+
+def create_http2_client(max_keepalive_connections: int = 8, max_connections: int = 16) -> Optional[Any]:
+    """Build an HTTP/2 httpx.Client, or return None if httpx[http2] is missing.
+
+    The client's get(url, params=..., timeout=...) and responses
+    (.content, .status_code, .raise_for_status()) match what callers use
+    from requests, so it can stand in for SESSION. httpx does not retry on
+    status codes; callers pair it with retry_delay() and RETRY_STATUSES.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401  (httpx needs it for http2=True)
+    except ImportError:
+        logger.info("httpx[http2] not installed; using the pooled requests session")
+        return None
+    return httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+        limits=httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections, max_connections=max_connections
+        ),
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+SESSION = create_session()
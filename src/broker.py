@@ -1,22 +1,44 @@
 from typing import List, Dict, Optional
 from src.models import Opportunity, Trade, TradeAction
 from src.config import BrokerConfig
+from array import array
 from datetime import datetime
-import uuid
+import itertools
 import logging
 
 logger = logging.getLogger(__name__)
 
 class PaperBroker:
+    __slots__ = ("config", "cash", "_outcome_index", "_quantities", "trades", "notifier", "_trade_seq")
+
     def __init__(self, config: BrokerConfig, notifier=None):
         self.config = config
         self.cash = config.initial_cash
-        self.positions: Dict[str, float] = {} # outcome_id -> amount
+        # outcome_id -> slot in _quantities; quantities are contiguous doubles
+        self._outcome_index: Dict[str, int] = {}
+        self._quantities = array('d')
         self.trades: List[Trade] = []
         self.notifier = notifier
+        # Paper trades only need ids unique within this broker, so a counter
+        # replaces uuid4 (one os.urandom syscall per trade)
+        self._trade_seq = itertools.count(1)
+
+    @property
+    def positions(self) -> Dict[str, float]:
+        """Snapshot of held quantity per outcome_id."""
+        return dict(zip(self._outcome_index, self._quantities))
+
+    def _add_position(self, outcome_id: str, quantity: float) -> None:
+        idx = self._outcome_index.setdefault(outcome_id, len(self._quantities))
+        if idx == len(self._quantities):
+            self._quantities.append(0.0)
+        self._quantities[idx] += quantity
 
-    def execute_opportunity(self, opportunity: Opportunity) -> List[Trade]:
+    def execute_opportunity(self, opportunity: Opportunity, timestamp: Optional[datetime] = None) -> List[Trade]:
+        """Execute every action of the opportunity; trades are stamped with
+        timestamp (the engine's tick time) or the wall clock if omitted."""
         executed_trades = []
+        timestamp = timestamp or datetime.now()
         
         # Calculate sizing (simplified: use fixed capital per opp, or min of required)
         # Using a fixed size from logic for now, or defaulting to $10 stake roughly
@@ -25,8 +47,8 @@ class PaperBroker:
         
         trade_size_dollars = 10.0
         
-        # Calculate cost per unit
-        unit_cost = sum(a.max_price for a in opportunity.actions if a.side == 'BUY')
+        # Cost per unit: detectors store the summed BUY limit prices here
+        unit_cost = opportunity.required_capital
         if unit_cost <= 0: return []
         
         quantity = trade_size_dollars / unit_cost
@@ -39,7 +61,7 @@ class PaperBroker:
 
         # Execute
         for action in opportunity.actions:
-            trade = self._execute_action(action, quantity, opportunity.market_title)
+            trade = self._execute_action(action, quantity, opportunity.market_title, timestamp)
             if trade:
                 executed_trades.append(trade)
         
@@ -53,7 +75,13 @@ class PaperBroker:
                 
         return executed_trades
 
-    def _execute_action(self, action: TradeAction, quantity: float, market_title: str = "") -> Trade:
+    def _execute_action(
+        self,
+        action: TradeAction,
+        quantity: float,
+        market_title: str = "",
+        timestamp: Optional[datetime] = None,
+    ) -> Trade:
         # Simulate slippage
         # Price increases by slippage_bps for buys
         slippage_mult = 1.0 + (self.config.slippage_bps / 10000.0) if action.side == 'BUY' else 1.0 - (self.config.slippage_bps / 10000.0)
@@ -69,11 +97,11 @@ class PaperBroker:
         
         if action.side == 'BUY':
             self.cash -= total_cost
-            self.positions[action.outcome_id] = self.positions.get(action.outcome_id, 0.0) + quantity
+            self._add_position(action.outcome_id, quantity)
         
         t = Trade(
-            id=str(uuid.uuid4()),
-            timestamp=datetime.now(),
+            id=f"paper-{next(self._trade_seq)}",
+            timestamp=timestamp or datetime.now(),
             market_id=action.market_id,
             outcome_id=action.outcome_id,
             side=action.side,
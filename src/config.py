@@ -4,6 +4,11 @@ import os
 from dotenv import load_dotenv
 from typing import Optional
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 class RiskConfig(BaseModel):
     max_capital_per_market: float = 100.0
     max_open_markets: int = 10
@@ -27,6 +32,8 @@ class PolymarketConfig(BaseModel):
     secret: Optional[str] = Field(default_factory=lambda: os.getenv("POLYMARKET_SECRET", ""))
     passphrase: Optional[str] = Field(default_factory=lambda: os.getenv("POLYMARKET_PASSPHRASE", ""))
     chain_id: int = 137
+    # Seconds a get_active_markets result is reused; 0 disables the cache
+    cache_ttl_seconds: float = 2.0
     funder: Optional[str] = Field(default_factory=lambda: os.getenv("POLYMARKET_FUNDER", ""))
 
 class AppConfig(BaseModel):
@@ -41,7 +48,7 @@ class AppConfig(BaseModel):
 def load_config(path: str) -> AppConfig:
     load_dotenv()
     with open(path, 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
     
     # Allow env vars to override config file for sensitive data if needed, 
     # but Pydantic default_factory handles it if keys are missing in YAML.
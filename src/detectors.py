@@ -1,16 +1,41 @@
 from typing import List, Optional
-from src.models import Market, Opportunity, TradeAction
+from src.config import BrokerConfig
+from src.models import NO, YES, Market, MarketBook, Opportunity, Outcome, TradeAction
 import logging
 import re
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the NumPy expression is used instead
+    njit = None
+
 logger = logging.getLogger(__name__)
 
-def detect_parity_arb(market: Market) -> List[Opportunity]:
+# Raw parity filter: flag markets whose YES + NO costs less than this
+PARITY_MAX_COST = 0.99
+
+def parity_threshold(broker: BrokerConfig, min_edge: float = 0.0) -> float:
+    """Highest YES + NO cost that still clears fees, slippage and min_edge.
+
+    Both legs pay fee_bps and slippage_bps, so the breakeven sits below 1.0
+    by twice their sum. Fixed for a run: compute once and pass it in.
+    """
+    return 1.0 - 2.0 * (broker.fee_bps + broker.slippage_bps) / 10_000.0 - min_edge
+
+# "Asset > X on Date", e.g. "Bitcoin > $100,000 on Dec 31 2024"; compiled once
+_LADDER_RE = re.compile(
+    r"(?P<asset>\w+)\s*(?P<cmp>[<>])\s*\$?(?P<threshold>[\d,]+(?:\.\d+)?)\s+on\s+(?P<date>.+)"
+)
+
+def detect_parity_arb(market: Market, max_cost: float = PARITY_MAX_COST) -> List[Opportunity]:
     """
     Detects if sum of YES + NO prices deviates significantly from 1.0 such that
     buying both is cheaper than 1.0 (indicating guaranteed profit if held to expiry).
     
-    If YES + NO < 1.0 - fees, we buy both.
+    If YES + NO < max_cost (see parity_threshold), we buy both.
     """
     if len(market.outcomes) != 2:
         return []
@@ -18,14 +43,19 @@ def detect_parity_arb(market: Market) -> List[Opportunity]:
     # Identify YES/NO outcomes (simplified)
     # usually outcomes are ["No", "Yes"] or similar
     
-    yes_outcome = market.get_outcome_by_label("Yes")
-    no_outcome = market.get_outcome_by_label("No")
+    yes_outcome = market.get_outcome_by_label(YES)
+    no_outcome = market.get_outcome_by_label(NO)
     
     if not yes_outcome or not no_outcome:
         # Try generic index if labels fail (often 0 is No, 1 is Yes)
         # But for safety, strictly look for labels or specific known structures
         return []
 
+    if yes_outcome.price + no_outcome.price < max_cost:
+        return [_parity_opportunity(market, yes_outcome, no_outcome)]
+    return []
+
+def _parity_opportunity(market: Market, yes_outcome: Outcome, no_outcome: Outcome) -> Opportunity:
     p_yes = yes_outcome.price
     p_no = no_outcome.price
     
@@ -35,34 +65,56 @@ def detect_parity_arb(market: Market) -> List[Opportunity]:
     # Profit = 1.0 - Cost
     
     cost = p_yes + p_no
-    
-    # Simple threshold, raw detection here. Fees applied later or in config threshold check.
-    if cost < 0.99: # Arbitrary raw filter
-        edge = 1.0 - cost
-        return [Opportunity(
-            market_id=market.id,
-            market_title=market.question,
-            type_name="PARITY",
-            description=f"Yes({p_yes}) + No({p_no}) = {cost:.3f} < 1.0",
-            estimated_edge=edge,
-            required_capital=cost, # normalized unit cost
-            actions=[
-                TradeAction(market.id, yes_outcome.id, "BUY", 1.0, p_yes),
-                TradeAction(market.id, no_outcome.id, "BUY", 1.0, p_no)
-            ]
-        )]
-    
-    return []
+    edge = 1.0 - cost
+    return Opportunity(
+        market_id=market.id,
+        market_title=market.question,
+        type_name="PARITY",
+        description=f"Yes({p_yes}) + No({p_no}) = {cost:.3f} < 1.0",
+        estimated_edge=edge,
+        required_capital=cost, # normalized unit cost
+        actions=[
+            TradeAction(market.id, yes_outcome.id, "BUY", 1.0, p_yes),
+            TradeAction(market.id, no_outcome.id, "BUY", 1.0, p_no)
+        ]
+    )
 
 def extract_ladder_info(market: Market) -> Optional[dict]:
     # Regex to extract "Asset > X on Date"
     # Example: "Bitcoin > $100,000 on Dec 31 2024"
-    # This is complex/brittle, so kept simple for Phase 1
-    # We look for simple numeric extraction if Title contains ">" or "<"
-    return None # Placeholder for complex logic, implemented in next step if easy, or skipped for MVP reliability
-
-def detect_opportunities(markets: List[Market]) -> List[Opportunity]:
-    opps = []
-    for m in markets:
-        opps.extend(detect_parity_arb(m))
-    return opps
+    # Not wired into detect_opportunities yet; ladder detection is Phase 2
+    match = _LADDER_RE.search(market.question)
+    if not match:
+        return None
+    return {
+        "asset": match.group("asset"),
+        "comparator": match.group("cmp"),
+        "threshold": float(match.group("threshold").replace(",", "")),
+        "date": match.group("date").strip(),
+    }
+
+def _parity_hits_numpy(yes_prices: np.ndarray, no_prices: np.ndarray, max_cost: float) -> np.ndarray:
+    return np.flatnonzero(yes_prices + no_prices < max_cost)
+
+def _parity_hits_loop(yes_prices: np.ndarray, no_prices: np.ndarray, max_cost: float) -> np.ndarray:
+    # Scalar loop written for numba: one pass, no temporary cost array
+    hits = np.empty(yes_prices.shape[0], dtype=np.int64)
+    n = 0
+    for i in range(yes_prices.shape[0]):
+        if yes_prices[i] + no_prices[i] < max_cost:
+            hits[n] = i
+            n += 1
+    return hits[:n]
+
+# Row indices of parity hits, natively compiled when numba is installed
+_parity_hits = njit(cache=True)(_parity_hits_loop) if njit is not None else _parity_hits_numpy
+
+def detect_opportunities(markets: List[Market], max_cost: float = PARITY_MAX_COST) -> List[Opportunity]:
+    # Same result as detect_parity_arb per market, but the price test runs
+    # as one vectorized compare and only hits build Opportunity objects
+    book = MarketBook.from_markets(markets)
+    hits = _parity_hits(book.yes_prices, book.no_prices, max_cost)
+    return [
+        _parity_opportunity(book.markets[i], book.yes_outcomes[i], book.no_outcomes[i])
+        for i in hits.tolist()
+    ]
@@ -1,12 +1,13 @@
 import time
 import logging
+from datetime import datetime
 from typing import List, Optional
 from src.config import AppConfig
 from src.polymarket_client import PolymarketClient
-from src.detectors import detect_opportunities
+from src.detectors import detect_opportunities, parity_threshold
 from src.risk import RiskManager
 from src.broker import PaperBroker
-from src.models import Opportunity
+from src.models import Opportunity, set_current_tick
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +19,27 @@ class Engine:
         self.notifier = notifier
         self.broker = PaperBroker(config.broker, notifier=notifier)
         self.running = False
+        # Fees, slippage and min_edge are fixed for the run
+        self.parity_max_cost = parity_threshold(config.broker, config.risk.min_edge)
+        self.current_tick_time: Optional[datetime] = None
 
     def run_once(self):
+        # One clock read per tick; opportunities and trades share it
+        self.current_tick_time = datetime.now()
+        set_current_tick(self.current_tick_time)
+        try:
+            self._scan()
+        finally:
+            set_current_tick(None)
+
+    def _scan(self):
         logger.info("Scanning markets...")
         markets = self.client.get_active_markets()
         logger.info(f"Found {len(markets)} active markets")
+        # id -> market, so each opportunity finds its market in O(1)
+        market_by_id = {m.id: m for m in markets}
 
-        opps = detect_opportunities(markets)
+        opps = detect_opportunities(markets, self.parity_max_cost)
         logger.info(f"Detected {len(opps)} opportunities")
 
         for opp in opps:
@@ -33,13 +48,12 @@ class Engine:
                 self.notifier.notify_opportunity(opp)
             
             # We need the market object for risk check
-            # Inefficient lookup O(N) here but fine for Phase 1
-            market = next((m for m in markets if m.id == opp.market_id), None)
+            market = market_by_id.get(opp.market_id)
             if not market: continue
 
             if self.risk_manager.check(opp, market):
                 logger.info(f"Executing Opportunity: {opp.description}")
-                trades = self.broker.execute_opportunity(opp)
+                trades = self.broker.execute_opportunity(opp, timestamp=self.current_tick_time)
                 if trades:
                     self.risk_manager.record_trade(opp.market_id)
                     logger.info(f"Executed {len(trades)} trades")
@@ -52,6 +66,10 @@ class Engine:
             config_summary = f"Paper Trading: {self.config.paper_trading}\nRefresh Interval: {self.config.refresh_interval_seconds}s"
             self.notifier.notify_startup(config_summary)
         
+        # Ticks start on a fixed monotonic grid, so scan time doesn't stretch
+        # the interval; an overrun skips ahead instead of queueing catch-up ticks
+        interval = self.config.refresh_interval_seconds
+        next_deadline = time.monotonic()
         while self.running:
             try:
                 self.run_once()
@@ -60,8 +78,13 @@ class Engine:
                 if self.notifier:
                     self.notifier.notify_error(str(e), "Main Loop")
             
-            logger.info(f"Sleeping {self.config.refresh_interval_seconds}s...")
-            time.sleep(self.config.refresh_interval_seconds)
+            next_deadline += interval
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now
+            sleep_for = next_deadline - now
+            logger.info(f"Sleeping {sleep_for:.1f}s...")
+            time.sleep(sleep_for)
 
     def generate_report(self):
         # Dump stats
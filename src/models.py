@@ -1,21 +1,41 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-@dataclass
+import numpy as np
+
+# Canonical binary labels, interned so label keys share one string object
+YES = sys.intern("Yes")
+NO = sys.intern("No")
+_BINARY_LABELS = {"yes": YES, "no": NO}
+
+def canonical_label(label) -> str:
+    """Map any casing of yes/no to YES/NO; intern other labels unchanged."""
+    text = str(label).strip()
+    return _BINARY_LABELS.get(text.lower()) or sys.intern(text)
+
+# Timestamp of the engine tick in progress; None outside a tick
+_CURRENT_TICK: Optional[datetime] = None
+
+def set_current_tick(ts: Optional[datetime]) -> None:
+    """Stamp objects created from now on with ts (None: use the wall clock)."""
+    global _CURRENT_TICK
+    _CURRENT_TICK = ts
+
+def current_tick() -> datetime:
+    """Timestamp of the current engine tick, or datetime.now() outside one."""
+    return _CURRENT_TICK or datetime.now()
+
+@dataclass(slots=True, frozen=True)
 class Outcome:
     """Represents a single outcome in a prediction market (e.g., 'Yes' or 'No')."""
     id: str
     label: str
     price: float
-    
-    @property
-    def price_decimal(self) -> Decimal:
-        return Decimal(str(self.price))
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Represents a prediction market."""
     id: str
@@ -30,14 +50,48 @@ class Market:
     target_date: Optional[str] = None
     threshold: Optional[float] = None
     comparator: Optional[str] = None  # '>' or '<'
+    # label -> outcome; reversed so the first outcome with a label wins
+    _label_index: Dict[str, Outcome] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._label_index = {o.label: o for o in reversed(self.outcomes)}
 
     def get_outcome_by_label(self, label: str) -> Optional[Outcome]:
-        for o in self.outcomes:
-            if o.label == label:
-                return o
-        return None
+        return self._label_index.get(label)
+
+@dataclass(slots=True)
+class MarketBook:
+    """Binary Yes/No markets of one tick as parallel arrays.
+
+    Row i describes markets[i]; prices are float64 so parity checks run as
+    one vectorized pass instead of per-market attribute walks.
+    """
+    markets: List[Market]
+    yes_outcomes: List[Outcome]
+    no_outcomes: List[Outcome]
+    yes_prices: np.ndarray
+    no_prices: np.ndarray
+
+    @classmethod
+    def from_markets(cls, markets: List[Market]) -> MarketBook:
+        """Collect the two-outcome markets that have both a Yes and a No."""
+        rows = []
+        for m in markets:
+            if len(m.outcomes) != 2:
+                continue
+            yes = m.get_outcome_by_label(YES)
+            no = m.get_outcome_by_label(NO)
+            if yes and no:
+                rows.append((m, yes, no))
+        return cls(
+            markets=[r[0] for r in rows],
+            yes_outcomes=[r[1] for r in rows],
+            no_outcomes=[r[2] for r in rows],
+            yes_prices=np.fromiter((r[1].price for r in rows), dtype=np.float64, count=len(rows)),
+            no_prices=np.fromiter((r[2].price for r in rows), dtype=np.float64, count=len(rows)),
+        )
 
-@dataclass
+@dataclass(slots=True)
 class Opportunity:
     """Represents a detected arbitrage opportunity."""
     market_id: str
@@ -45,11 +99,11 @@ class Opportunity:
     type_name: str  # 'PARITY' or 'LADDER'
     description: str
     estimated_edge: float  # Absolute edge (e.g. 0.05 for 5%)
-    required_capital: float
+    required_capital: float  # Cost of one unit: sum of the BUY actions' max_price
     actions: List[TradeAction]
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=current_tick)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeAction:
     """A specific action to take as part of an opportunity."""
     market_id: str
@@ -58,7 +112,7 @@ class TradeAction:
     amount: float
     max_price: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Record of an executed trade."""
     id: str
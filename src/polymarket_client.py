@@ -1,11 +1,17 @@
-from typing import List, Protocol, Optional, Any
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import logging
+import time
 from datetime import datetime
-from src.models import Market, Outcome
+from src.models import Market, Outcome, canonical_label
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds
 from src.config import PolymarketConfig
+from src._http import (
+    REQUEST_TIMEOUT, RETRY_STATUSES, RETRY_TOTAL, SESSION, create_http2_client, retry_delay,
+)
+from src.predarb import fastjson
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +19,39 @@ class PolymarketClient(Protocol):
     def get_active_markets(self) -> List[Market]:
         ...
 
+def _decode_list(raw: Any) -> List[Any]:
+    """Return raw as a list, decoding it first if it is a JSON-encoded string."""
+    if isinstance(raw, str):
+        try:
+            raw = fastjson.loads(raw)
+        except fastjson.JSONDecodeError:
+            return []
+    return raw or []
+
+class _MarketCache:
+    """Time-based memo of parsed market lists, keyed by request identity."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Any, Tuple[float, List[Market]]] = {}
+
+    def get(self, key: Any) -> Optional[List[Market]]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def put(self, key: Any, markets: List[Market]) -> None:
+        if self.ttl_seconds > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, markets)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 class ClobPolymarketClient:
     def __init__(self, config: PolymarketConfig):
         self.config = config
+        self.cache = _MarketCache(config.cache_ttl_seconds)
         
         creds = None
         if config.api_key and config.secret and config.passphrase:
@@ -40,6 +76,10 @@ class ClobPolymarketClient:
         The CLOB client typically has methods like get_markets or get_sampling_markets.
         We'll use get_markets and filter/parse.
         """
+        key = ("clob", self.config.host)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         try:
             # Paginate through all markets because the first page is oldest/closed.
             markets = []
@@ -68,6 +108,7 @@ class ClobPolymarketClient:
                 if markets:
                     break
 
+            self.cache.put(key, markets)
             return markets
         except Exception as e:
             import traceback
@@ -92,7 +133,7 @@ class ClobPolymarketClient:
              price = float(token.get('price', 0.0))
              outcomes.append(Outcome(
                  id=token.get('token_id', f"{data.get('condition_id')}_{i}"),
-                 label=token.get('outcome', str(i)),
+                 label=canonical_label(token.get('outcome', str(i))),
                  price=price
              ))
         
@@ -112,69 +153,156 @@ class ClobPolymarketClient:
 
 
 class HttpPolymarketClient:
-    def __init__(self, base_url: str = "https://gamma-api.polymarket.com"):
+    def __init__(
+        self,
+        base_url: str = "https://gamma-api.polymarket.com",
+        session: Optional[requests.Session] = None,
+        page_size: int = 100,
+        max_pages: int = 1,
+        fetch_concurrency: int = 8,
+        http2: bool = True,
+        cache_ttl_seconds: float = 2.0,
+    ):
         self.base_url = base_url.rstrip('/')
+        # HTTP/2 when httpx[http2] is installed, so concurrent page fetches
+        # multiplex over one connection; otherwise the shared pooled session
+        self._owns_session = False
+        self.timeout: Any = REQUEST_TIMEOUT
+        if session is None and http2:
+            session = create_http2_client()
+            if session is not None:
+                # httpx takes its connect/read split from the client
+                self._owns_session = True
+                self.timeout = session.timeout
+        self.session = session or SESSION
+        self.page_size = page_size
+        self.max_pages = max(1, max_pages)
+        # Upper bound on concurrent in-flight page requests; this caps
+        # parallelism, not the request rate (fast responses can still
+        # exceed an API rate limit)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        # Snapshots barely move between engine ticks; serve repeats from memory
+        self.cache = _MarketCache(cache_ttl_seconds)
 
-    def get_active_markets(self) -> List[Market]:
-        """
-        Fetches active markets. 
-        Note: The simplified endpoint logic here assumes we can query for active events.
-        """
+    def _fetch_events(self, offset: int) -> List[Any]:
+        """Fetch one page of active events starting at offset."""
         url = f"{self.base_url}/events"
         params = {
             "closed": "false",
-            "limit": 100, # Simplified pagination
-            "offset": 0
+            "limit": self.page_size,
+            "offset": offset
         }
+        resp = self._get(url, params)
+        resp.raise_for_status()
+        # Parse straight from the response bytes (orjson when installed)
+        return fastjson.loads(resp.content)
+
+    def _get(self, url: str, params: dict) -> Any:
+        """GET through the session, retrying 429/5xx on the httpx client.
+
+        SESSION retries these itself (urllib3 Retry); httpx has no status
+        retries, so the same policy is applied here.
+        """
+        attempt = 0
+        while True:
+            resp = self.session.get(url, params=params, timeout=self.timeout)
+            if not self._owns_session or resp.status_code not in RETRY_STATUSES or attempt >= RETRY_TOTAL:
+                return resp
+            time.sleep(retry_delay(resp, attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the HTTP/2 client this instance created; SESSION stays open."""
+        if self._owns_session:
+            self.session.close()
+            self._owns_session = False
+
+    def _fetch_page_markets(self, offset: int) -> List[Market]:
+        """Fetch one events page and parse it straight into markets.
+
+        Parsing inside the fetch worker means a page's raw JSON tree is
+        dropped as soon as its markets are built, instead of every page's
+        events being held until all pages have arrived.
+        """
+        return self._parse_events(self._fetch_events(offset))
+
+    def _parse_events(self, events: List[Any]) -> List[Market]:
+        markets = []
+        # Gamma structure usually returns a list of events, each with 'markets' inside
+        for event in events:
+            if not isinstance(event, dict): 
+                continue
+                
+            event_markets = event.get('markets', [])
+            for m_data in event_markets:
+                try:
+                    m = self._parse_market(m_data, event.get('title', 'Unknown'))
+                    if m:
+                        markets.append(m)
+                except Exception as e:
+                    logger.warning(f"Failed to parse market {m_data.get('id')}: {e}")
+        return markets
+
+    def _fetch_all_markets(self) -> Tuple[List[Market], bool]:
+        """
+        Fetch and parse every configured page.
         
+        Pages are requested concurrently (network-bound, so threads overlap
+        the round-trips). A failed page is logged and skipped; results keep
+        offset order.
+
+        Returns:
+            The markets and whether every page was fetched
+        """
+        offsets = [i * self.page_size for i in range(self.max_pages)]
+        if len(offsets) == 1:
+            return self._fetch_page_markets(offsets[0]), True
+
+        pages = {}
+        workers = min(self.fetch_concurrency, len(offsets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._fetch_page_markets, off): off for off in offsets}
+            for future in as_completed(futures):
+                offset = futures[future]
+                try:
+                    pages[offset] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch events page at offset {offset}: {e}")
+
+        markets = [market for off in offsets for market in pages.get(off, [])]
+        return markets, len(pages) == len(offsets)
+
+    def get_active_markets(self) -> List[Market]:
+        """
+        Fetches active markets. 
+        Note: The simplified endpoint logic here assumes we can query for active events.
+        """
+        key = (self.base_url, self.page_size, self.max_pages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            markets = []
-            # Gamma structure usually returns a list of events, each with 'markets' inside
-            for event in data:
-                if not isinstance(event, dict): 
-                    continue
-                    
-                event_markets = event.get('markets', [])
-                for m_data in event_markets:
-                    try:
-                        m = self._parse_market(m_data, event.get('title', 'Unknown'))
-                        if m:
-                            markets.append(m)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse market {m_data.get('id')}: {e}")
-            
-            return markets
+            markets, complete = self._fetch_all_markets()
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
             return []
+        # A partial result would hide the missing pages for the whole TTL
+        if complete:
+            self.cache.put(key, markets)
+        return markets
 
     def _parse_market(self, data: dict, event_title: str) -> Optional[Market]:
         # Minimal parsing logic based on typical Gamma API structure
         if data.get('closed', False):
             return None
             
-        outcomes_raw = data.get('outcomes', [])
-        prices_raw = data.get('outcomePrices', [])
-        
-        # Gamma API sometimes sends json encoded strings for outcomes
-        import json
-        if isinstance(outcomes_raw, str):
-            try:
-                outcomes_raw = json.loads(outcomes_raw)
-            except:
-                outcomes_raw = []
-        
-        if isinstance(prices_raw, str):
-             try:
-                prices_raw = json.loads(prices_raw)
-             except:
-                prices_raw = []
-
-        if not outcomes_raw or len(outcomes_raw) != len(prices_raw):
+        # Gamma API sometimes sends json encoded strings for outcomes.
+        # Prices are only decoded once the outcomes turn out to be usable.
+        outcomes_raw = _decode_list(data.get('outcomes', []))
+        if not outcomes_raw:
+            return None
+        prices_raw = _decode_list(data.get('outcomePrices', []))
+        if len(outcomes_raw) != len(prices_raw):
             return None
 
         outcomes = []
@@ -187,7 +315,7 @@ class HttpPolymarketClient:
                 
             outcomes.append(Outcome(
                 id=f"{data.get('id')}_{i}", # outcome IDs often separate, but using synthetic for simplicity if needed
-                label=str(label),
+                label=canonical_label(label),
                 price=price
             ))
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import itertools
 import math
 import uuid
+from array import array
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from predarb.config import BrokerConfig
 from predarb.models import Market, Opportunity, Trade, TradeAction
@@ -13,20 +15,39 @@ class PaperBroker:
     def __init__(self, config: BrokerConfig):
         self.config = config
         self.cash = config.initial_cash
-        self.positions: Dict[str, float] = {}
+        # Keyed by (market_id, outcome_id); tuples hash without building a new string
+        self.positions: Dict[Tuple[str, str], float] = {}
+        # Number of non-zero entries in positions, kept in step by _set_position
+        self._open_count = 0
         # Track average cost basis per position (price-only, excludes fees/slippage)
-        self.avg_cost: Dict[str, float] = {}
+        self.avg_cost: Dict[Tuple[str, str], float] = {}
         self.trades: List[Trade] = []
-        self.equity_curve: List[float] = [self.cash]
+        # Trade ids are a per-broker random prefix plus a counter: one urandom
+        # read per broker instead of per trade, still unique across runs in
+        # the persisted unified report
+        self._trade_prefix = uuid.uuid4().hex[:12]
+        self._trade_seq = itertools.count(1)
+        # Unboxed doubles with amortised growth; np.frombuffer views it without copying
+        self.equity_curve = array("d", [self.cash])
 
-    def _available_liquidity(self, market: Market, action: TradeAction) -> float:
-        # Simple deterministic liquidity model: proportional to market liquidity and depth fraction
-        per_outcome_liq = market.liquidity * self.config.depth_fraction / max(len(market.outcomes), 1)
-        max_qty = per_outcome_liq / max(action.limit_price, 1e-6)
-        return max_qty
+    def open_position_count(self) -> int:
+        """Return the number of positions with non-zero quantity."""
+        return self._open_count
 
-    def execute(self, market_lookup: Dict[str, Market], opportunity: Opportunity) -> List[Trade]:
+    def _set_position(self, position_key: Tuple[str, str], qty: float) -> None:
+        """Store a position quantity, updating the open-position count on 0 <-> non-zero transitions."""
+        was_open = self.positions.get(position_key, 0.0) != 0
+        if was_open != (qty != 0):
+            self._open_count += -1 if was_open else 1
+        self.positions[position_key] = qty
+
+    def execute(
+        self, market_lookup: Dict[str, Market], opportunity: Opportunity, now: Optional[datetime] = None
+    ) -> List[Trade]:
         """Execute trades for an opportunity.
+
+        All trades from one call share the timestamp ``now`` (the current UTC
+        time when omitted); replays can pass their simulated time instead.
         
         MANDATORY INVARIANT CHECK (FAIL-FAST):
         No SELL action is allowed unless reducing an existing position.
@@ -37,7 +58,7 @@ class PaperBroker:
         # ==================== MANDATORY INVARIANT: NO SELL WITHOUT POSITION ==================== #
         for action in opportunity.actions:
             if action.side.upper() == "SELL":
-                position_key = f"{action.market_id}:{action.outcome_id}"
+                position_key = (action.market_id, action.outcome_id)
                 inventory = self.positions.get(position_key, 0.0)
                 if inventory <= 0:
                     error_msg = (
@@ -56,105 +77,115 @@ class PaperBroker:
                     )
                     raise RuntimeError(error_msg)
         
+        positions = self.positions
+        avg_cost = self.avg_cost
+        fee_rate = self.config.fee_bps / 10_000
+        slip_rate = self.config.slippage_bps / 10_000
+        depth_fraction = self.config.depth_fraction
+        now = now or datetime.utcnow()
+        # Full mark-to-market once; each fill below only re-marks the position it touched
+        unrealized = self._unrealized_pnl(market_lookup) if opportunity.actions else 0.0
         for action in opportunity.actions:
-            market = market_lookup.get(action.market_id)
+            # Read each action field once; the rest of the body uses locals
+            market_id, outcome_id, side, amount, price = (
+                action.market_id, action.outcome_id, action.side.upper(), action.amount, action.limit_price
+            )
+            market = market_lookup.get(market_id)
             if not market:
                 continue
-            max_qty = self._available_liquidity(market, action)
-            qty = min(action.amount, max_qty)
+            # Simple deterministic liquidity model: proportional to market liquidity and depth fraction
+            per_outcome_liq = market.liquidity * depth_fraction / max(len(market.outcomes), 1)
+            qty = min(amount, per_outcome_liq / max(price, 1e-6))
             if qty <= 0:
                 continue
-            fee = action.limit_price * qty * (self.config.fee_bps / 10_000)
-            slippage = action.limit_price * qty * (self.config.slippage_bps / 10_000)
-            cost = action.limit_price * qty + fee + slippage
-            if action.side.upper() == "BUY":
+            notional = price * qty
+            fee = notional * fee_rate
+            slippage = notional * slip_rate
+            cost = notional + fee + slippage
+            position_key = (market_id, outcome_id)
+            held = positions.get(position_key, 0.0)
+            marked_before = self._position_pnl(market_lookup, position_key)
+            if side == "BUY":
                 if cost > self.cash:
                     continue
                 self.cash -= cost
-                position_key = f"{action.market_id}:{action.outcome_id}"
-                self.positions[position_key] = self.positions.get(position_key, 0.0) + qty
+                new_qty = held + qty
+                self._set_position(position_key, new_qty)
                 # Update weighted average cost basis (price-only)
-                prev_qty = self.positions.get(position_key, 0.0) - qty
-                prev_cost = self.avg_cost.get(position_key, 0.0)
-                new_total_qty = prev_qty + qty
-                if new_total_qty > 0:
-                    weighted = (prev_cost * prev_qty + action.limit_price * qty) / new_total_qty
-                    self.avg_cost[position_key] = weighted
+                if new_qty > 0:
+                    prev_cost = avg_cost.get(position_key, 0.0)
+                    avg_cost[position_key] = (prev_cost * held + notional) / new_qty
                 else:
-                    self.avg_cost[position_key] = action.limit_price
+                    avg_cost[position_key] = price
                 pnl = -cost
             else:  # SELL
-                position_key = f"{action.market_id}:{action.outcome_id}"
-                held = self.positions.get(position_key, 0.0)
                 # Allow short selling: qty is NOT limited by held position
                 # qty = min(qty, held)  # REMOVED: This prevented short selling
-                if qty <= 0:
-                    continue
-                proceeds = action.limit_price * qty - fee - slippage
+                proceeds = notional - fee - slippage
                 self.cash += proceeds
-                self.positions[position_key] = held - qty  # Can go negative (short position)
+                new_qty = held - qty
+                self._set_position(position_key, new_qty)  # Can go negative (short position)
                 # Update cost basis for short positions
-                if self.positions[position_key] == 0.0:
-                    self.avg_cost.pop(position_key, None)
-                elif held <= 0:  # Opening or adding to short position
-                    prev_cost = self.avg_cost.get(position_key, 0.0)
-                    if held < 0:  # Already short, weighted average
-                        weighted = (prev_cost * abs(held) + action.limit_price * qty) / abs(held - qty)
-                        self.avg_cost[position_key] = weighted
-                    else:  # New short position
-                        self.avg_cost[position_key] = action.limit_price
+                if new_qty == 0.0:
+                    avg_cost.pop(position_key, None)
+                elif held < 0:  # Already short, weighted average
+                    prev_cost = avg_cost.get(position_key, 0.0)
+                    avg_cost[position_key] = (prev_cost * -held + notional) / -new_qty
+                elif held == 0:  # New short position
+                    avg_cost[position_key] = price
                 pnl = proceeds
             trade = Trade(
-                id=str(uuid.uuid4()),
-                timestamp=datetime.utcnow(),
-                market_id=action.market_id,
-                outcome_id=action.outcome_id,
-                side=action.side.upper(),
+                id=f"{self._trade_prefix}-{next(self._trade_seq)}",
+                timestamp=now,
+                market_id=market_id,
+                outcome_id=outcome_id,
+                side=side,
                 amount=qty,
-                price=action.limit_price,
+                price=price,
                 fees=fee,
                 slippage=slippage,
                 realized_pnl=pnl,
             )
             trades.append(trade)
             self.trades.append(trade)
-            self.equity_curve.append(self.cash + self._unrealized_pnl(market_lookup))
+            unrealized += self._position_pnl(market_lookup, position_key) - marked_before
+            self.equity_curve.append(self.cash + unrealized)
         return trades
 
+    def _position_pnl(self, market_lookup: Dict[str, Market], key: Tuple[str, str]) -> float:
+        """Mark-to-market PnL of one position against its average cost basis (price-only)."""
+        qty = self.positions.get(key, 0.0)
+        if qty == 0:
+            return 0.0
+        market_id, outcome_id = key
+        market = market_lookup.get(market_id)
+        if not market:
+            return 0.0
+        outcome = market.outcome_by_id(outcome_id)
+        if not outcome:
+            return 0.0
+        cost_basis = self.avg_cost.get(key, outcome.price)
+        return qty * (outcome.price - cost_basis)
+
     def _unrealized_pnl(self, market_lookup: Dict[str, Market]) -> float:
         pnl = 0.0
-        for key, qty in self.positions.items():
-            if qty == 0:
-                continue
-            # Split on first colon only - outcome_id may contain colons
-            parts = key.split(":", 1)
-            if len(parts) != 2:
-                continue
-            market_id, outcome_id = parts
-            market = market_lookup.get(market_id)
-            if not market:
-                continue
-            outcome = next((o for o in market.outcomes if o.id == outcome_id), None)
-            if not outcome:
-                continue
-            # Mark-to-market against average cost basis (price-only)
-            cost_basis = self.avg_cost.get(key, outcome.price)
-            pnl += qty * (outcome.price - cost_basis)
+        for key in self.positions:
+            pnl += self._position_pnl(market_lookup, key)
         return pnl
 
     # --- Hedge helpers (simulation safety) ---
     def get_position_qty(self, market_id: str, outcome_id: str) -> float:
         """Return current held quantity for a given market/outcome (0.0 if none)."""
-        return self.positions.get(f"{market_id}:{outcome_id}", 0.0)
+        return self.positions.get((market_id, outcome_id), 0.0)
 
     def _mark_price(self, market_lookup: Dict[str, Market], market_id: str, outcome_id: str) -> float:
         """Get current mark price for outcome; fallback to average cost if missing."""
         market = market_lookup.get(market_id)
         if market:
-            outcome = next((o for o in market.outcomes if o.id == outcome_id), None)
+            outcome = market.outcome_by_id(outcome_id)
             if outcome:
                 return float(outcome.price)
-        return float(self.avg_cost.get(f"{market_id}:{outcome_id}", 0.0))
+        return float(self.avg_cost.get((market_id, outcome_id), 0.0))
 
     def close_position(
         self,
@@ -162,6 +193,7 @@ class PaperBroker:
         market_id: str,
         outcome_id: str,
         qty: float | None = None,
+        now: Optional[datetime] = None,
     ) -> List[Trade]:
         """Simulate closing a position (long or short). If qty is None, closes all.
         
@@ -170,7 +202,7 @@ class PaperBroker:
         
         Returns list of execution trades produced by the close.
         """
-        key = f"{market_id}:{outcome_id}"
+        key = (market_id, outcome_id)
         held = self.positions.get(key, 0.0)
         if held == 0:
             return []
@@ -186,14 +218,15 @@ class PaperBroker:
         price = self._mark_price(market_lookup, market_id, outcome_id)
         action = TradeAction(market_id=market_id, outcome_id=outcome_id, side=side, amount=close_qty, limit_price=price)
         opp = Opportunity(type="HEDGE", market_ids=[market_id], description="hedge_close", net_edge=0.0, actions=[action])
-        return self.execute(market_lookup, opp)
+        return self.execute(market_lookup, opp, now)
 
     def flatten_all(self, market_lookup: Dict[str, Market]) -> List[Trade]:
         """Close all open positions across all markets/outcomes (both long and short)."""
         hedges: List[Trade] = []
+        now = datetime.utcnow()
         for key, qty in list(self.positions.items()):
             if qty == 0:
                 continue
-            mid, oid = key.split(":")
-            hedges.extend(self.close_position(market_lookup, mid, oid, abs(qty)))
+            mid, oid = key
+            hedges.extend(self.close_position(market_lookup, mid, oid, abs(qty), now))
         return hedges
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +11,14 @@ import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from predarb import fastjson
+
+try:
+    # libyaml-backed loader; PyYAML builds it when libyaml is available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class PolymarketConfig(BaseModel):
     enabled: bool = True  # Enable/disable Polymarket client
@@ -18,6 +29,18 @@ class PolymarketConfig(BaseModel):
     private_key: Optional[str] = Field(default_factory=lambda: os.getenv("POLYMARKET_PRIVATE_KEY"))
     chain_id: int = 137
     funder: Optional[str] = Field(default_factory=lambda: os.getenv("POLYMARKET_FUNDER"))
+    # Serve fetch_markets from memory for this long (0 disables); /markets
+    # carries prices too, so keep it at or below engine.refresh_seconds
+    markets_ttl_seconds: float = 0.0
+    # Client-side request budget for the markets API (0 disables throttling);
+    # a 429 halves the rate down to rps_floor, successes restore it
+    rps_limit: float = 0.0
+    rps_burst: float = 5.0
+    rps_floor: Optional[float] = None
+    # Optional Redis (e.g. "redis://localhost:6379/0") shared by concurrent
+    # runners so one of them fetches /markets per TTL window; needs the
+    # redis package and markets_ttl_seconds > 0
+    redis_url: Optional[str] = None
 
 
 class KalshiConfig(BaseModel):
@@ -73,6 +96,16 @@ class EngineConfig(BaseModel):
     refresh_seconds: float = 5.0
     iterations: int = 100
     report_path: str = "reports/paper_trades.csv"
+    # Min seconds between full rewrites of unified_report.json (0 = every change)
+    report_snapshot_seconds: float = 0.0
+    # Keep the latest detected opportunities in reports/detected_opportunities.json
+    # so debug_rejections.py can analyse them without re-running detection
+    save_detected_opportunities: bool = False
+    # Scale refresh_seconds by recent detections (see predarb.refresh)
+    adaptive_refresh: bool = False
+    refresh_min_seconds: float = 1.0
+    refresh_max_seconds: float = 30.0
+    refresh_target_detections: float = 1.0
 
 
 class FilterConfig(BaseModel):
@@ -160,16 +193,103 @@ class AppConfig(BaseModel):
     llm_verification: LLMVerificationConfig = Field(default_factory=LLMVerificationConfig)
 
 
+@functools.lru_cache(maxsize=None)
+def _code_digest() -> str:
+    """Digest of this module's source, so any change to the models or their
+    validators invalidates sidecars written by older code."""
+    try:
+        source = Path(__file__).read_bytes()
+    except OSError:
+        source = fastjson.dumps(AppConfig.model_json_schema())
+    return hashlib.sha256(source).hexdigest()
+
+
+# Fields that must never be copied into the sidecar
+_CREDENTIAL_FIELDS = {
+    "polymarket": {"api_key", "secret", "passphrase", "private_key"},
+    "kalshi": {"api_key_id", "private_key_pem"},
+    "telegram": {"bot_token"},
+}
+
+
+def _cache_path(path: Path) -> Path:
+    """Sidecar holding the validated YAML sections of ``path``."""
+    return path.with_name(f".{path.name}.cache.json")
+
+
 def load_config(path: str | Path) -> AppConfig:
+    """Load and validate the YAML config, optionally reusing a validated copy.
+
+    With PREDARB_CONFIG_CACHE=1 (environment or .env), the first load of a
+    given file version validates it and writes the sections the YAML
+    actually set to a JSON sidecar keyed on the file's mtime and size and on
+    a digest of this module. Later processes rebuild the config from that
+    sidecar with model_construct, skipping YAML parsing and validation.
+    Credentials are never written to the sidecar: env-derived ones are read
+    on every load, and a YAML that sets one is not cached at all.
+    """
     path = Path(path)
     env_path = path.parent / ".env"
     load_dotenv(env_path, override=True)
+    if os.getenv("PREDARB_CONFIG_CACHE", "").lower() not in ("1", "true"):
+        return _apply_env_overrides(_parse_config(path))
+    st = os.stat(path)
+    stamp = [_code_digest(), st.st_mtime_ns, st.st_size]
+    cfg = _load_cached(_cache_path(path), stamp)
+    if cfg is None:
+        cfg = _parse_config(path)
+        _save_cached(_cache_path(path), stamp, cfg)
+    return _apply_env_overrides(cfg)
+
+
+def _load_cached(cache_path: Path, stamp: list) -> Optional[AppConfig]:
+    try:
+        cached = fastjson.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("stamp") != stamp:
+        return None
+    sections = {}
+    for name, values in cached["sections"].items():
+        section_cls = AppConfig.model_fields[name].annotation
+        sections[name] = section_cls.model_construct(_fields_set=set(values), **values)
+    # Sections absent from the YAML are built by their default factories
+    return AppConfig.model_construct(_fields_set=set(sections), **sections)
+
+
+def _save_cached(cache_path: Path, stamp: list, cfg: AppConfig) -> None:
+    # exclude_unset keeps only what the YAML set, so env-derived defaults
+    # never reach the sidecar
+    sections = cfg.model_dump(exclude_unset=True)
+    for name, fields in _CREDENTIAL_FIELDS.items():
+        section = sections.get(name, {})
+        for field in fields & section.keys():
+            # Blank placeholders are dropped and refilled from the env on
+            # load; a real credential in the YAML means no sidecar at all
+            if section.pop(field):
+                return
+    record = {"stamp": stamp, "sections": sections}
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb", delete=False, dir=str(cache_path.parent), suffix=".tmp"
+        ) as tmp:
+            tmp.write(fastjson.dumps(record))
+        os.replace(tmp.name, cache_path)
+    except (OSError, TypeError):
+        # A read-only directory just means validating every time
+        pass
+
+
+def _parse_config(path: Path) -> AppConfig:
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     try:
-        cfg = AppConfig(**data)
+        return AppConfig(**data)
     except ValidationError as e:
         raise RuntimeError(f"Invalid config: {e}") from e
+
+
+def _apply_env_overrides(cfg: AppConfig) -> AppConfig:
     # If YAML has empty/placeholder values, fill from env
     if not cfg.telegram.bot_token:
         cfg.telegram.bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
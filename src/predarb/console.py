@@ -0,0 +1,109 @@
+"""
+Background console output for the long-running runners.
+
+Lines are queued and written to stdout by a daemon thread, so an iteration
+never waits on a slow terminal. Log records can be moved off the loop the
+same way with the standard QueueHandler/QueueListener pair.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from typing import Any, List, Optional, TextIO, Tuple
+
+
+class BackgroundConsole:
+    """Print lines from a daemon thread instead of the calling thread."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self._stream = stream
+        self._lines: "queue.Queue[Tuple[str, Tuple[Any, ...]]]" = queue.Queue()
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._root_handlers: List[logging.Handler] = []
+        self._thread = threading.Thread(target=self._drain, name="console", daemon=True)
+        self._thread.start()
+
+    def print(self, text: str = "", *args: Any) -> None:
+        """Queue one line of output, like print(text).
+
+        As with logging, `args` are %-interpolated into `text` by the writer
+        thread, so formatting costs nothing on the calling thread.
+        """
+        self._lines.put((text, args))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued line has been written.
+
+        Returns False if `timeout` seconds passed first.
+        """
+        done = self._lines.all_tasks_done
+        with done:
+            return done.wait_for(lambda: not self._lines.unfinished_tasks, timeout)
+
+    def attach_logging(self) -> None:
+        """Route root-logger records through a queue to the existing handlers."""
+        root = logging.getLogger()
+        if not root.handlers:
+            # Nothing configured: leave Python's last-resort handler in charge
+            return
+        self._root_handlers = root.handlers[:]
+        records: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        self._listener = logging.handlers.QueueListener(
+            records, *self._root_handlers, respect_handler_level=True
+        )
+        root.handlers = [logging.handlers.QueueHandler(records)]
+        self._listener.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is still queued (waiting at most `timeout` seconds) and
+        restore direct logging."""
+        if self._listener is not None:
+            self._listener.stop()
+            logging.getLogger().handlers = self._root_handlers
+            self._listener = None
+        if self._thread.is_alive():
+            self.flush(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._lines.get()]
+            # Batch whatever else is already queued into the same flush
+            while True:
+                try:
+                    batch.append(self._lines.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                # Resolved per write so pytest's capsys and redirects still apply
+                stream = self._stream or sys.stdout
+                for line in batch:
+                    self._safe_write(stream, line)
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+            finally:
+                # Always account for the batch, or flush()/close() would wait forever
+                for _ in batch:
+                    self._lines.task_done()
+
+    def _safe_write(self, stream: TextIO, line: Tuple[str, Tuple[Any, ...]]) -> None:
+        try:
+            self._write(stream, line)
+        except (OSError, ValueError):
+            # A closed pipe (e.g. `| head`) or unencodable text: drop the
+            # line and keep the writer thread alive
+            pass
+
+    @staticmethod
+    def _write(stream: TextIO, line: Tuple[str, Tuple[Any, ...]]) -> None:
+        text, args = line
+        if args:
+            try:
+                text = text % args
+            except (TypeError, ValueError):
+                # Like logging with a bad record: show the raw parts instead
+                text = f"{text} {args!r}"
+        stream.write(text + "\n")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Union
 
@@ -102,12 +103,19 @@ class Engine:
         self.report_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize unified reporter (replaces separate CSV/JSONL files)
-        self.reporter = UnifiedReporter()
+        self.reporter = UnifiedReporter(
+            snapshot_interval=config.engine.report_snapshot_seconds,
+            save_detected_opportunities=config.engine.save_detected_opportunities,
+        )
         
         # Track detected/approved opportunities for reporting
         self._last_detected: List[Opportunity] = []
         self._last_approved: List[Opportunity] = []
         self._last_markets: List[Market] = []
+        # id -> market for _last_markets, built once per iteration
+        self._last_markets_by_id: Dict[str, Market] = {}
+        # Worker threads for concurrent venue fetches, created on first multi-client poll
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
     
     def _load_clients_from_config(self, config: AppConfig) -> List[MarketClient]:
         """
@@ -155,6 +163,31 @@ class Engine:
         
         return clients
 
+    def _fetch_client_markets(self, client: MarketClient) -> List[Market]:
+        try:
+            exchange = client.get_exchange_name()
+            markets = client.fetch_markets()
+            logger.info(f"Fetched {len(markets)} markets from {exchange}")
+            return markets
+        except Exception as e:
+            logger.error(f"Failed to fetch markets from {client.get_exchange_name()}: {e}")
+            return []
+
+    def _fetch_all_markets(self) -> List[Market]:
+        """Fetch markets from all enabled clients and merge them in client order.
+
+        With several venues the fetches run on worker threads, so their HTTP
+        round-trips overlap instead of adding up.
+        """
+        if len(self.clients) <= 1:
+            return [m for client in self.clients for m in self._fetch_client_markets(client)]
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(
+                max_workers=min(4, len(self.clients)), thread_name_prefix="market-fetch"
+            )
+        results = self._fetch_pool.map(self._fetch_client_markets, self.clients)
+        return [m for markets in results for m in markets]
+
     def run_once(self) -> List[Opportunity]:
         if self.notifier:
             try:
@@ -162,16 +195,7 @@ class Engine:
             except Exception as e:
                 logger.warning("Notifier startup failed: %s", e)
 
-        # Fetch markets from all enabled clients and merge
-        all_markets: List[Market] = []
-        for client in self.clients:
-            try:
-                exchange = client.get_exchange_name()
-                markets = client.fetch_markets()
-                logger.info(f"Fetched {len(markets)} markets from {exchange}")
-                all_markets.extend(markets)
-            except Exception as e:
-                logger.error(f"Failed to fetch markets from {client.get_exchange_name()}: {e}")
+        all_markets = self._fetch_all_markets()
         
         logger.info(f"Total markets across all exchanges: {len(all_markets)}")
         
@@ -212,7 +236,7 @@ class Engine:
                 market = market_lookup.get(a.market_id)
                 outcome_price = 0.0
                 if market:
-                    outcome = next((o for o in market.outcomes if o.id == a.outcome_id), None)
+                    outcome = market.outcome_by_id(a.outcome_id)
                     if outcome:
                         outcome_price = outcome.price
                 prices_before[a.outcome_id] = outcome_price
@@ -303,6 +327,7 @@ class Engine:
         
         # Store for reporting
         self._last_markets = all_markets
+        self._last_markets_by_id = market_lookup
         self._last_detected = all_detected_opportunities
         self._last_approved = executed
         
@@ -323,14 +348,20 @@ class Engine:
         return opportunities
 
     def run(self):
-        for i in range(self.config.engine.iterations):
-            logger.info("Iteration %s", i + 1)
-            self.run_once()
-            # Generate incremental report (appends only if data changed)
-            self.reporter.report_iteration(
-                iteration=i + 1,
-                all_markets=self._last_markets,
-                detected_opportunities=self._last_detected,
-                approved_opportunities=self._last_approved,
-            )
-            time.sleep(self.config.engine.refresh_seconds)
+        try:
+            for i in range(self.config.engine.iterations):
+                logger.info("Iteration %s", i + 1)
+                self.run_once()
+                # Generate incremental report (appends only if data changed)
+                self.reporter.report_iteration(
+                    iteration=i + 1,
+                    all_markets=self._last_markets,
+                    detected_opportunities=self._last_detected,
+                    approved_opportunities=self._last_approved,
+                )
+                time.sleep(self.config.engine.refresh_seconds)
+        finally:
+            self.reporter.flush()
+            if self._fetch_pool is not None:
+                self._fetch_pool.shutdown(wait=False)
+                self._fetch_pool = None
@@ -0,0 +1,48 @@
+"""
+JSON helpers that use orjson when installed.
+
+orjson parses and serializes several times faster than the stdlib json
+module and reads bytes directly. It is optional: without it every helper
+falls back to stdlib json and produces the same data shapes.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize to UTF-8 JSON bytes terminated by a newline.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        default: Fallback serializer for unsupported types
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(obj, indent=2 if indent else None, default=default, ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
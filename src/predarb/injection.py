@@ -72,7 +72,7 @@ class FileMarketProvider:
         if not self.file_path.exists():
             raise FileNotFoundError(f"Market fixture file not found: {file_path}")
     
-    def get_active_markets(self) -> List[Market]:
+    def get_active_markets(self, limit: Optional[int] = None) -> List[Market]:
         """Load markets from JSON file."""
         with open(self.file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -88,11 +88,12 @@ class FileMarketProvider:
                 f"dict with 'markets' key, got: {type(data)}"
             )
         
-        return [Market(**m) for m in markets_data]
+        # Slice before validation so dropped entries never become Market objects
+        return [Market(**m) for m in markets_data[:limit]]
     
-    def fetch_markets(self) -> List[Market]:
+    def fetch_markets(self, limit: Optional[int] = None) -> List[Market]:
         """Alias for get_active_markets() for Engine compatibility."""
-        return self.get_active_markets()
+        return self.get_active_markets(limit)
 
 
 class InlineMarketProvider:
@@ -101,7 +102,7 @@ class InlineMarketProvider:
     def __init__(self, json_str: str):
         self.json_str = json_str
     
-    def get_active_markets(self) -> List[Market]:
+    def get_active_markets(self, limit: Optional[int] = None) -> List[Market]:
         """Parse markets from JSON string."""
         data = json.loads(self.json_str)
         
@@ -115,8 +116,9 @@ class InlineMarketProvider:
                 f"dict with 'markets' key"
             )
         
-        return [Market(**m) for m in markets_data]
+        # Slice before validation so dropped entries never become Market objects
+        return [Market(**m) for m in markets_data[:limit]]
     
-    def fetch_markets(self) -> List[Market]:
+    def fetch_markets(self, limit: Optional[int] = None) -> List[Market]:
         """Alias for get_active_markets() for Engine compatibility."""
-        return self.get_active_markets()
+        return self.get_active_markets(limit)
@@ -30,13 +30,13 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.backends import default_backend
 
-from predarb.market_client_base import MarketClient
+from predarb.market_client_base import MarketClient, RealTimeDataSource
 from predarb.models import Market, Outcome
 
 logger = logging.getLogger(__name__)
 
 
-class KalshiClient(MarketClient):
+class KalshiClient(MarketClient, RealTimeDataSource):
     """
     Kalshi prediction market client.
     
@@ -67,3 +67,12 @@ class MarketClient(ABC):
             Exchange name (e.g., "polymarket", "kalshi")
         """
         return self.get_metadata().get("exchange", "unknown")
+
+
+class RealTimeDataSource:
+    """
+    Marker for clients that serve live data from an actual exchange.
+
+    Live paper trading only accepts clients carrying this marker; injection,
+    static and fake providers deliberately do not inherit it.
+    """
@@ -3,9 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator, ConfigDict
 
 from predarb.extractors import extract_entity, extract_threshold
 
@@ -53,6 +53,9 @@ class Market(BaseModel):
     asset: Optional[str] = None
     expiry: Optional[datetime] = None
 
+    # (outcomes list, id -> outcome) built on first outcome_by_id call
+    _outcome_index: Optional[Tuple[List[Outcome], Dict[str, Outcome]]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def _coerce_input(cls, data: object) -> object:
@@ -135,6 +138,14 @@ class Market(BaseModel):
                 return o
         return None
 
+    def outcome_by_id(self, outcome_id: str) -> Optional[Outcome]:
+        index = self._outcome_index
+        # Rebuild when the outcomes list itself has been replaced
+        if index is None or index[0] is not self.outcomes:
+            index = (self.outcomes, {o.id: o for o in reversed(self.outcomes)})
+            self._outcome_index = index
+        return index[1].get(outcome_id)
+
     @property
     def market_id(self) -> str:
         return self.id
@@ -2,6 +2,9 @@
 
 import logging
 import os
+import queue
+import threading
+import time
 from typing import List, Optional
 
 import requests
@@ -20,17 +23,31 @@ class TelegramNotifierReal(Notifier):
       - TELEGRAM_CHAT_ID: chat ID to send messages to
     
     Raises ValueError if credentials are missing.
+
+    send() only queues the text; a background thread posts it, coalescing
+    bursts into one sendMessage call, so callers never wait on the Telegram
+    round-trip. Call flush() before exiting to deliver what is queued.
     """
 
     # Sentinel to distinguish "argument omitted" vs "explicit None"
     _UNSET = object()
+    # Most queued messages combined into one sendMessage call
+    BATCH_SIZE = 20
+    # Telegram's limit on message text length
+    MAX_TEXT_LENGTH = 4096
 
-    def __init__(self, bot_token: Optional[str] = _UNSET, chat_id: Optional[str] = _UNSET):
+    def __init__(
+        self,
+        bot_token: Optional[str] = _UNSET,
+        chat_id: Optional[str] = _UNSET,
+        batch_delay: float = 0.5,
+    ):
         """Initialize TelegramNotifierReal.
         
         Args:
             bot_token: Telegram bot token (or None to read from TELEGRAM_BOT_TOKEN env var)
             chat_id: Telegram chat ID (or None to read from TELEGRAM_CHAT_ID env var)
+            batch_delay: Seconds to let a burst of messages accumulate before posting
         
         Raises:
             ValueError: If bot_token or chat_id are missing
@@ -57,13 +74,51 @@ class TelegramNotifierReal(Notifier):
             raise ValueError("TELEGRAM_CHAT_ID is required but not provided or set in environment")
         
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self.batch_delay = batch_delay
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="telegram", daemon=True)
+        self._thread.start()
 
     def send(self, text: str) -> None:
-        """Send a message to Telegram.
+        """Queue a message for Telegram.
         
         Args:
             text: Message text to send
         """
+        self._queue.put(text)
+
+    def flush(self) -> None:
+        """Block until every queued message has been posted (or failed)."""
+        self._queue.join()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Let the rest of a burst arrive, then take up to BATCH_SIZE
+            time.sleep(self.batch_delay)
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for text in self._combine(batch):
+                self._send_now(text)
+            for _ in batch:
+                self._queue.task_done()
+
+    @classmethod
+    def _combine(cls, texts: List[str]) -> List[str]:
+        """Join messages with blank lines, starting a new one at the length limit."""
+        combined: List[str] = []
+        for text in texts:
+            if combined and len(combined[-1]) + 2 + len(text) <= cls.MAX_TEXT_LENGTH:
+                combined[-1] += "\n\n" + text
+            else:
+                combined.append(text)
+        return combined
+
+    def _send_now(self, text: str) -> None:
+        """Post one message to Telegram."""
         try:
             resp = requests.post(
                 f"{self.base_url}/sendMessage",
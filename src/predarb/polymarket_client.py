@@ -1,34 +1,188 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from predarb import fastjson
 from predarb.config import PolymarketConfig
 from predarb.extractors import extract_entity, extract_expiry, extract_threshold
 from predarb.models import Market, Outcome
-from predarb.market_client_base import MarketClient
+from predarb.market_client_base import MarketClient, RealTimeDataSource
+from predarb.ratelimit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 
-class PolymarketClient(MarketClient):
-    def __init__(self, config: PolymarketConfig):
+def _redis_client(url: Optional[str]):
+    """Connect to the shared markets cache, or return None if unavailable."""
+    if not url:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.error("redis package required for polymarket.redis_url; shared cache disabled")
+        return None
+    return redis.Redis.from_url(url, decode_responses=False)
+
+
+def _keepalive_session() -> requests.Session:
+    """Session whose pooled connections stay open between iterations."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PolymarketClient(MarketClient, RealTimeDataSource):
+    # Most markets one fetch_markets() call can return
+    MARKETS_PAGE_LIMIT = 1000
+
+    def __init__(self, config: PolymarketConfig, session: Optional[requests.Session] = None):
         self.config = config
         self.host = config.host.rstrip("/")
+        # One session per client so every poll reuses the same TLS connection
+        self.session = session or _keepalive_session()
+        # (endpoint, sorted params) -> (fetched_at monotonic, parsed markets)
+        self._cache: Dict[Tuple, Tuple[float, List[Market]]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # (url, sorted params) -> (ETag, Last-Modified, parsed markets, body) of
+        # the last 200 response, for conditional revalidation
+        self._validators: Dict[Tuple, Tuple[Optional[str], Optional[str], List[Market], bytes]] = {}
+        # Second cache tier shared with other processes (raw /markets bodies)
+        self._redis = _redis_client(config.redis_url)
+        self._redis_hits = 0
+        self._bucket: Optional[TokenBucket] = None
+        if config.rps_limit > 0:
+            self._bucket = TokenBucket(config.rps_limit, config.rps_burst, floor=config.rps_floor)
 
     def fetch_markets(self) -> List[Market]:
         url = f"{self.host}/markets"
-        params = {"closed": "false", "limit": 1000, "order": "updated_at:desc"}
+        params = {"closed": "false", "limit": self.MARKETS_PAGE_LIMIT, "order": "updated_at:desc"}
+        ttl = self.config.markets_ttl_seconds
+        if ttl <= 0:
+            return self._fetch_markets(url, params)
+
+        key = ("/markets", tuple(sorted(params.items())))
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            self._cache_hits += 1
+            return list(entry[1])
+        self._cache_misses += 1
+        shared = self._shared_markets(url, params)
+        if shared is not None:
+            # Expire with the original fetch, not when this process saw it
+            fetched_at, markets = shared
+        else:
+            fetched_at, markets = now, self._fetch_markets(url, params)
+        # Failed fetches return [] and are not cached, so the next call retries
+        if markets:
+            self._cache[key] = (fetched_at, markets)
+        return list(markets)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return fetch_markets cache hits, misses and hit ratio."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_ratio": self._cache_hits / lookups if lookups else 0.0,
+            "shared_hits": self._redis_hits,
+            "ttl_seconds": self.config.markets_ttl_seconds,
+        }
+
+    def _shared_key(self, url: str, params: Dict[str, Any]) -> str:
+        digest = hashlib.md5(repr((url, sorted(params.items()))).encode()).hexdigest()
+        return f"predarb:polymarket:markets:{digest}"
+
+    def _shared_markets(self, url: str, params: Dict[str, Any]) -> Optional[Tuple[float, List[Market]]]:
+        """Markets another process stored in Redis, with their fetch time on
+        this process's monotonic clock, or None on a miss.
+
+        Entries are "<unix fetch time>\n<raw body>"; expired or unreadable
+        entries count as misses.
+        """
+        if self._redis is None:
+            return None
         try:
-            resp = requests.get(url, params=params, timeout=10)
+            raw = self._redis.get(self._shared_key(url, params))
+        except Exception as e:
+            logger.warning("Shared markets cache unavailable: %s", e)
+            return None
+        if raw is None:
+            return None
+        stamp, _, body = raw.partition(b"\n")
+        try:
+            age = max(0.0, time.time() - float(stamp))
+            payload = fastjson.loads(body)
+        except ValueError:
+            logger.warning("Ignoring unreadable shared markets cache entry")
+            return None
+        if age >= self.config.markets_ttl_seconds:
+            return None
+        self._redis_hits += 1
+        return time.monotonic() - age, self._parse_markets(payload)
+
+    def _share_markets(self, url: str, params: Dict[str, Any], body: bytes) -> None:
+        ttl = self.config.markets_ttl_seconds
+        if self._redis is None or ttl <= 0:
+            return
+        value = b"%.6f\n" % time.time() + body
+        try:
+            self._redis.setex(self._shared_key(url, params), max(1, math.ceil(ttl)), value)
+        except Exception as e:
+            logger.warning("Shared markets cache unavailable: %s", e)
+
+    def _fetch_markets(self, url: str, params: Dict[str, Any]) -> List[Market]:
+        # One round-trip per poll: Gamma /markets carries outcome prices,
+        # token ids and liquidity inline, so no per-market follow-up calls
+        key = (url, tuple(sorted(params.items())))
+        cached = self._validators.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        if self._bucket is not None:
+            self._bucket.acquire()
+        try:
+            resp = self.session.get(url, params=params, headers=headers, timeout=10)
+            if self._bucket is not None:
+                if resp.status_code == 429:
+                    self._bucket.penalize()
+                else:
+                    self._bucket.reward()
+            if resp.status_code == 304 and cached is not None:
+                # Unchanged since the last fetch: skip the body and the parse,
+                # but let other processes reuse the confirmed body again
+                self._share_markets(url, params, cached[3])
+                return list(cached[2])
             resp.raise_for_status()
-            payload = resp.json()
+            payload = fastjson.loads(resp.content)
         except Exception as e:
             logger.error("Failed to fetch markets: %s", e)
             return []
+        markets = self._parse_markets(payload)
+        if markets:
+            self._share_markets(url, params, resp.content)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[key] = (etag, last_modified, markets, resp.content)
+        return markets
+
+    def _parse_markets(self, payload: Any) -> List[Market]:
         # Gamma API returns direct array, not wrapped in {data: [...]}
         raw_markets = payload if isinstance(payload, list) else payload.get("data", [])
         markets: List[Market] = []
@@ -40,18 +194,16 @@ class PolymarketClient(MarketClient):
 
     def _parse_market(self, data: dict) -> Optional[Market]:
         try:
-            import json
-            
             # Gamma API uses JSON strings for outcomes and prices
             outcomes_str = data.get("outcomes", "[]")
             prices_str = data.get("outcomePrices", "[]")
             token_ids_str = data.get("clobTokenIds", "[]")
             
             try:
-                outcome_labels = json.loads(outcomes_str) if isinstance(outcomes_str, str) else outcomes_str
-                outcome_prices = json.loads(prices_str) if isinstance(prices_str, str) else prices_str
-                token_ids = json.loads(token_ids_str) if isinstance(token_ids_str, str) else token_ids_str
-            except json.JSONDecodeError:
+                outcome_labels = fastjson.loads(outcomes_str) if isinstance(outcomes_str, str) else outcomes_str
+                outcome_prices = fastjson.loads(prices_str) if isinstance(prices_str, str) else prices_str
+                token_ids = fastjson.loads(token_ids_str) if isinstance(token_ids_str, str) else token_ids_str
+            except fastjson.JSONDecodeError:
                 logger.warning("Failed to parse outcomes/prices JSON for market %s", data.get("id"))
                 return None
             
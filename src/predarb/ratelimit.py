@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """Blocking token bucket whose refill rate adapts to server pushback.
+
+    `acquire()` waits until a token is available, so callers are spread out
+    at `rate` requests per second with bursts of up to `capacity`. A 429
+    reported through `penalize()` halves the rate (never below `floor`);
+    each successful call reported through `reward()` nudges it back up
+    towards the configured ceiling.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        floor: Optional[float] = None,
+        recovery: float = 1.05,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.ceiling = rate
+        self.floor = min(floor if floor is not None else rate / 8, rate)
+        self.rate = rate
+        self.capacity = capacity
+        self.recovery = recovery
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        # Number of acquire() calls that had to wait for a token
+        self.contended = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return seconds waited."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            self.contended += 1
+            wait = -self._tokens / self.rate
+        self._sleep(wait)
+        return wait
+
+    def penalize(self) -> None:
+        """Server said slow down: halve the rate."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.floor, self.rate / 2)
+
+    def reward(self) -> None:
+        """Request went through: recover part of the way to the ceiling."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.ceiling, self.rate * self.recovery)
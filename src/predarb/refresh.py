@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from predarb.config import EngineConfig
+
+
+class AdaptiveRefresh:
+    """Refresh interval that follows how often iterations find opportunities.
+
+    An exponentially weighted average of detections per iteration is compared
+    with a target: above it the interval shrinks by `speedup`, below it the
+    interval grows by `backoff`, always within [minimum, maximum]. Quiet
+    periods therefore poll the API less, busy periods more.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float,
+        maximum: float,
+        target: float = 1.0,
+        alpha: float = 0.3,
+        backoff: float = 1.1,
+        speedup: float = 0.9,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target = target
+        self.alpha = alpha
+        self.backoff = backoff
+        self.speedup = speedup
+        self.seconds = min(max(initial, minimum), maximum)
+        self.rate = target
+
+    @classmethod
+    def from_config(cls, config: EngineConfig) -> "AdaptiveRefresh":
+        """Build from engine config; when adaptive_refresh is off the interval stays fixed."""
+        if not config.adaptive_refresh:
+            return cls(config.refresh_seconds, config.refresh_seconds, config.refresh_seconds)
+        return cls(
+            config.refresh_seconds,
+            config.refresh_min_seconds,
+            config.refresh_max_seconds,
+            target=config.refresh_target_detections,
+        )
+
+    def update(self, detected: int) -> float:
+        """Fold in one iteration's detection count and return the next interval."""
+        self.rate += self.alpha * (detected - self.rate)
+        if self.rate > self.target:
+            self.seconds = max(self.minimum, self.seconds * self.speedup)
+        elif self.rate < self.target:
+            self.seconds = min(self.maximum, self.seconds * self.backoff)
+        return self.seconds
@@ -12,12 +12,13 @@ Restart-safe and designed for continuous live operation.
 
 import csv
 import hashlib
-import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from . import fastjson
 from .models import Market, Opportunity
 
 logger = logging.getLogger(__name__)
@@ -30,19 +31,68 @@ SUMMARY_CSV = REPORTS_DIR / "live_summary.csv"
 class LiveReporter:
     """Manages live incremental reporting with deduplication."""
 
-    def __init__(self, reports_dir: Optional[Path] = None):
+    def __init__(self, reports_dir: Optional[Path] = None, flush_every: int = 1):
         """Initialize reporter.
         
         Args:
             reports_dir: Directory for report files. Defaults to ./reports
+            flush_every: Flush the CSV after this many rows. The file stays
+                open between iterations; raise this to batch writes further.
         """
         self.reports_dir = reports_dir or REPORTS_DIR
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.reports_dir / ".last_report_state.json"
         self.summary_csv = self.reports_dir / "live_summary.csv"
+        self.flush_every = max(1, flush_every)
+        
+        self._csv_fp = None
+        self._csv_writer = None
+        self._pending_rows = 0
         
         self.last_state = self._load_state()
     
+    def flush(self):
+        """Flush buffered CSV rows to disk."""
+        if self._csv_fp is not None and self._pending_rows:
+            try:
+                self._csv_fp.flush()
+            except OSError as e:
+                logger.error(f"Failed to flush CSV: {e}")
+            self._pending_rows = 0
+    
+    def close(self):
+        """Flush and close the CSV file handle."""
+        if self._csv_fp is None:
+            return
+        self.flush()
+        try:
+            self._csv_fp.close()
+        except OSError as e:
+            logger.error(f"Failed to close CSV: {e}")
+        self._csv_fp = None
+        self._csv_writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _open_csv(self):
+        """Open (or reopen) the CSV for appending and return its writer."""
+        self.close()
+        self._csv_fp = open(
+            self.summary_csv, "a", buffering=1 << 16, newline="", encoding="utf-8"
+        )
+        self._csv_writer = csv.writer(self._csv_fp)
+        return self._csv_writer
+    
     def _load_state(self) -> Dict:
         """Load the last saved state from disk."""
         if not self.state_file.exists():
@@ -51,9 +101,8 @@ class LiveReporter:
                 "approved_opp_ids_hash": None,
             }
         try:
-            with open(self.state_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            return fastjson.loads(self.state_file.read_bytes())
+        except (fastjson.JSONDecodeError, OSError) as e:
             logger.warning(f"Could not load state file: {e}. Starting fresh.")
             return {
                 "market_ids_hash": None,
@@ -72,24 +121,29 @@ class LiveReporter:
             "last_opps_approved": opps_approved_count,
             "last_updated": datetime.utcnow().isoformat(),
         }
+        # Write to a temp file and rename so a crash never leaves a torn state file
+        tmp_file = self.state_file.with_suffix(".tmp")
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            tmp_file.write_bytes(fastjson.dumps(state, indent=True))
+            os.replace(tmp_file, self.state_file)
         except OSError as e:
             logger.error(f"Failed to save state: {e}")
     
     def _compute_hash(self, items: List[str]) -> str:
         """Compute stable, order-independent hash of a list of IDs.
         
+        Only used for change detection, so a short 64-bit BLAKE2b digest
+        is enough and cheaper to compute and store than SHA-256.
+        
         Args:
             items: List of IDs or identifiers
             
         Returns:
-            Hex digest of sorted items
+            16-char hex digest of sorted items
         """
         sorted_items = sorted(set(items))
         combined = "|".join(sorted_items)
-        return hashlib.sha256(combined.encode()).hexdigest()
+        return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
     
     def _get_market_ids(self, markets: List[Market]) -> List[str]:
         """Extract market IDs."""
@@ -238,56 +292,61 @@ class LiveReporter:
             filter_efficiency = f"{(opps_after_filter / opps_found * 100):.1f}%"
         
         try:
-            with open(self.summary_csv, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                if write_header:
-                    # Header with detailed field descriptions
-                    writer.writerow([
-                        "TIMESTAMP",
-                        "READABLE_TIME",
-                        "ITERATION",
-                        "MARKETS",
-                        "MARKETS_Δ",
-                        "DETECTED",
-                        "DETECTED_Δ",
-                        "APPROVED",
-                        "APPROVED_Δ",
-                        "APPROVAL%",
-                        "STATUS",
-                        "MARKET_HASH",
-                        "OPP_HASH",
-                    ])
-                    writer.writerow([
-                        "(ISO8601)",
-                        "(HH:MM:SS.mmm)",
-                        "#",
-                        "count",
-                        "change",
-                        "count",
-                        "change",
-                        "count",
-                        "change",
-                        "ratio",
-                        "indicator",
-                        "sha256",
-                        "sha256",
-                    ])
-                
-                # Data row with all details
+            writer = self._csv_writer
+            # Reopen if the file was removed underneath the open handle
+            if writer is None or write_header:
+                writer = self._open_csv()
+            if write_header:
+                # Header with detailed field descriptions
                 writer.writerow([
-                    timestamp.isoformat(),
-                    readable_time,
-                    iteration,
-                    markets_found,
-                    markets_change,
-                    opps_found,
-                    opps_detected_change,
-                    opps_after_filter,
-                    opps_approved_change,
-                    filter_efficiency,
-                    status,
-                    (self.last_state.get("market_ids_hash") or "")[:16],
-                    (self.last_state.get("approved_opp_ids_hash") or "")[:16],
+                    "TIMESTAMP",
+                    "READABLE_TIME",
+                    "ITERATION",
+                    "MARKETS",
+                    "MARKETS_Δ",
+                    "DETECTED",
+                    "DETECTED_Δ",
+                    "APPROVED",
+                    "APPROVED_Δ",
+                    "APPROVAL%",
+                    "STATUS",
+                    "MARKET_HASH",
+                    "OPP_HASH",
                 ])
+                writer.writerow([
+                    "(ISO8601)",
+                    "(HH:MM:SS.mmm)",
+                    "#",
+                    "count",
+                    "change",
+                    "count",
+                    "change",
+                    "count",
+                    "change",
+                    "ratio",
+                    "indicator",
+                    "blake2b",
+                    "blake2b",
+                ])
+            
+            # Data row with all details
+            writer.writerow([
+                timestamp.isoformat(),
+                readable_time,
+                iteration,
+                markets_found,
+                markets_change,
+                opps_found,
+                opps_detected_change,
+                opps_after_filter,
+                opps_approved_change,
+                filter_efficiency,
+                status,
+                (self.last_state.get("market_ids_hash") or "")[:16],
+                (self.last_state.get("approved_opp_ids_hash") or "")[:16],
+            ])
+            self._pending_rows += 1
+            if self._pending_rows >= self.flush_every:
+                self.flush()
         except OSError as e:
             logger.error(f"Failed to append CSV row: {e}")
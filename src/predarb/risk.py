@@ -46,7 +46,7 @@ class RiskManager:
         # Verify all SELL actions have existing inventory (no short selling allowed)
         # and enforce BUY-only strategy for entries
         for action in opp.actions:
-            position_key = f"{action.market_id}:{action.outcome_id}"
+            position_key = (action.market_id, action.outcome_id)
             inventory = self.broker_state.positions.get(position_key, 0.0)
             
             if action.side.upper() == "SELL":
@@ -184,15 +184,11 @@ class RiskManager:
         for key, qty in self.broker_state.positions.items():
             if qty == 0:
                 continue
-            # Split on first colon only - outcome_id may contain colons
-            parts = key.split(":", 1)
-            if len(parts) != 2:
-                continue
-            mid, oid = parts
+            mid, oid = key
             market = market_lookup.get(mid)
             if not market:
                 continue
-            outcome = next((o for o in market.outcomes if o.id == oid), None)
+            outcome = market.outcome_by_id(oid)
             if not outcome:
                 continue
             total_equity += qty * outcome.price
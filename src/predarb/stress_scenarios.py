@@ -21,9 +21,14 @@ class StressScenario:
         """Generate markets for this scenario."""
         raise NotImplementedError
     
-    def fetch_markets(self) -> List[Market]:
-        """Alias for get_active_markets() for Engine compatibility."""
-        return self.get_active_markets()
+    def fetch_markets(self, limit: Optional[int] = None) -> List[Market]:
+        """Alias for get_active_markets() for Engine compatibility.
+        
+        Args:
+            limit: Return only the first `limit` markets
+        """
+        markets = self.get_active_markets()
+        return markets if limit is None else markets[:limit]
 
 
 class HighVolumeScenario(StressScenario):
@@ -32,13 +37,16 @@ class HighVolumeScenario(StressScenario):
     Tests market processing performance and filtering efficiency.
     """
     
-    def get_active_markets(self) -> List[Market]:
+    def get_active_markets(self, limit: Optional[int] = None) -> List[Market]:
         markets = []
         now = datetime.utcnow()
         end_date = now + timedelta(days=30)
+        # With a limit, build only the leading markets instead of all 1000
+        n_normal = 990 if limit is None else min(990, limit)
+        n_arb = 10 if limit is None else min(10, max(0, limit - 990))
         
         # 990 "normal" markets with fair pricing
-        for i in range(990):
+        for i in range(n_normal):
             yes_price = 0.48 + random.uniform(0, 0.04)
             no_price = 0.52 - random.uniform(0, 0.04)
             
@@ -58,7 +66,7 @@ class HighVolumeScenario(StressScenario):
             markets.append(market)
         
         # 10 markets with actual arbitrage opportunities
-        for i in range(10):
+        for i in range(n_arb):
             gross_cost = 0.92 + random.uniform(-0.03, 0.01)
             yes_price = gross_cost * 0.5
             no_price = gross_cost * 0.5
@@ -79,6 +87,9 @@ class HighVolumeScenario(StressScenario):
             markets.append(market)
         
         return markets
+    
+    def fetch_markets(self, limit: Optional[int] = None) -> List[Market]:
+        return self.get_active_markets(limit)
 
 
 class ManyRiskRejectionsScenario(StressScenario):
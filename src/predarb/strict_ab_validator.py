@@ -84,7 +84,7 @@ class StrictABValidator:
         self,
         venue_a_constraints: Optional[VenueConstraints] = None,
         venue_b_constraints: Optional[VenueConstraints] = None,
-        broker_positions: Optional[Dict[str, float]] = None
+        broker_positions: Optional[Dict[Tuple[str, str], float]] = None
     ):
         """
         Initialize validator.
@@ -92,7 +92,7 @@ class StrictABValidator:
         Args:
             venue_a_constraints: Constraints for venue A (default: Kalshi-like)
             venue_b_constraints: Constraints for venue B (default: Polymarket-like)
-            broker_positions: Current inventory positions {market:outcome -> quantity}
+            broker_positions: Current inventory positions {(market_id, outcome_id) -> quantity}
         """
         self.venue_a = venue_a_constraints or VenueConstraints.kalshi_like()
         self.venue_b = venue_b_constraints or VenueConstraints.polymarket_like()
@@ -249,7 +249,7 @@ class StrictABValidator:
                 # Venue B does not support shorting
                 if action.side.upper() == "SELL":
                     # Check if we have inventory for this position
-                    position_key = f"{action.market_id}:{action.outcome_id}"
+                    position_key = (action.market_id, action.outcome_id)
                     inventory = self.broker_positions.get(position_key, 0.0)
                     
                     if inventory <= 0:
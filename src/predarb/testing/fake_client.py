@@ -85,6 +85,10 @@ class FakePolymarketClient:
         """
         return self.fetch_markets()
 
+    def get_exchange_name(self) -> str:
+        """Exchange identifier, as MarketClient provides for real clients."""
+        return "polymarket"
+
     def reset(self, minute: int = 0) -> None:
         """Reset simulation to a specific minute.
         
@@ -10,33 +10,128 @@ import json
 import logging
 import os
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from . import fastjson
 from .models import Market, Opportunity, Trade, TradeAction
 
 logger = logging.getLogger(__name__)
 
 REPORTS_DIR = Path(__file__).parent.parent.parent / "reports"
 UNIFIED_REPORT = REPORTS_DIR / "unified_report.json"
+ITERATIONS_LOG = REPORTS_DIR / "unified_report.jsonl"
+DETECTED_OPPORTUNITIES = REPORTS_DIR / "detected_opportunities.json"
+
+
+def _opportunity_record(opp: Opportunity) -> Dict[str, Any]:
+    """Serialize an opportunity to plain JSON types."""
+    return {
+        "type": opp.type,
+        "market_ids": list(opp.market_ids),
+        "description": opp.description,
+        "net_edge": opp.net_edge,
+        "actions": [
+            {
+                "market_id": a.market_id,
+                "outcome_id": a.outcome_id,
+                "side": a.side,
+                "amount": a.amount,
+                "limit_price": a.limit_price,
+            }
+            for a in opp.actions
+        ],
+        "metadata": opp.metadata,
+    }
+
+
+def _hash_ids(items: List[str]) -> str:
+    """Stable, order-independent 64-bit BLAKE2b digest of a list of IDs."""
+    digest = hashlib.blake2b(digest_size=8)
+    for item in sorted(set(items)):
+        digest.update(item.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_latest_opportunities(
+    path: Path = DETECTED_OPPORTUNITIES,
+    market_ids: Optional[List[str]] = None,
+) -> Optional[List[Opportunity]]:
+    """Rebuild the detected opportunities of the last recorded iteration.
+    
+    Args:
+        path: Snapshot written by UnifiedReporter
+        market_ids: IDs of the markets the caller will analyse against. When
+            given, the snapshot is only used if it was recorded for exactly
+            this market set.
+    
+    Returns:
+        The opportunities, or None if no usable record exists
+    """
+    if not path.exists():
+        return None
+    try:
+        record = fastjson.loads(path.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load detected opportunities from {path}: {e}")
+        return None
+    
+    if market_ids is not None and record.get("market_ids_hash") != _hash_ids(market_ids):
+        logger.info(f"Detected opportunities in {path} were recorded for a different market set")
+        return None
+    
+    return [
+        Opportunity(
+            type=o["type"],
+            market_ids=o["market_ids"],
+            description=o["description"],
+            net_edge=o["net_edge"],
+            actions=[TradeAction(**a) for a in o["actions"]],
+            metadata=o.get("metadata") or {},
+        )
+        for o in record["opportunities"]
+    ]
 
 
 class UnifiedReporter:
     """Manages unified JSON reporting for all arbitrage bot activities."""
 
-    def __init__(self, reports_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        reports_dir: Optional[Path] = None,
+        snapshot_interval: float = 0.0,
+        save_detected_opportunities: bool = False,
+    ):
         """Initialize unified reporter.
         
         Args:
             reports_dir: Directory for report files. Defaults to ./reports
+            snapshot_interval: Minimum seconds between rewrites of the full
+                JSON document. 0 rewrites on every change; with a positive
+                interval, call flush() before exit to persist the tail.
+                Iteration records not yet in the document are kept in a
+                JSONL log and folded back in on the next startup.
+            save_detected_opportunities: Also keep the detected opportunities
+                of the latest recorded iteration in detected_opportunities.json
+                (overwritten each time) for debug_rejections.py.
         """
         self.reports_dir = reports_dir or REPORTS_DIR
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.report_file = self.reports_dir / "unified_report.json"
+        self.iterations_log = self.reports_dir / "unified_report.jsonl"
+        self.snapshot_interval = snapshot_interval
+        self._last_snapshot: Optional[float] = None
+        self._dirty = False
+        self.save_detected_opportunities = save_detected_opportunities
+        self.opportunities_file = self.reports_dir / "detected_opportunities.json"
         
         # Load existing report or create new structure
         self.report_data = self._load_report()
+        # Recover iterations a crash kept out of the last snapshot
+        self.compact()
         self.last_state = self.report_data["metadata"]["last_state"]
     
     def _load_report(self) -> Dict[str, Any]:
@@ -64,26 +159,85 @@ class UnifiedReporter:
             return fresh_structure
         
         try:
-            with open(self.report_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            return fastjson.loads(self.report_file.read_bytes())
+        except (fastjson.JSONDecodeError, OSError) as e:
             logger.warning(f"Could not load report file: {e}. Creating new report.")
             return fresh_structure  # Return fresh structure
     
+    def _maybe_save_report(self):
+        """Rewrite the JSON document unless the last snapshot is too recent."""
+        now = time.monotonic()
+        if (self.snapshot_interval > 0 and self._last_snapshot is not None
+                and now - self._last_snapshot < self.snapshot_interval):
+            self._dirty = True
+            return
+        self._save_report()
+        self._last_snapshot = now
+    
+    def flush(self):
+        """Write any changes held back by snapshot_interval."""
+        if self._dirty:
+            self._save_report()
+            self._last_snapshot = time.monotonic()
+    
+    def compact(self) -> int:
+        """Fold iterations pending in the JSONL log into the document and save it.
+        
+        The log only holds iterations recorded since the last snapshot, so
+        after a crash with a snapshot_interval they exist nowhere else.
+        Called on startup; every save empties the log again.
+        
+        Returns:
+            Number of iterations recovered from the log
+        """
+        pending: List[Dict[str, Any]] = []
+        try:
+            with open(self.iterations_log, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        pending.append(fastjson.loads(line))
+                    except fastjson.JSONDecodeError:
+                        # A torn final line from an interrupted append
+                        logger.warning("Skipping unreadable line in iteration log")
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.error(f"Failed to read iteration log: {e}")
+            return 0
+        
+        if pending:
+            self.report_data["iterations"].extend(pending)
+            self._save_report()
+            self._last_snapshot = time.monotonic()
+        else:
+            self._truncate_iterations_log()
+        return len(pending)
+    
+    def _append_iteration(self, iteration_record: Dict[str, Any]):
+        """Append one not-yet-snapshotted iteration record to the JSONL log."""
+        try:
+            with open(self.iterations_log, "ab") as f:
+                f.write(fastjson.dumps(iteration_record))
+        except OSError as e:
+            logger.error(f"Failed to append iteration record: {e}")
+    
     def _save_report(self):
         """Save report data atomically to disk."""
         self.report_data["metadata"]["last_updated"] = datetime.utcnow().isoformat()
         
         try:
             # Atomic write via temp file
+            # Serialize up front so the temp file gets one write, not one per token
+            data = fastjson.dumps(self.report_data, indent=True)
             with tempfile.NamedTemporaryFile(
-                mode="w",
+                mode="wb",
                 delete=False,
                 dir=str(self.reports_dir),
-                encoding="utf-8",
                 suffix=".json"
             ) as tmp:
-                json.dump(self.report_data, tmp, indent=2)
+                tmp.write(data)
                 tmp.flush()
                 os.fsync(tmp.fileno())
             
@@ -95,15 +249,29 @@ class UnifiedReporter:
                 if self.report_file.exists():
                     os.remove(self.report_file)
                 os.rename(tmp.name, self.report_file)
+            self._dirty = False
                 
         except OSError as e:
             logger.error(f"Failed to save unified report: {e}")
+            return
+        # Everything in the log is now part of the document
+        self._truncate_iterations_log()
+    
+    def _truncate_iterations_log(self):
+        """Drop the JSONL log once its iterations are in the document."""
+        try:
+            self.iterations_log.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to clear iteration log: {e}")
     
     def _compute_hash(self, items: List[str]) -> str:
-        """Compute stable, order-independent hash of a list of IDs."""
-        sorted_items = sorted(set(items))
-        combined = "|".join(sorted_items)
-        return hashlib.sha256(combined.encode()).hexdigest()
+        """Compute stable, order-independent hash of a list of IDs.
+        
+        Items are fed to a 64-bit BLAKE2b digest one at a time, NUL-separated,
+        so no joined string is built; only the digests are compared between
+        iterations.
+        """
+        return _hash_ids(items)
     
     def _get_market_ids(self, markets: List[Market]) -> List[str]:
         """Extract market IDs."""
@@ -201,7 +369,10 @@ class UnifiedReporter:
         })
         self.report_data["metadata"]["last_state"] = self.last_state
         
-        self._save_report()
+        self._append_iteration(iteration_record)
+        self._maybe_save_report()
+        if self.save_detected_opportunities:
+            self._save_opportunities(iteration, current_market_hash, detected_opportunities)
         
         logger.info(
             f"Iteration {iteration}: Recorded "
@@ -211,6 +382,28 @@ class UnifiedReporter:
         )
         return True
     
+    def _save_opportunities(
+        self,
+        iteration: int,
+        market_hash: str,
+        opportunities: List[Opportunity],
+    ):
+        """Replace the detected-opportunities snapshot with this iteration's."""
+        try:
+            record = {
+                "iteration": iteration,
+                "market_ids_hash": market_hash,
+                "opportunities": [_opportunity_record(o) for o in opportunities],
+            }
+            data = fastjson.dumps(record, default=str)
+            with tempfile.NamedTemporaryFile(
+                mode="wb", delete=False, dir=str(self.reports_dir), suffix=".json"
+            ) as tmp:
+                tmp.write(data)
+            os.replace(tmp.name, self.opportunities_file)
+        except (OSError, TypeError, AttributeError) as e:
+            logger.error(f"Failed to save detected opportunities: {e}")
+    
     def log_opportunity_execution(
         self,
         opportunity: Opportunity,
@@ -275,7 +468,7 @@ class UnifiedReporter:
         }
         
         self.report_data["opportunity_executions"].append(execution_record)
-        self._save_report()
+        self._maybe_save_report()
         
         return trace_id
     
@@ -303,6 +496,6 @@ class UnifiedReporter:
             }
             self.report_data["trades"].append(trade_record)
         
-        self._save_report()
+        self._maybe_save_report()
         
         logger.info(f"Logged {len(trades)} trades to unified report")
@@ -7,9 +7,13 @@ Also provides legacy CSV export for backward compatibility.
 
 from pathlib import Path
 from typing import Union, Dict, Any
-import json
 import csv
 
+from .predarb import fastjson
+
+# Write buffer for exported files; flushes once per MiB instead of per row
+_WRITE_BUFFER = 1 << 20
+
 
 def read_unified_report(reports_dir: Union[str, Path] = None) -> Dict[str, Any]:
     """Read the unified JSON report.
@@ -36,9 +40,9 @@ def read_unified_report(reports_dir: Union[str, Path] = None) -> Dict[str, Any]:
         }
     
     try:
-        with open(report_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+        with open(report_path, "rb") as f:
+            return fastjson.loads(f.read())
+    except (fastjson.JSONDecodeError, OSError) as e:
         print(f"Error reading unified report: {e}")
         return {
             "metadata": {},
@@ -189,7 +193,7 @@ def export_legacy_csv(reports_dir: Union[str, Path] = "reports", output_dir: Uni
     # Export iterations to live_summary.csv
     iterations = report.get("iterations", [])
     if iterations:
-        with open(output_dir / "live_summary.csv", "w", newline="", encoding="utf-8") as f:
+        with open(output_dir / "live_summary.csv", "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "TIMESTAMP", "ITERATION", "MARKETS", "MARKETS_Δ",
@@ -216,15 +220,15 @@ def export_legacy_csv(reports_dir: Union[str, Path] = "reports", output_dir: Uni
     # Export executions to opportunity_logs.jsonl
     executions = report.get("opportunity_executions", [])
     if executions:
-        with open(output_dir / "opportunity_logs.jsonl", "w", encoding="utf-8") as f:
+        with open(output_dir / "opportunity_logs.jsonl", "wb", buffering=_WRITE_BUFFER) as f:
             for exec_rec in executions:
-                f.write(json.dumps(exec_rec) + "\n")
+                f.write(fastjson.dumps(exec_rec))
         print(f"Exported {len(executions)} executions to opportunity_logs.jsonl")
     
     # Export trades to paper_trades.csv
     trades = report.get("trades", [])
     if trades:
-        with open(output_dir / "paper_trades.csv", "w", newline="", encoding="utf-8") as f:
+        with open(output_dir / "paper_trades.csv", "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "timestamp", "market_id", "outcome_id", "side",
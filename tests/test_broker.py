@@ -1,3 +1,5 @@
+import pytest
+
 from predarb.broker import PaperBroker
 from predarb.config import BrokerConfig
 from predarb.models import Market, Outcome, Opportunity, TradeAction
@@ -19,3 +21,59 @@ def test_broker_executes_with_fees():
     trade = trades[0]
     assert trade.fees > 0
     assert broker.cash < cfg.initial_cash
+
+
+def test_broker_tracks_open_position_count():
+    cfg = BrokerConfig(initial_cash=1000.0, fee_bps=0, slippage_bps=0, depth_fraction=1.0)
+    broker = PaperBroker(cfg)
+    market = Market(
+        id="m",
+        question="q",
+        outcomes=[Outcome(id="y", label="Yes", price=0.5), Outcome(id="n", label="No", price=0.5)],
+        liquidity=1000,
+    )
+    lookup = {"m": market}
+    buy = Opportunity(
+        type="PARITY",
+        market_ids=["m"],
+        description="test",
+        net_edge=0.1,
+        actions=[
+            TradeAction(market_id="m", outcome_id="y", side="BUY", amount=2.0, limit_price=0.5),
+            TradeAction(market_id="m", outcome_id="n", side="BUY", amount=2.0, limit_price=0.5),
+        ],
+    )
+    broker.execute(lookup, buy)
+    broker.execute(lookup, buy)
+    assert broker.open_position_count() == 2
+
+    broker.close_position(lookup, "m", "y")
+    assert broker.open_position_count() == 1
+    assert broker.open_position_count() == sum(1 for q in broker.positions.values() if q != 0)
+
+
+def test_broker_equity_curve_matches_full_mark_to_market():
+    cfg = BrokerConfig(initial_cash=1000.0, fee_bps=10, slippage_bps=5, depth_fraction=1.0)
+    broker = PaperBroker(cfg)
+    market = Market(
+        id="m",
+        question="q",
+        outcomes=[Outcome(id="y", label="Yes", price=0.6), Outcome(id="n", label="No", price=0.3)],
+        liquidity=1000,
+    )
+    lookup = {"m": market}
+    opp = Opportunity(
+        type="PARITY",
+        market_ids=["m"],
+        description="test",
+        net_edge=0.1,
+        actions=[
+            TradeAction(market_id="m", outcome_id="y", side="BUY", amount=3.0, limit_price=0.5),
+            TradeAction(market_id="m", outcome_id="n", side="BUY", amount=2.0, limit_price=0.4),
+            TradeAction(market_id="m", outcome_id="y", side="BUY", amount=1.0, limit_price=0.55),
+        ],
+    )
+    broker.execute(lookup, opp)
+    broker.close_position(lookup, "m", "n", 1.0)
+    assert broker.equity_curve[-1] == pytest.approx(broker.cash + broker._unrealized_pnl(lookup))
+    assert len(broker.equity_curve) == len(broker.trades) + 1
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
-from src.detectors import detect_parity_arb
-from src.models import Opportunity
+from src import detectors
+from src.detectors import detect_opportunities, detect_parity_arb, extract_ladder_info, parity_threshold
+from src.models import NO, YES, Market, Opportunity, Outcome, canonical_label
 from src.risk import RiskManager, RiskConfig
 from src.broker import PaperBroker, BrokerConfig, TradeAction
 
@@ -21,6 +23,46 @@ def test_detect_parity_arb_none(mock_client):
     opps = detect_parity_arb(market)
     assert len(opps) == 0
 
+def test_detect_opportunities_matches_per_market_detection():
+    def market(mid, p_yes, p_no, labels=("Yes", "No")):
+        outcomes = [Outcome(f"{mid}_y", labels[0], p_yes), Outcome(f"{mid}_n", labels[1], p_no)]
+        return Market(mid, mid, outcomes, None, 10000.0, 0.0)
+
+    markets = [
+        market("arb", 0.45, 0.45),
+        market("fair", 0.60, 0.40),
+        market("unlabeled", 0.30, 0.30, labels=("A", "B")),
+        market("edge", 0.50, 0.48),
+    ]
+    expected = [o for m in markets for o in detect_parity_arb(m)]
+    opps = detect_opportunities(markets)
+    assert [o.market_id for o in opps] == [o.market_id for o in expected] == ["arb", "edge"]
+    assert [o.description for o in opps] == [o.description for o in expected]
+
+def test_canonical_label_normalizes_binary_casing():
+    assert canonical_label(" YES ") is YES
+    assert canonical_label("no") is NO
+    assert canonical_label("Over 2.5") == "Over 2.5"
+
+def test_parity_threshold_accounts_for_both_legs():
+    broker = BrokerConfig(fee_bps=20, slippage_bps=20)
+    assert parity_threshold(broker) == pytest.approx(0.992)
+    assert parity_threshold(broker, min_edge=0.01) == pytest.approx(0.982)
+
+def test_parity_hit_kernels_agree():
+    rng = np.random.default_rng(0)
+    yes, no = rng.uniform(0.3, 0.7, 500), rng.uniform(0.3, 0.7, 500)
+    expected = detectors._parity_hits_numpy(yes, no, 0.99)
+    assert detectors._parity_hits_loop(yes, no, 0.99).tolist() == expected.tolist()
+    assert detectors._parity_hits(yes, no, 0.99).tolist() == expected.tolist()
+
+def test_extract_ladder_info():
+    market = Market("m", "Bitcoin > $100,000 on Dec 31 2024", [], None, 0.0, 0.0)
+    assert extract_ladder_info(market) == {
+        "asset": "Bitcoin", "comparator": ">", "threshold": 100000.0, "date": "Dec 31 2024",
+    }
+    assert extract_ladder_info(Market("n", "Will it rain?", [], None, 0.0, 0.0)) is None
+
 def test_risk_manager_liquidity(mock_client):
     config = RiskConfig(min_liquidity=1000.0)
     rm = RiskManager(config)
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from predarb import config as config_module
+from predarb.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(monkeypatch):
+    monkeypatch.setenv("PREDARB_CONFIG_CACHE", "1")
+
+
+def _write(path, cash):
+    path.write_text(f"broker:\n  initial_cash: {cash}\n", encoding="utf-8")
+
+
+def _count_parses(monkeypatch):
+    parses = []
+    real_parse = config_module._parse_config
+    monkeypatch.setattr(config_module, "_parse_config", lambda p: parses.append(p) or real_parse(p))
+    return parses
+
+
+def test_load_config_skips_validation_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "config.yml"
+    _write(path, 100.0)
+    parses = _count_parses(monkeypatch)
+
+    first = load_config(path)
+    first.broker.initial_cash = 1.0
+    second = load_config(path)
+    assert len(parses) == 1
+    assert second.broker.initial_cash == 100.0
+
+    _write(path, 250.0)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(path).broker.initial_cash == 250.0
+    assert len(parses) == 2
+
+
+def test_cached_config_matches_a_fresh_parse(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("broker:\n  initial_cash: 100.0\nrisk:\n  max_open_positions: 3\n", encoding="utf-8")
+    load_config(path)
+    cached = load_config(path)
+    fresh = config_module._apply_env_overrides(config_module._parse_config(path))
+    assert cached.model_dump() == fresh.model_dump()
+
+
+def test_env_secrets_are_read_at_load_and_never_cached(tmp_path, monkeypatch):
+    path = tmp_path / "config.yml"
+    _write(path, 100.0)
+    monkeypatch.setenv("POLYMARKET_API_KEY", "first-secret")
+    assert load_config(path).polymarket.api_key == "first-secret"
+    assert b"first-secret" not in config_module._cache_path(path).read_bytes()
+
+    monkeypatch.setenv("POLYMARKET_API_KEY", "second-secret")
+    assert load_config(path).polymarket.api_key == "second-secret"
+
+
+def test_corrupt_cache_falls_back_to_validation(tmp_path, monkeypatch):
+    path = tmp_path / "config.yml"
+    _write(path, 100.0)
+    load_config(path)
+    config_module._cache_path(path).write_bytes(b"{not json")
+    parses = _count_parses(monkeypatch)
+    assert load_config(path).broker.initial_cash == 100.0
+    assert len(parses) == 1
+
+
+def test_code_change_invalidates_cache(tmp_path, monkeypatch):
+    path = tmp_path / "config.yml"
+    _write(path, 100.0)
+    load_config(path)
+    parses = _count_parses(monkeypatch)
+    load_config(path)
+    assert len(parses) == 0
+
+    monkeypatch.setattr(config_module, "_code_digest", lambda: "edited")
+    assert load_config(path).broker.initial_cash == 100.0
+    assert len(parses) == 1
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("PREDARB_CONFIG_CACHE")
+    path = tmp_path / "config.yml"
+    _write(path, 100.0)
+    assert load_config(path).broker.initial_cash == 100.0
+    assert not config_module._cache_path(path).exists()
+
+
+def test_yaml_credentials_are_never_cached(tmp_path, monkeypatch):
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+    path = tmp_path / "config.yml"
+    path.write_text('telegram:\n  bot_token: ""\n', encoding="utf-8")
+    load_config(path)
+    assert b"bot_token" not in config_module._cache_path(path).read_bytes()
+
+    path.write_text("polymarket:\n  secret: yaml-secret\n", encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(path).polymarket.secret == "yaml-secret"
+    assert b"yaml-secret" not in config_module._cache_path(path).read_bytes()
+    assert load_config(path).polymarket.secret == "yaml-secret"
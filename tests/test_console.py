@@ -0,0 +1,67 @@
+import io
+import logging
+
+from predarb.console import BackgroundConsole
+
+
+def test_lines_written_in_order_after_flush():
+    out = io.StringIO()
+    console = BackgroundConsole(stream=out)
+    for i in range(100):
+        console.print(f"line {i}")
+    console.print()
+    console.flush()
+    assert out.getvalue() == "".join(f"line {i}\n" for i in range(100)) + "\n"
+
+
+def test_attach_logging_restores_handlers_on_close():
+    out = io.StringIO()
+    handler = logging.StreamHandler(out)
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    root.handlers = [handler]
+    try:
+        console = BackgroundConsole(stream=io.StringIO())
+        console.attach_logging()
+        assert root.handlers != [handler]
+        logging.getLogger("predarb.test").warning("queued record")
+        console.close()
+        assert root.handlers == [handler]
+        assert "queued record" in out.getvalue()
+    finally:
+        root.handlers = saved
+
+
+def test_print_args_are_interpolated_by_writer():
+    out = io.StringIO()
+    console = BackgroundConsole(stream=out)
+    console.print("ITERATION %d | %.1fh", 3, 1.25)
+    console.print("100% literal")
+    console.flush()
+    assert out.getvalue() == "ITERATION 3 | 1.2h\n100% literal\n"
+
+
+class _BrokenPipeStream:
+    def write(self, text):
+        raise BrokenPipeError()
+
+    def flush(self):
+        raise BrokenPipeError()
+
+
+def test_close_returns_when_stream_fails():
+    console = BackgroundConsole(stream=_BrokenPipeStream())
+    console.print("first")
+    console.print("second")
+    console.close(timeout=2.0)
+    assert console.flush(timeout=0) is True
+    assert console._thread.is_alive()
+
+
+def test_bad_format_args_are_written_raw():
+    out = io.StringIO()
+    console = BackgroundConsole(stream=out)
+    console.print("%d markets", "many")
+    console.print("after")
+    console.flush()
+    assert out.getvalue() == "%d markets ('many',)\nafter\n"
@@ -106,7 +106,7 @@ def test_two_leg_trade_flattens_exposure(markets):
     trades = broker.execute({m.id: m}, opp)
     assert len(trades) >= 2, "Expected two legs to execute"
 
-    pos_key = f"{m.id}:{m.outcomes[0].id}"
+    pos_key = (m.id, m.outcomes[0].id)
     assert broker.positions.get(pos_key, 0.0) == pytest.approx(0.0)
 
 
@@ -130,7 +130,7 @@ def test_failure_does_not_leave_unhedged_exposure(markets):
         ],
     )
     broker.execute({m.id: m}, opp)
-    pos_key = f"{m.id}:{m.outcomes[0].id}"
+    pos_key = (m.id, m.outcomes[0].id)
     # Desired: exposure flattened to 0.0
     assert broker.positions.get(pos_key, 0.0) == pytest.approx(0.0)
 
@@ -27,3 +27,44 @@ def test_engine_runs_once(markets, tmp_path):
     opps = engine.run_once()
     assert isinstance(opps, list)
     assert Path(cfg.engine.report_path).exists()
+
+
+class NamedFakeClient(FakeClient):
+    def get_exchange_name(self):
+        return "fake"
+
+
+def test_engine_keeps_market_lookup_for_last_iteration(markets, tmp_path):
+    cfg = AppConfig(
+        engine=EngineConfig(refresh_seconds=0.0, iterations=1, report_path=str(tmp_path / "report.csv")),
+    )
+    engine = Engine(cfg, NamedFakeClient(markets))
+    engine.run_once()
+    assert engine._last_markets_by_id == {m.id: m for m in engine._last_markets}
+
+
+class _WaitingClient(NamedFakeClient):
+    """Returns its markets only once the other client's fetch has started."""
+
+    def __init__(self, markets, started, other_started):
+        super().__init__(markets)
+        self._started = started
+        self._other_started = other_started
+
+    def fetch_markets(self):
+        self._started.set()
+        assert self._other_started.wait(timeout=5)
+        return self._markets
+
+
+def test_engine_fetches_clients_concurrently_in_order(markets, tmp_path):
+    import threading
+
+    cfg = AppConfig(
+        engine=EngineConfig(refresh_seconds=0.0, iterations=1, report_path=str(tmp_path / "report.csv")),
+    )
+    first_started, second_started = threading.Event(), threading.Event()
+    first = _WaitingClient(markets[:1], first_started, second_started)
+    second = _WaitingClient(markets[1:], second_started, first_started)
+    engine = Engine(cfg, clients=[first, second])
+    assert engine._fetch_all_markets() == markets
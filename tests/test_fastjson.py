@@ -0,0 +1,34 @@
+"""Tests for the orjson/stdlib JSON shim."""
+
+import json
+
+import pytest
+
+from predarb import fastjson
+
+
+def test_roundtrip_matches_stdlib():
+    obj = {"a": 1, "b": [1.5, "x", None], "c": {"d": True}}
+    data = fastjson.dumps(obj)
+    assert data.endswith(b"\n")
+    assert fastjson.loads(data) == obj
+    assert json.loads(data) == obj
+
+
+def test_indent_is_still_valid_json():
+    data = fastjson.dumps({"k": [1, 2]}, indent=True)
+    assert b"\n  " in data
+    assert json.loads(data) == {"k": [1, 2]}
+
+
+def test_decode_error_is_stdlib_compatible():
+    with pytest.raises(json.JSONDecodeError):
+        fastjson.loads(b"{not json")
+
+
+def test_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(fastjson, "orjson", None)
+    obj = {"name": "é", "n": 3}
+    data = fastjson.dumps(obj, indent=True)
+    assert fastjson.loads(data) == obj
+    assert data.endswith(b"\n")
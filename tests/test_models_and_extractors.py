@@ -32,3 +32,12 @@ def test_extract_threshold_and_entity():
 def test_extract_expiry():
     dt = extract_expiry("Dec 31 2025")
     assert dt.year == 2025
+
+
+def test_outcome_by_id_follows_replaced_outcomes():
+    market = Market(id="m", question="q", outcomes=[Outcome(id="y", label="Yes", price=0.4)])
+    assert market.outcome_by_id("y").price == 0.4
+    assert market.outcome_by_id("n") is None
+    market.outcomes = [Outcome(id="n", label="No", price=0.6)]
+    assert market.outcome_by_id("y") is None
+    assert market.outcome_by_id("n").price == 0.6
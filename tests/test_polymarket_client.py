@@ -68,3 +68,59 @@ def test_get_active_markets_error(mock_clob_client):
     markets = client.get_active_markets()
 
     assert len(markets) == 0
+
+def test_get_active_markets_cached_within_ttl(mock_clob_client):
+    instance = mock_clob_client.return_value
+    instance.get_markets.return_value = {
+        'data': [{'condition_id': 'c1', 'question': 'Q1',
+                  'tokens': [{'token_id': 't1', 'outcome': 'Yes', 'price': 0.5}]}]
+    }
+
+    client = ClobPolymarketClient(PolymarketConfig(cache_ttl_seconds=60))
+    first = client.get_active_markets()
+    second = client.get_active_markets()
+
+    assert second is first
+    assert instance.get_markets.call_count == 1
+    client.cache.clear()
+    client.get_active_markets()
+    assert instance.get_markets.call_count == 2
+
+
+class _PageResponse:
+    def __init__(self, status_code=200, body=b"[]", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def test_http2_client_retries_rate_limited_page(monkeypatch):
+    from src import polymarket_client
+    from src.polymarket_client import HttpPolymarketClient
+
+    session = MagicMock()
+    session.get.side_effect = [_PageResponse(429, headers={"Retry-After": "0"}), _PageResponse()]
+    client = HttpPolymarketClient(session=session, http2=False)
+    client._owns_session = True  # stands in for the httpx client
+    monkeypatch.setattr(polymarket_client.time, "sleep", lambda s: None)
+
+    assert client._fetch_events(0) == []
+    assert session.get.call_count == 2
+
+
+def test_partial_page_failure_is_not_cached():
+    from src.polymarket_client import HttpPolymarketClient
+
+    session = MagicMock()
+    session.get.side_effect = lambda url, params, timeout: (
+        _PageResponse(503) if params["offset"] else _PageResponse()
+    )
+    client = HttpPolymarketClient(session=session, max_pages=2, http2=False, cache_ttl_seconds=60)
+
+    client.get_active_markets()
+    client.get_active_markets()
+    assert session.get.call_count == 4
@@ -0,0 +1,190 @@
+import json
+
+from predarb import polymarket_client
+from predarb.config import PolymarketConfig
+from predarb.market_client_base import RealTimeDataSource
+from predarb.polymarket_client import PolymarketClient
+
+RAW_MARKET = {
+    "id": "m1",
+    "question": "Will it rain?",
+    "outcomes": '["Yes", "No"]',
+    "outcomePrices": '["0.4", "0.6"]',
+    "clobTokenIds": '["y", "n"]',
+    "liquidityNum": 1000,
+}
+
+
+class _Response:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return json.dumps([RAW_MARKET]).encode()
+
+
+class _CountingSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append(url)
+        return _Response()
+
+
+def test_fetch_markets_uncached_by_default():
+    session = _CountingSession()
+    client = PolymarketClient(PolymarketConfig(host="https://example.test"), session=session)
+    client.fetch_markets()
+    client.fetch_markets()
+    assert len(session.calls) == 2
+
+
+def test_fetch_markets_served_from_cache_within_ttl():
+    session = _CountingSession()
+    client = PolymarketClient(PolymarketConfig(host="https://example.test", markets_ttl_seconds=60), session=session)
+    first = client.fetch_markets()
+    second = client.fetch_markets()
+    assert len(session.calls) == 1
+    assert [m.id for m in first] == [m.id for m in second] == ["m1"]
+    assert client.get_cache_stats()["hits"] == 1
+    assert client.get_cache_stats()["misses"] == 1
+
+
+def test_fetch_markets_refetches_after_ttl(monkeypatch):
+    session = _CountingSession()
+    clock = [100.0]
+    monkeypatch.setattr(polymarket_client.time, "monotonic", lambda: clock[0])
+    client = PolymarketClient(PolymarketConfig(host="https://example.test", markets_ttl_seconds=5), session=session)
+    client.fetch_markets()
+    clock[0] += 6
+    client.fetch_markets()
+    assert len(session.calls) == 2
+
+
+def test_default_session_keeps_a_connection_pool():
+    client = PolymarketClient(PolymarketConfig())
+    adapter = client.session.get_adapter("https://gamma-api.polymarket.com")
+    assert adapter._pool_maxsize == 10
+
+
+class _EtagSession:
+    """Serves an ETag and answers 304 when the client revalidates with it."""
+
+    def __init__(self):
+        self.request_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.request_headers.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return _Response(status_code=304)
+        return _Response(headers={"ETag": '"v1"'})
+
+
+def test_fetch_markets_revalidates_with_etag():
+    session = _EtagSession()
+    client = PolymarketClient(PolymarketConfig(host="https://example.test"), session=session)
+    first = client.fetch_markets()
+    second = client.fetch_markets()
+    assert session.request_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert [m.id for m in second] == [m.id for m in first] == ["m1"]
+
+
+def test_client_is_marked_as_real_time_source():
+    client = PolymarketClient(PolymarketConfig(), session=_CountingSession())
+    assert isinstance(client, RealTimeDataSource)
+
+
+class _ThrottledSession:
+    def get(self, url, params=None, headers=None, timeout=None):
+        return _Response(status_code=429)
+
+
+def test_rate_limited_response_slows_the_bucket():
+    client = PolymarketClient(
+        PolymarketConfig(host="https://example.test", rps_limit=4.0), session=_ThrottledSession()
+    )
+    client.fetch_markets()
+    assert client._bucket.rate == 2.0
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def test_shared_cache_lets_second_client_skip_the_fetch():
+    shared = _FakeRedis()
+    config = PolymarketConfig(host="https://example.test", markets_ttl_seconds=60)
+    first_session, second_session = _CountingSession(), _CountingSession()
+    first = PolymarketClient(config, session=first_session)
+    second = PolymarketClient(config, session=second_session)
+    first._redis = second._redis = shared
+    first.fetch_markets()
+    markets = second.fetch_markets()
+    assert len(first_session.calls) == 1
+    assert second_session.calls == []
+    assert [m.id for m in markets] == ["m1"]
+    assert second.get_cache_stats()["shared_hits"] == 1
+
+
+def test_shared_entry_expires_with_its_original_fetch(monkeypatch):
+    shared = _FakeRedis()
+    config = PolymarketConfig(host="https://example.test", markets_ttl_seconds=10)
+    wall, mono = [1000.0], [50.0]
+    monkeypatch.setattr(polymarket_client.time, "time", lambda: wall[0])
+    monkeypatch.setattr(polymarket_client.time, "monotonic", lambda: mono[0])
+    first = PolymarketClient(config, session=_CountingSession())
+    first._redis = shared
+    first.fetch_markets()
+
+    # Another process picks the entry up 8s after it was fetched
+    wall[0] += 8
+    second_session = _CountingSession()
+    second = PolymarketClient(config, session=second_session)
+    second._redis = shared
+    second.fetch_markets()
+    assert second_session.calls == []
+
+    # 3s later the data is 11s old: refetch instead of serving from L1
+    wall[0] += 3
+    mono[0] += 3
+    second.fetch_markets()
+    assert len(second_session.calls) == 1
+
+
+def test_corrupt_shared_entry_is_a_miss():
+    shared = _FakeRedis()
+    config = PolymarketConfig(host="https://example.test", markets_ttl_seconds=60)
+    session = _CountingSession()
+    client = PolymarketClient(config, session=session)
+    client._redis = shared
+    shared.store[client._shared_key("https://example.test/markets", {
+        "closed": "false", "limit": PolymarketClient.MARKETS_PAGE_LIMIT, "order": "updated_at:desc",
+    })] = b"12.0\n[{truncated"
+    assert [m.id for m in client.fetch_markets()] == ["m1"]
+    assert len(session.calls) == 1
+    assert client.get_cache_stats()["shared_hits"] == 0
+
+
+def test_not_modified_response_refreshes_shared_entry():
+    shared = _FakeRedis()
+    session = _EtagSession()
+    client = PolymarketClient(PolymarketConfig(host="https://example.test", markets_ttl_seconds=60), session=session)
+    client._redis = shared
+    client._fetch_markets("https://example.test/markets", {})
+    shared.store.clear()
+    client._fetch_markets("https://example.test/markets", {})
+    assert session.request_headers[-1] == {"If-None-Match": '"v1"'}
+    assert len(shared.store) == 1
@@ -0,0 +1,49 @@
+from predarb.ratelimit import TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _bucket(clock, rate=2.0, capacity=2.0, **kwargs):
+    return TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_burst_passes_without_waiting():
+    clock = _Clock()
+    bucket = _bucket(clock)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.contended == 0
+
+
+def test_acquire_waits_once_burst_is_spent():
+    clock = _Clock()
+    bucket = _bucket(clock)
+    bucket.acquire()
+    bucket.acquire()
+    assert bucket.acquire() == 0.5
+    assert bucket.contended == 1
+    assert clock.slept == [0.5]
+
+
+def test_penalize_halves_rate_down_to_floor_and_reward_recovers():
+    clock = _Clock()
+    bucket = _bucket(clock, rate=4.0, floor=1.0)
+    bucket.penalize()
+    assert bucket.rate == 2.0
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 1.0
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == 4.0
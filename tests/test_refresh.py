@@ -0,0 +1,23 @@
+from predarb.config import EngineConfig
+from predarb.refresh import AdaptiveRefresh
+
+
+def test_fixed_interval_when_adaptive_disabled():
+    refresher = AdaptiveRefresh.from_config(EngineConfig(refresh_seconds=5.0))
+    assert refresher.update(0) == 5.0
+    assert refresher.update(50) == 5.0
+
+
+def test_quiet_iterations_back_off_to_maximum():
+    refresher = AdaptiveRefresh(initial=5.0, minimum=1.0, maximum=8.0)
+    intervals = [refresher.update(0) for _ in range(20)]
+    assert intervals[0] > 5.0
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 8.0
+
+
+def test_busy_iterations_speed_up_to_minimum():
+    refresher = AdaptiveRefresh(initial=5.0, minimum=1.0, maximum=8.0)
+    intervals = [refresher.update(10) for _ in range(30)]
+    assert intervals[0] < 5.0
+    assert intervals[-1] == 1.0
@@ -242,7 +242,7 @@ def test_reporter_state_file_format(temp_reports_dir):
     assert "market_ids_hash" in state
     assert "approved_opp_ids_hash" in state
     assert "last_updated" in state
-    assert len(state["market_ids_hash"]) == 64  # SHA256 hex digest
+    assert len(state["market_ids_hash"]) == 16  # 64-bit BLAKE2b hex digest
 
 
 def test_reporter_hash_order_independent(temp_reports_dir):
@@ -337,3 +337,33 @@ def test_reporter_csv_multiple_iterations(temp_reports_dir):
     assert [int(c1[2]), int(c1[3]), int(c1[5]), int(c1[7])] == [1, 2, 1, 1]
     assert [int(c2[2]), int(c2[3]), int(c2[5]), int(c2[7])] == [2, 3, 2, 2]
     assert [int(c3[2]), int(c3[3]), int(c3[5]), int(c3[7])] == [4, 3, 1, 1]
+
+
+def test_reporter_batches_csv_flushes(temp_reports_dir):
+    """Test rows are buffered until flush_every is reached or close() is called."""
+    reporter = LiveReporter(temp_reports_dir, flush_every=3)
+    
+    for i in range(1, 3):
+        reporter.report(
+            iteration=i,
+            all_markets=[create_market(f"m{j}") for j in range(i)],
+            detected_opportunities=[],
+            approved_opportunities=[],
+        )
+    assert reporter.summary_csv.read_text() == ""
+    
+    reporter.close()
+    lines = reporter.summary_csv.read_text().strip().split("\n")
+    assert len(lines) == 4
+    assert not reporter.state_file.with_suffix(".tmp").exists()
+    
+    # Reporting after close reopens the file and keeps appending
+    reporter.report(
+        iteration=3,
+        all_markets=[create_market("m9")],
+        detected_opportunities=[],
+        approved_opportunities=[],
+    )
+    reporter.close()
+    lines = reporter.summary_csv.read_text().strip().split("\n")
+    assert len(lines) == 5
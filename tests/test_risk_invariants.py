@@ -157,7 +157,7 @@ class TestExposureLimits:
         for key, qty in broker_state.positions.items():
             if qty == 0:
                 continue
-            mid, oid = key.split(":")
+            mid, oid = key
             market = market_lookup.get(mid)
             if not market:
                 continue
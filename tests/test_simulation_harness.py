@@ -1,6 +1,7 @@
 """Tests for simulation harness (notifiers, fake client, synthetic data)."""
 
 import pytest
+from unittest import mock
 from datetime import datetime, timedelta
 
 from predarb.notifiers import Notifier
@@ -141,6 +142,16 @@ class TestTelegramNotifierReal:
         assert notifier.bot_token == "test_token"
         assert notifier.chat_id == "test_chat"
 
+    def test_real_notifier_batches_queued_messages(self):
+        """Test queued messages are combined into one background post."""
+        notifier = TelegramNotifierReal(bot_token="test_token", chat_id="test_chat", batch_delay=0.05)
+        with mock.patch("predarb.notifiers.telegram.requests.post") as post:
+            for i in range(3):
+                notifier.send(f"message {i}")
+            notifier.flush()
+        post.assert_called_once()
+        assert post.call_args.kwargs["json"]["text"] == "message 0\n\nmessage 1\n\nmessage 2"
+
     def test_real_notifier_compatibility_methods(self):
         """Test TelegramNotifierReal has compatibility methods."""
         notifier = TelegramNotifierReal(bot_token="test_token", chat_id="test_chat")
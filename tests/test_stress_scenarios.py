@@ -126,6 +126,16 @@ def test_get_scenario_invalid_name():
         get_scenario("nonexistent_scenario")
 
 
+def test_high_volume_limit_builds_leading_markets_only():
+    """Test fetch_markets(limit) matches the head of the full scenario."""
+    full = get_scenario("high_volume", seed=5).get_active_markets()
+    limited = get_scenario("high_volume", seed=5).fetch_markets(limit=995)
+    
+    assert len(limited) == 995
+    assert [m.id for m in limited] == [m.id for m in full[:995]]
+    assert [m.outcomes[0].price for m in limited] == [m.outcomes[0].price for m in full[:995]]
+
+
 def test_scenario_seeded_reproducibility():
     """Test that scenarios with same seed produce same results."""
     scenario1 = get_scenario("happy_path", seed=777)
@@ -201,6 +201,12 @@ class TestCommandParser:
             raw_text="/set_limit max_inventory 50000.50"
         )
         assert cmd.get_arg_float(1) == 50000.50
+    
+    def test_parsed_command_immutable(self):
+        """ParsedCommand should not be mutable after parsing."""
+        cmd = CommandParser.parse("/status")
+        with pytest.raises(AttributeError):
+            cmd.command = "stop"
 
 
 # ========== AUTHORIZATION TESTS ==========
@@ -340,6 +346,19 @@ class TestRateLimiter:
         is_allowed, _ = rate_limiter.is_allowed("forceclose", "user2")
         assert is_allowed is True
     
+    def test_zero_limit_blocks_command(self):
+        """A zero limit should deny the command rather than allow it."""
+        limiter = RateLimiter(high_risk_rate=0)
+        limiter.is_allowed("status", "user1")
+        is_allowed, msg = limiter.is_allowed("forceclose", "user1")
+        assert is_allowed is False
+        assert msg is not None
+    
+    def test_risk_levels_are_ordered_ints(self):
+        """Risk levels should compare as plain integers."""
+        assert CommandRisk.LOW < CommandRisk.MEDIUM < CommandRisk.HIGH
+        assert CommandRisk.HIGH == 2
+    
     def test_stats(self, rate_limiter):
         """Get rate limiter stats."""
         rate_limiter.is_allowed("status", "user1")
@@ -533,6 +552,15 @@ class TestNotifier:
         result = await notifier.notify("startup", "Test message", force=True)
         assert result is True
     
+    async def test_reload_settings_updates_snapshot(self, notifier):
+        """Enabled categories should only change after reload_settings."""
+        notifier.settings.startup = NotificationLevel.OFF
+        assert await notifier.notify("startup", "Before reload") is True
+        
+        notifier.reload_settings()
+        assert await notifier.notify("startup", "After reload") is False
+        assert await notifier.notify("custom_category", "Default ON") is True
+    
     async def test_notifier_stats(self, notifier):
         """Get notifier stats."""
         await notifier.notify("startup", "Message 1")
@@ -816,6 +844,27 @@ class TestIntegration:
         
         assert "✅" in response2 or "confirmed" in response2.lower()
 
+    
+    async def test_reload_config_updates_authorized_users(self, tmp_path):
+        """Reload swaps in new authorized users and keeps the config on failure."""
+        from arbitrage_bot.main import TelegramControlledArbitrageBot
+        
+        config_path = tmp_path / "telegram_config.json"
+        config_path.write_text('{"enabled": false, "authorized_users": ["user1"]}')
+        bot = TelegramControlledArbitrageBot(telegram_config_path=str(config_path))
+        assert bot.handlers.auth_gate.is_authorized("user1")
+        
+        config_path.write_text('{"enabled": false, "authorized_users": ["user2"]}')
+        await bot._on_reload_config({})
+        assert not bot.handlers.auth_gate.is_authorized("user1")
+        assert bot.handlers.auth_gate.is_authorized("user2")
+        
+        config_path.write_text("{not json")
+        config = bot.config
+        await bot._on_reload_config({})
+        assert bot.config is config
+        assert bot.handlers.auth_gate.is_authorized("user2")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
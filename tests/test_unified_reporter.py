@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from predarb.models import Market, Opportunity, Outcome, Trade, TradeAction
-from predarb.unified_reporter import UnifiedReporter
+from predarb.unified_reporter import UnifiedReporter, load_latest_opportunities
 
 
 @pytest.fixture
@@ -231,6 +231,74 @@ class TestReportIteration:
         assert iter2["opportunities_detected"]["delta"] == -1
         assert iter2["opportunities_approved"]["delta"] == -1
 
+    def test_latest_detected_opportunities_roundtrip(self, temp_reports_dir):
+        """Test the last recorded iteration's detected opportunities can be reloaded."""
+        reporter = UnifiedReporter(temp_reports_dir, save_detected_opportunities=True)
+        assert load_latest_opportunities(reporter.opportunities_file) is None
+        
+        markets = [create_market("m1"), create_market("m2")]
+        reporter.report_iteration(1, markets, [create_opportunity("o1", "m1")], [])
+        detected = [create_opportunity("o1", "m1"), create_opportunity("o2", "m2")]
+        reporter.report_iteration(2, markets, detected, detected)
+        
+        loaded = load_latest_opportunities(reporter.opportunities_file, ["m2", "m1"])
+        assert [o.market_ids for o in loaded] == [["m1"], ["m2"]]
+        assert loaded[1].actions[0] == detected[1].actions[0]
+        assert loaded[1].net_edge == detected[1].net_edge
+        # Recorded against another market set: not reused
+        assert load_latest_opportunities(reporter.opportunities_file, ["m1", "m3"]) is None
+    
+    def test_detected_opportunities_not_saved_by_default(self, temp_reports_dir):
+        """Test the detected-opportunities snapshot is opt-in."""
+        reporter = UnifiedReporter(temp_reports_dir)
+        reporter.report_iteration(1, [create_market("m1")], [create_opportunity("o1", "m1")], [])
+        assert not reporter.opportunities_file.exists()
+
+    def test_appends_unsnapshotted_iterations_to_jsonl_log(self, temp_reports_dir):
+        """Test iterations held back by snapshot_interval are logged one per line."""
+        reporter = UnifiedReporter(temp_reports_dir, snapshot_interval=3600)
+        opps = [create_opportunity("o1", "m1")]
+        
+        reporter.report_iteration(1, [create_market("m1")], opps, opps)  # snapshotted
+        reporter.report_iteration(2, [create_market("m2")], opps, opps)
+        reporter.report_iteration(3, [create_market("m2")], opps, opps)  # unchanged
+        reporter.report_iteration(4, [create_market("m3")], opps, opps)
+        
+        lines = reporter.iterations_log.read_text().splitlines()
+        assert [json.loads(line)["iteration"] for line in lines] == [2, 4]
+
+    def test_snapshot_interval_defers_rewrite_until_flush(self, temp_reports_dir):
+        """Test the JSON document is rewritten at most once per interval."""
+        reporter = UnifiedReporter(temp_reports_dir, snapshot_interval=3600)
+        opps = [create_opportunity("o1", "m1")]
+        
+        reporter.report_iteration(1, [create_market("m1")], opps, opps)
+        reporter.report_iteration(2, [create_market("m2")], opps, opps)
+        
+        with open(reporter.report_file) as f:
+            assert len(json.load(f)["iterations"]) == 1
+        assert len(reporter.iterations_log.read_text().splitlines()) == 1
+        
+        reporter.flush()
+        with open(reporter.report_file) as f:
+            assert len(json.load(f)["iterations"]) == 2
+        assert not reporter.iterations_log.exists()
+
+    def test_startup_recovers_unsnapshotted_iterations(self, temp_reports_dir):
+        """Test a new reporter folds the JSONL log back in after a lost flush."""
+        reporter = UnifiedReporter(temp_reports_dir, snapshot_interval=3600)
+        opps = [create_opportunity("o1", "m1")]
+        reporter.report_iteration(1, [create_market("m1")], opps, opps)
+        reporter.report_iteration(2, [create_market("m2")], opps, opps)
+        # No flush: simulate a crash, then restart
+        
+        restarted = UnifiedReporter(temp_reports_dir)
+        assert [it["iteration"] for it in restarted.report_data["iterations"]] == [1, 2]
+        with open(restarted.report_file) as f:
+            assert [it["iteration"] for it in json.load(f)["iterations"]] == [1, 2]
+        assert not restarted.iterations_log.exists()
+        assert restarted.compact() == 0
+
 
 class TestLogOpportunityExecution:
     """Tests for log_opportunity_execution method."""
@@ -443,6 +511,13 @@ class TestStateManagement:
         
         assert hash1 == hash2
 
+    def test_hash_separates_items(self, temp_reports_dir):
+        """Test item boundaries are part of the digest."""
+        reporter = UnifiedReporter(temp_reports_dir)
+        
+        assert reporter._compute_hash(["a|b"]) != reporter._compute_hash(["a", "b"])
+        assert len(reporter._compute_hash(["m1"])) == 16
+
     def test_hash_order_independent(self, temp_reports_dir):
         """Test hash is order-independent (sorted internally)."""
         reporter = UnifiedReporter(temp_reports_dir)